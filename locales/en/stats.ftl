@@ -5,10 +5,27 @@ stats_overview =
     Referred: { $referred } ({ $referred_pct }%)
     Organic: { $organic } ({ $organic_pct }%)
 
+stats_estimated_note = ≈ Estimated from table statistics
+
 stats_top_inviters_btn = 🏆 Top inviters
 check_alive_btn = 🫀 Check alive
 
 stats_top_inviters_header = 🏆 Top { $limit } inviters:
+stats_top_inviters_page_header = 🏆 Inviters { $first }–{ $last }:
+stats_prev_btn = ◀️ Previous
+stats_next_btn = Next ▶️
+stats_back_btn = ↩️ Back
+
+stats_period_day_btn = 📅 24h
+stats_period_week_btn = 📅 7 days
+stats_period_month_btn = 📅 30 days
+
+stats_period_day_header = 📅 Last 24 hours
+stats_period_week_header = 📅 Last 7 days
+stats_period_month_header = 📅 Last 30 days
+
+stats_period_referrals = Referrals: { $count }
+stats_period_top_header = Top inviters:
 
 stats_no_inviters = No inviters yet
 
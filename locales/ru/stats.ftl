@@ -5,10 +5,27 @@ stats_overview =
     По рефералам: { $referred } ({ $referred_pct }%)
     Органика: { $organic } ({ $organic_pct }%)
 
+stats_estimated_note = ≈ Приблизительно, по статистике таблицы
+
 stats_top_inviters_btn = 🏆 Топ инвайтеров
 check_alive_btn = 🫀 Живые юзеры
 
 stats_top_inviters_header = 🏆 Топ-{ $limit } инвайтеров:
+stats_top_inviters_page_header = 🏆 Инвайтеры { $first }–{ $last }:
+stats_prev_btn = ◀️ Назад
+stats_next_btn = Вперёд ▶️
+stats_back_btn = ↩️ К статистике
+
+stats_period_day_btn = 📅 24 ч
+stats_period_week_btn = 📅 7 дней
+stats_period_month_btn = 📅 30 дней
+
+stats_period_day_header = 📅 За последние 24 часа
+stats_period_week_header = 📅 За последние 7 дней
+stats_period_month_header = 📅 За последние 30 дней
+
+stats_period_referrals = Рефералов: { $count }
+stats_period_top_header = Топ инвайтеров:
 
 stats_no_inviters = Пока нет инвайтеров
 
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Micro-benchmark referral code encoding and decoding.
+
+Compares the per-call ``encode_referral``/``decode_referral`` functions,
+which derive the key from the secret every time, with a shared
+``ReferralCodec`` one code at a time and in batches (e.g. a bulk export of
+referral links). No database needed.
+
+    uv run python -m scripts.bench_referral_codec --codes 100000
+"""
+
+import argparse
+import random
+import time
+from collections.abc import Callable
+
+from src.domain.user.services.referral import (
+    ReferralCodec,
+    decode_referral,
+    encode_referral,
+)
+
+SECRET_KEY = "bench-secret-key"  # noqa: S105
+
+
+def measure(name: str, codes: int, run: Callable[[], object]) -> float:
+    started = time.perf_counter()
+    run()
+    per_code = (time.perf_counter() - started) / codes
+    print(f"{name:<16} {per_code * 1e9:>8.1f} ns/code")
+    return per_code
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--codes", type=int, default=100_000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    user_ids = [rng.randrange(1, 10**10) for _ in range(args.codes)]
+    codec = ReferralCodec(SECRET_KEY)
+    codes = codec.encode_many(user_ids)
+    assert codec.decode_many(codes) == user_ids
+
+    print("encode")
+    per_call = measure(
+        "  per call",
+        args.codes,
+        lambda: [encode_referral(user_id, SECRET_KEY) for user_id in user_ids],
+    )
+    shared = measure(
+        "  codec",
+        args.codes,
+        lambda: [codec.encode(user_id) for user_id in user_ids],
+    )
+    batch = measure("  codec batch", args.codes, lambda: codec.encode_many(user_ids))
+    print(
+        f"  speedup          {per_call / shared:>8.1f}x codec, "
+        f"{per_call / batch:.1f}x batch"
+    )
+
+    print("decode")
+    per_call = measure(
+        "  per call",
+        args.codes,
+        lambda: [decode_referral(code, SECRET_KEY) for code in codes],
+    )
+    shared = measure(
+        "  codec",
+        args.codes,
+        lambda: [codec.decode(code) for code in codes],
+    )
+    batch = measure("  codec batch", args.codes, lambda: codec.decode_many(codes))
+    print(
+        f"  speedup          {per_call / shared:>8.1f}x codec, "
+        f"{per_call / batch:.1f}x batch"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Memory benchmark for slotted entities and DTOs.
+
+Holds ``--count`` User entities and CreateUserOutputDTOs in memory and
+reports the per-object footprint next to an equivalent ``__dict__``-based
+dataclass (the layout before slots). Field values are shared between
+objects, so the numbers are the cost of the objects themselves.
+
+    uv run python -m scripts.bench_user_memory --count 1000000
+"""
+
+import argparse
+import tracemalloc
+from dataclasses import MISSING, field, fields, make_dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+from src.application.user.dtos import CreateUserOutputDTO
+from src.domain.user import User
+from src.domain.user.vo import FirstName, LanguageCode, ReferralCount, UserId
+
+
+def without_slots(cls: type) -> type:
+    """Rebuild a dataclass with the same fields but a regular __dict__."""
+    return make_dataclass(
+        f"Dict{cls.__name__}",
+        [
+            (f.name, f.type)
+            if f.default is MISSING
+            else (f.name, f.type, field(default=f.default))
+            for f in fields(cls)
+        ],
+    )
+
+
+def per_object(count: int, make: Any) -> float:  # noqa: ANN401
+    tracemalloc.start()
+    objects = [make() for _ in range(count)]
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # The list itself holds one pointer per object.
+    return allocated / len(objects) - 8
+
+
+def report(name: str, count: int, cls: type, kwargs: dict[str, Any]) -> None:
+    dict_cls = without_slots(cls)
+    before = per_object(count, lambda: dict_cls(**kwargs))
+    after = per_object(count, lambda: cls(**kwargs))
+    print(
+        f"{name:<22} __dict__ {before:>6.0f} B   slots {after:>6.0f} B"
+        f"   saved {(before - after) * count / 2**20:>7.1f} MiB per {count}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    now = datetime.now(UTC)
+    report(
+        "User",
+        args.count,
+        User,
+        {
+            "id": UserId(123456789),
+            "first_name": FirstName("John"),
+            "last_name": None,
+            "username": None,
+            "bio": None,
+            "created_at": now,
+            "updated_at": now,
+            "last_login_at": now,
+            "referral_count": ReferralCount(0),
+            "language_code": LanguageCode("en"),
+        },
+    )
+    report(
+        "CreateUserOutputDTO",
+        args.count,
+        CreateUserOutputDTO,
+        {
+            "id": 123456789,
+            "username": None,
+            "first_name": "John",
+            "last_name": None,
+            "language_code": "en",
+        },
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""Benchmark the ORM and raw asyncpg user repositories against each other.
+
+Runs get_user, upsert_user and update_language on the database from the
+given config file. Benchmark users are created in a reserved id range and
+removed afterwards, along with their share of the user counters.
+
+    uv run python -m scripts.bench_user_repository --config config.yaml
+"""
+
+import argparse
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.domain.user import User
+from src.domain.user.vo import FirstName, LanguageCode, UserId, Username
+from src.infrastructure.config import load_config
+from src.infrastructure.db.factory import create_engine, create_session_maker
+from src.infrastructure.db.models.counter import TOTAL_USERS_COUNTER, UserCounterModel
+from src.infrastructure.db.models.user import UserModel
+from src.infrastructure.db.repos import AsyncpgUserRepository, UserRepositoryImpl
+from src.infrastructure.db.transaction import TransactionManagerImpl
+
+FIRST_ID = 9_000_000_000
+
+
+def make_user(user_id: int) -> User:
+    now = datetime.now(UTC)
+    return User(
+        id=UserId(user_id),
+        first_name=FirstName("Bench"),
+        last_name=None,
+        username=Username(f"bench{user_id}"),
+        bio=None,
+        created_at=now,
+        updated_at=now,
+        last_login_at=now,
+    )
+
+
+async def measure(
+    name: str,
+    iterations: int,
+    operation: Callable[[int], Awaitable[object]],
+) -> None:
+    started = time.perf_counter()
+    for i in range(iterations):
+        await operation(i)
+    elapsed = time.perf_counter() - started
+    print(
+        f"{name:<40} {iterations / elapsed:>10.0f} ops/s"
+        f" {elapsed / iterations * 1e6:>10.1f} us/op"
+    )
+
+
+async def bench(
+    session_maker: async_sessionmaker[AsyncSession],
+    repository_cls: type[UserRepositoryImpl],
+    users: int,
+    iterations: int,
+) -> None:
+    label = repository_cls.__name__
+    async with session_maker() as session:
+        repository = repository_cls(session)
+        transaction_manager = TransactionManagerImpl(session)
+
+        async def upsert(i: int) -> None:
+            await repository.upsert_user(make_user(FIRST_ID + i % users))
+            await transaction_manager.commit()
+
+        async def get_user(i: int) -> None:
+            await repository.get_user(UserId(FIRST_ID + i % users))
+
+        async def update_language(i: int) -> None:
+            code = LanguageCode("ru" if i % 2 else "en")
+            await repository.update_language(UserId(FIRST_ID + i % users), code)
+            await transaction_manager.commit()
+
+        await measure(f"{label}.upsert_user", iterations, upsert)
+        await measure(f"{label}.get_user", iterations, get_user)
+        await measure(f"{label}.update_language", iterations, update_language)
+
+
+async def seed(session_maker: async_sessionmaker[AsyncSession], users: int) -> None:
+    async with session_maker() as session:
+        repository = UserRepositoryImpl(session)
+        for i in range(users):
+            await repository.upsert_user(make_user(FIRST_ID + i))
+        await session.commit()
+
+
+async def cleanup(session_maker: async_sessionmaker[AsyncSession]) -> None:
+    async with session_maker() as session:
+        removed = (
+            delete(UserModel)
+            .where(UserModel.id >= FIRST_ID)
+            .returning(UserModel.id)
+            .cte("removed")
+        )
+        deleted = await session.scalar(select(func.count()).select_from(removed))
+        if deleted:
+            # Seeding went through upsert_user, which counted every user.
+            stmt = insert(UserCounterModel).values(
+                name=TOTAL_USERS_COUNTER, shard=0, value=-deleted
+            )
+            await session.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=[UserCounterModel.name, UserCounterModel.shard],
+                    set_={"value": UserCounterModel.value + stmt.excluded.value},
+                )
+            )
+        await session.commit()
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--config", default="config.yaml")
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--iterations", type=int, default=5000)
+    args = parser.parse_args()
+
+    config = load_config(args.config)
+    engine = create_engine(config.postgres)
+    session_maker = create_session_maker(engine)
+    try:
+        # Both implementations then measure updates of existing rows.
+        await seed(session_maker, args.users)
+        for repository_cls in (UserRepositoryImpl, AsyncpgUserRepository):
+            await bench(session_maker, repository_cls, args.users, args.iterations)
+    finally:
+        await cleanup(session_maker)
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
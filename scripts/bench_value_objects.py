@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Micro-benchmark validated vs trusted value object construction.
+
+Builds the value objects of one user row per iteration, the way result
+processing does when loading users (e.g. top referrers or admin queries),
+once through the validating constructors and once through ``trusted()``.
+Also reports memory allocated per row, which interned value objects
+(LanguageCode, small ReferralCount values) keep down. No database needed.
+
+    uv run python -m scripts.bench_value_objects --rows 100000
+"""
+
+import argparse
+import time
+import tracemalloc
+from collections.abc import Callable
+
+from src.domain.user.vo import (
+    Bio,
+    FirstName,
+    LanguageCode,
+    LastName,
+    ReferralCount,
+    UserId,
+    Username,
+)
+
+# (value object class, raw database value) for every value-object column.
+ROW = [
+    (UserId, 123456789),
+    (FirstName, "John"),
+    (LastName, "Doe"),
+    (Username, "johndoe"),
+    (Bio, "Hello there"),
+    (UserId, 987654321),
+    (ReferralCount, 7),
+    (LanguageCode, "en"),
+]
+
+
+def validated_row() -> None:
+    for vo_class, value in ROW:
+        vo_class(value)
+
+
+def trusted_row() -> None:
+    for vo_class, value in ROW:
+        vo_class.trusted(value)
+
+
+def measure(name: str, rows: int, load_row: Callable[[], None]) -> float:
+    started = time.perf_counter()
+    for _ in range(rows):
+        load_row()
+    per_row = (time.perf_counter() - started) / rows
+    print(f"{name:<12} {per_row * 1e6:>8.2f} us/row")
+    return per_row
+
+
+def measure_allocations(rows: int, load_row: Callable[[], list[object]]) -> None:
+    # Keep the rows alive so every allocation is still counted at the end.
+    tracemalloc.start()
+    loaded = [load_row() for _ in range(rows)]
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"allocated    {allocated / len(loaded):>8.1f} B/row")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    args = parser.parse_args()
+
+    validated = measure("validated", args.rows, validated_row)
+    trusted = measure("trusted", args.rows, trusted_row)
+    saved = validated - trusted
+    print(f"saved        {saved * 1e6:>8.2f} us/row ({saved / validated:.0%})")
+    print(f"per {args.rows} rows  {saved * args.rows * 1e3:>8.1f} ms")
+    measure_allocations(
+        args.rows, lambda: [vo_class.trusted(value) for vo_class, value in ROW]
+    )
+
+
+if __name__ == "__main__":
+    main()
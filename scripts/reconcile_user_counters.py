@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""Recount users and overwrite the maintained user counters.
+
+Counters are kept in the same transaction as every user write, so drift
+only comes from writes made outside the application (manual SQL, old
+releases during a rollout). Run it periodically, e.g. from cron:
+
+    uv run python -m scripts.reconcile_user_counters --config config.yaml
+"""
+
+import argparse
+import asyncio
+import logging
+
+from dishka import make_async_container
+
+from src.application.referral.stats import ReconcileStatsInteractor
+from src.infrastructure.config import Config, load_config
+from src.infrastructure.di import infra_providers, interactor_providers
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--config", default="config.yaml")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    container = make_async_container(
+        *infra_providers,
+        *interactor_providers,
+        context={Config: load_config(args.config)},
+    )
+    try:
+        async with container() as request_container:
+            interactor = await request_container.get(ReconcileStatsInteractor)
+            drift = await interactor()
+    finally:
+        await container.close()
+
+    print(
+        f"users={drift.stats.total_users} ({drift.total_users:+d})"
+        f" referred={drift.stats.referred_count} ({drift.referred_count:+d})"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
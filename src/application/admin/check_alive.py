@@ -1,7 +1,10 @@
 import asyncio
 import logging
-from collections.abc import AsyncGenerator
-from dataclasses import dataclass
+import time
+from collections import deque
+from collections.abc import AsyncGenerator, AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass, replace
+from datetime import UTC, datetime
 
 from aiogram import Bot
 from aiogram.enums import ChatAction
@@ -11,46 +14,111 @@ from aiogram.exceptions import (
     TelegramRetryAfter,
 )
 
-from src.domain.admin import AdminRepository
+from src.application.common.aimd import AimdLimiter
+from src.application.common.transaction import TransactionManager
+from src.domain.admin import AdminRepository, AliveStatus
 
 logger = logging.getLogger(__name__)
 
-BATCH_SIZE = 20
 PROGRESS_INTERVAL = 100
+# User ids read from the database at a time.
+CHUNK_SIZE = 1000
+# Bounds of the adaptive number of checks in flight. The limit starts low
+# and grows until Telegram answers slowly or with a flood wait.
+INITIAL_CONCURRENCY = 5
+MAX_CONCURRENCY = 50
+# Slower answers are treated as the start of throttling.
+LATENCY_TARGET_SECONDS = 1.0
+# Checks of a user hitting a flood wait before giving up on them.
+MAX_ATTEMPTS = 3
+# Outcomes written to the users table per UPDATE and commit.
+SAVE_BATCH_SIZE = 500
 
 
-@dataclass
+@dataclass(slots=True)
 class CheckAliveResult:
     total: int = 0
     alive: int = 0
     blocked: int = 0
     deleted: int = 0
-    rate_limited: int = 0
     other_errors: int = 0
+    # Classified above after one or more flood waits.
+    retried: int = 0
+    # Still rate limited after MAX_ATTEMPTS checks, so not classified.
+    gave_up: int = 0
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CheckAliveProgress:
     processed: int
     total: int
     current_result: CheckAliveResult
+    # Users checked per second since the start.
+    throughput: float = 0.0
+    # Current limit of checks in flight.
+    concurrency: int = 0
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CheckAliveInput:
     active_since_days: int | None = None
+    # Skip users whose status was recorded within the last N days.
+    skip_checked_within_days: int | None = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class UserCheckResult:
     user_id: int
     success: bool
     error_type: str | None = None
+    # Flood wait requested by Telegram, in seconds.
+    retry_after: int | None = None
+    attempts: int = 1
+
+
+def _tally(result: CheckAliveResult, check_result: UserCheckResult) -> None:
+    if check_result.success:
+        result.alive += 1
+    elif check_result.error_type == "blocked":
+        result.blocked += 1
+    elif check_result.error_type == "deleted":
+        result.deleted += 1
+    elif check_result.error_type == "rate_limited":
+        result.gave_up += 1
+    else:
+        result.other_errors += 1
+    if check_result.attempts > 1 and check_result.retry_after is None:
+        result.retried += 1
+
+
+def _alive_status(check_result: UserCheckResult) -> AliveStatus | None:
+    if check_result.success:
+        return "alive"
+    if check_result.error_type == "blocked":
+        return "blocked"
+    if check_result.error_type == "deleted":
+        return "deleted"
+    # Errors and rate limits say nothing about the user.
+    return None
 
 
 class CheckAliveInteractor:
-    def __init__(self, admin_repository: AdminRepository) -> None:
+    """Checks users with a pool of workers sharing an AIMD concurrency limit.
+
+    Workers pick the next user as soon as they are done, so one slow answer
+    does not hold back the others, and the limit settles just below the
+    point where Telegram starts throttling. A flood wait pauses every
+    worker; the user that hit it is queued for a retry after the pause.
+    Outcomes are saved to the users table in batches as the check goes.
+    """
+
+    def __init__(
+        self,
+        admin_repository: AdminRepository,
+        transaction_manager: TransactionManager,
+    ) -> None:
         self._admin_repo = admin_repository
+        self._transaction_manager = transaction_manager
 
     async def _check_user(self, bot: Bot, user_id: int) -> UserCheckResult:
         """Check if a single user is alive by sending chat action."""
@@ -68,20 +136,68 @@ class CheckAliveInteractor:
             return UserCheckResult(user_id=user_id, success=False, error_type="other")
         except TelegramRetryAfter as e:
             logger.warning("Rate limited, waiting %d seconds", e.retry_after)
-            await asyncio.sleep(e.retry_after)
             return UserCheckResult(
-                user_id=user_id, success=False, error_type="rate_limited"
+                user_id=user_id,
+                success=False,
+                error_type="rate_limited",
+                retry_after=e.retry_after,
             )
         except Exception:
             logger.exception("Unexpected error checking user %d", user_id)
             return UserCheckResult(user_id=user_id, success=False, error_type="other")
 
-    async def _process_batch(
-        self, bot: Bot, user_ids: list[int]
-    ) -> list[UserCheckResult]:
-        """Process a batch of users concurrently."""
-        tasks = [self._check_user(bot, user_id) for user_id in user_ids]
-        return await asyncio.gather(*tasks)
+    async def _user_ids(self, data: CheckAliveInput) -> AsyncIterator[int]:
+        async for chunk in self._admin_repo.iter_user_ids(
+            active_since_days=data.active_since_days,
+            skip_checked_within_days=data.skip_checked_within_days,
+            chunk_size=CHUNK_SIZE,
+        ):
+            for user_id in chunk:
+                yield user_id
+
+    async def _save_statuses(
+        self, statuses: dict[int, AliveStatus], reading: asyncio.Lock
+    ) -> None:
+        if not statuses:
+            return
+        batch = statuses.copy()
+        statuses.clear()
+        # The session is shared with the workers reading the next user ids.
+        async with reading:
+            await self._admin_repo.save_alive_statuses(
+                batch, checked_at=datetime.now(UTC)
+            )
+            await self._transaction_manager.commit()
+
+    async def _work(
+        self,
+        bot: Bot,
+        limiter: AimdLimiter,
+        next_user: Callable[[], Awaitable[tuple[int, int] | None]],
+        retries: deque[tuple[int, int]],
+        results: asyncio.Queue[UserCheckResult | None],
+    ) -> None:
+        try:
+            while (item := await next_user()) is not None:
+                user_id, attempt = item
+                epoch = await limiter.acquire()
+                started = time.monotonic()
+                check_result = await self._check_user(bot, user_id)
+                await limiter.release(
+                    epoch,
+                    latency=time.monotonic() - started,
+                    overloaded=check_result.retry_after is not None,
+                )
+                if check_result.retry_after is not None:
+                    limiter.pause(check_result.retry_after)
+                    if attempt < MAX_ATTEMPTS:
+                        # This worker is still running, so the retry is
+                        # never left behind when the others finish.
+                        retries.append((user_id, attempt + 1))
+                        continue
+                await results.put(replace(check_result, attempts=attempt))
+        finally:
+            await results.put(None)
 
     async def execute(
         self,
@@ -93,34 +209,84 @@ class CheckAliveInteractor:
 
         Yields CheckAliveProgress every PROGRESS_INTERVAL users.
         """
-        user_ids = await self._admin_repo.get_all_user_ids(
+        # Ids are streamed, so sending starts right away and memory stays
+        # flat however many users there are.
+        total = await self._admin_repo.count_user_ids(
             active_since_days=data.active_since_days,
+            skip_checked_within_days=data.skip_checked_within_days,
         )
-        total = len(user_ids)
         result = CheckAliveResult(total=total)
         processed = 0
+        reported = 0
 
-        for i in range(0, total, BATCH_SIZE):
-            batch = user_ids[i : i + BATCH_SIZE]
-            batch_results = await self._process_batch(bot, batch)
-
-            for check_result in batch_results:
-                if check_result.success:
-                    result.alive += 1
-                elif check_result.error_type == "blocked":
-                    result.blocked += 1
-                elif check_result.error_type == "deleted":
-                    result.deleted += 1
-                elif check_result.error_type == "rate_limited":
-                    result.rate_limited += 1
-                else:
-                    result.other_errors += 1
-
-            processed += len(batch)
-
-            if processed % PROGRESS_INTERVAL < BATCH_SIZE or processed == total:
-                yield CheckAliveProgress(
-                    processed=processed,
-                    total=total,
-                    current_result=result,
-                )
+        limiter = AimdLimiter(
+            initial=INITIAL_CONCURRENCY,
+            maximum=MAX_CONCURRENCY,
+            latency_target=LATENCY_TARGET_SECONDS,
+        )
+        user_ids = self._user_ids(data)
+        reading = asyncio.Lock()
+        retries: deque[tuple[int, int]] = deque()
+        results: asyncio.Queue[UserCheckResult | None] = asyncio.Queue()
+        statuses: dict[int, AliveStatus] = {}
+
+        async def next_user() -> tuple[int, int] | None:
+            # Retries first: they are due once the pause they caused is over.
+            if retries:
+                return retries.popleft()
+            async with reading:
+                user_id = await anext(user_ids, None)
+            return None if user_id is None else (user_id, 1)
+
+        started = time.monotonic()
+        workers = [
+            asyncio.create_task(self._work(bot, limiter, next_user, retries, results))
+            for _ in range(MAX_CONCURRENCY)
+        ]
+
+        def progress(total: int) -> CheckAliveProgress:
+            elapsed = time.monotonic() - started
+            return CheckAliveProgress(
+                processed=processed,
+                total=total,
+                current_result=result,
+                throughput=processed / elapsed if elapsed > 0 else 0.0,
+                concurrency=limiter.limit,
+            )
+
+        try:
+            running = len(workers)
+            while running:
+                check_result = await results.get()
+                if check_result is None:
+                    running -= 1
+                    continue
+
+                _tally(result, check_result)
+                processed += 1
+                if (status := _alive_status(check_result)) is not None:
+                    statuses[check_result.user_id] = status
+                    if len(statuses) >= SAVE_BATCH_SIZE:
+                        await self._save_statuses(statuses, reading)
+                result.total = max(total, processed)
+
+                if processed - reported >= PROGRESS_INTERVAL:
+                    reported = processed
+                    yield progress(result.total)
+
+            # Surfaces a failure to read the users.
+            await asyncio.gather(*workers)
+            await self._save_statuses(statuses, reading)
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            await user_ids.aclose()
+
+        if processed == 0:
+            return
+        # The count may be off by users joining or going idle meanwhile;
+        # the final report is exact. Skipped when it would repeat the last.
+        result.total = processed
+        if processed > reported or total > processed:
+            yield progress(processed)
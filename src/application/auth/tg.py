@@ -6,12 +6,12 @@ from src.application.interfaces.auth import AuthService
 from src.application.user.service import UpsertUserData, UserService
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AuthTgInputDTO:
     init_data: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AuthTgOutputDTO:
     access_token: str
 
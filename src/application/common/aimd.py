@@ -0,0 +1,77 @@
+import asyncio
+import time
+
+
+class AimdLimiter:
+    """Concurrency limit tuned by additive increase / multiplicative decrease.
+
+    Every successful call grows the limit by ``increase / limit``, i.e. by
+    ``increase`` per window of calls. An overload signal (a rate limit, or
+    latency above ``latency_target``) multiplies it by ``decrease``. Calls
+    started before the last decrease cannot trigger another one, so a burst
+    of failures from one window shrinks the limit once, like TCP congestion
+    control. ``pause`` holds back all new calls, e.g. for a flood wait.
+    """
+
+    def __init__(
+        self,
+        *,
+        initial: int = 4,
+        minimum: int = 1,
+        maximum: int = 50,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+        latency_target: float = 1.0,
+    ) -> None:
+        if not 1 <= minimum <= initial <= maximum:
+            raise ValueError("Expected 1 <= minimum <= initial <= maximum")
+        self._limit = float(initial)
+        self._minimum = minimum
+        self._maximum = maximum
+        self._increase = increase
+        self._decrease = decrease
+        self._latency_target = latency_target
+        self._in_flight = 0
+        self._epoch = 0
+        self._resume_at = 0.0
+        self._changed = asyncio.Condition()
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def pause(self, seconds: float) -> None:
+        """Let no call start for ``seconds``; calls in flight are not affected."""
+        self._resume_at = max(self._resume_at, time.monotonic() + seconds)
+
+    async def acquire(self) -> int:
+        """Wait for a free slot. Returns the epoch to report the outcome with."""
+        while True:
+            delay = self._resume_at - time.monotonic()
+            if delay > 0:
+                # Checked again after the sleep: the pause may be extended.
+                await asyncio.sleep(delay)
+                continue
+            async with self._changed:
+                await self._changed.wait_for(lambda: self._in_flight < self.limit)
+                # A pause may have started while waiting for the slot.
+                if self._resume_at <= time.monotonic():
+                    self._in_flight += 1
+                    return self._epoch
+
+    async def release(self, epoch: int, latency: float, overloaded: bool) -> None:
+        async with self._changed:
+            self._in_flight -= 1
+            if overloaded or latency > self._latency_target:
+                if epoch == self._epoch:
+                    self._epoch += 1
+                    self._limit = max(self._minimum, self._limit * self._decrease)
+            else:
+                self._limit = min(
+                    self._maximum, self._limit + self._increase / self._limit
+                )
+            self._changed.notify_all()
@@ -0,0 +1,58 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+
+class SingleFlight:
+    """Collapses concurrent calls with the same key into one execution.
+
+    The first caller for a key runs the operation; callers arriving while it
+    is in flight wait for it and get the same result (or exception). Keys
+    should identify both the operation and its input, e.g.
+    ``("create_user", user_id, ...)``, so one instance can serve several
+    interactors.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, asyncio.Future[Any]] = {}
+        self.shared = 0
+
+    async def do[T](
+        self, key: Hashable, operation: Callable[[], Awaitable[T]]
+    ) -> tuple[T, bool]:
+        """Run ``operation`` once per in-flight ``key``.
+
+        Returns the result and whether it was shared from another caller.
+        """
+        while (future := self._calls.get(key)) is not None:
+            try:
+                result = await asyncio.shield(future)
+            except asyncio.CancelledError:
+                task = asyncio.current_task()
+                # This caller's own cancellation always wins, even when the
+                # running caller was cancelled at the same time.
+                if not future.cancelled() or (task is not None and task.cancelling()):
+                    raise
+                # Only the running caller was cancelled; retry, possibly as
+                # the new leader.
+                continue
+            self.shared += 1
+            return result, True
+
+        future = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        try:
+            result = await operation()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark it retrieved so a call without waiters logs nothing.
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result, False
+        finally:
+            del self._calls[key]
@@ -0,0 +1,16 @@
+from abc import abstractmethod
+from datetime import datetime
+from typing import Protocol
+
+
+class UserActivityBuffer(Protocol):
+    """Write-behind buffer for "seen at" refreshes of already known users."""
+
+    @abstractmethod
+    def record_seen(self, user_id: int, seen_at: datetime) -> bool:
+        """Queue a last_login_at refresh.
+
+        Returns False when the buffer is full; the caller must then write
+        the update through itself.
+        """
+        raise NotImplementedError
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from typing import Protocol
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class InitDataDTO:
     user_id: int
     username: str | None
@@ -0,0 +1,24 @@
+from abc import abstractmethod
+from typing import Protocol
+
+from src.application.user.dtos import CreateUserOutputDTO
+
+
+class UserCache(Protocol):
+    """Process-local cache of resolved users keyed by Telegram user id."""
+
+    @abstractmethod
+    def get(self, user_id: int) -> CreateUserOutputDTO | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, user: CreateUserOutputDTO) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def invalidate(self, user_id: int) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self) -> None:
+        raise NotImplementedError
@@ -0,0 +1,52 @@
+from abc import abstractmethod
+from typing import Protocol
+
+from src.domain.user.repository import TopReferrer, TopReferrerCursor
+
+
+class ReferralLeaderboard(Protocol):
+    """Process-local copy of the top referrers, kept current by increments."""
+
+    @property
+    @abstractmethod
+    def capacity(self) -> int:
+        """Number of top referrers held; also the size of a reseed."""
+        raise NotImplementedError
+
+    @property
+    @abstractmethod
+    def version(self) -> int:
+        """Changes whenever a reseed started earlier would miss an update."""
+        raise NotImplementedError
+
+    @property
+    @abstractmethod
+    def stale(self) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    def page(
+        self,
+        limit: int,
+        after: TopReferrerCursor | None = None,
+        before: TopReferrerCursor | None = None,
+    ) -> list[TopReferrer] | None:
+        """Same page as UserRepository.get_top_referrers.
+
+        Returns None when it cannot be answered exactly from memory.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def record(self, referrer: TopReferrer) -> None:
+        """Apply a committed referral_count of a user."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def reset(self, top: list[TopReferrer], version: int) -> None:
+        """Reseed from the database unless ``version`` is outdated."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def invalidate(self) -> None:
+        raise NotImplementedError
@@ -2,16 +2,19 @@ from dataclasses import dataclass
 
 from src.application.common.interactor import Interactor
 from src.domain.user import UserRepository
-from src.domain.user.services.referral import encode_referral
+from src.domain.user.services.referral import ReferralCodec
 from src.domain.user.vo import UserId
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GetReferralInfoInputDTO:
     user_id: int
+    # Already known by the caller (e.g. loaded by the bot middleware);
+    # skips reading the user again.
+    referral_count: int | None = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GetReferralInfoOutputDTO:
     referral_code: str
     referral_count: int
@@ -23,20 +26,26 @@ class GetReferralInfoInteractor(
     def __init__(
         self,
         user_repository: UserRepository,
-        secret_key: str,
+        codec: ReferralCodec,
     ) -> None:
         self.user_repository = user_repository
-        self.secret_key = secret_key
+        self.codec = codec
 
     async def __call__(
         self, data: GetReferralInfoInputDTO
     ) -> GetReferralInfoOutputDTO | None:
+        if data.referral_count is not None:
+            return GetReferralInfoOutputDTO(
+                referral_code=self.codec.encode(data.user_id),
+                referral_count=data.referral_count,
+            )
+
         user = await self.user_repository.get_user(UserId(data.user_id))
 
         if user is None:
             return None
 
         return GetReferralInfoOutputDTO(
-            referral_code=encode_referral(data.user_id, self.secret_key),
+            referral_code=self.codec.encode(data.user_id),
             referral_count=user.referral_count.value if user.referral_count else 0,
         )
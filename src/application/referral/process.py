@@ -2,12 +2,16 @@ from dataclasses import dataclass
 
 from src.application.common.interactor import Interactor
 from src.application.common.transaction import TransactionManager
+from src.application.interfaces.cache import UserCache
+from src.application.interfaces.leaderboard import ReferralLeaderboard
+from src.domain.referral import ReferralEventRepository
 from src.domain.user import UserRepository
-from src.domain.user.services.referral import decode_referral
+from src.domain.user.repository import TopReferrer
+from src.domain.user.services.referral import ReferralCodec
 from src.domain.user.vo import UserId
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ProcessReferralInputDTO:
     new_user_id: int
     referral_code: str
@@ -17,15 +21,24 @@ class ProcessReferralInteractor(Interactor[ProcessReferralInputDTO, bool]):
     def __init__(
         self,
         user_repository: UserRepository,
+        referral_event_repository: ReferralEventRepository,
         transaction_manager: TransactionManager,
-        secret_key: str,
+        codec: ReferralCodec,
+        *,
+        user_cache: UserCache | None = None,
+        leaderboard: ReferralLeaderboard | None = None,
+        defer_count: bool = False,
     ) -> None:
         self.user_repository = user_repository
+        self.referral_event_repository = referral_event_repository
         self.transaction_manager = transaction_manager
-        self.secret_key = secret_key
+        self.codec = codec
+        self.user_cache = user_cache
+        self.leaderboard = leaderboard
+        self.defer_count = defer_count
 
     async def __call__(self, data: ProcessReferralInputDTO) -> bool:
-        referrer_id = decode_referral(data.referral_code, self.secret_key)
+        referrer_id = self.codec.decode(data.referral_code)
 
         if referrer_id is None:
             return False
@@ -38,10 +51,30 @@ class ProcessReferralInteractor(Interactor[ProcessReferralInputDTO, bool]):
         if referrer is None:
             return False
 
+        await self.referral_event_repository.add_event(
+            UserId(referrer_id), UserId(data.new_user_id), counted=not self.defer_count
+        )
         await self.user_repository.set_referred_by(
             UserId(data.new_user_id), UserId(referrer_id)
         )
-        await self.user_repository.increment_referral_count(UserId(referrer_id))
+        referral_count = None
+        if not self.defer_count:
+            referral_count = await self.user_repository.increment_referral_count(
+                UserId(referrer_id)
+            )
         await self.transaction_manager.commit()
 
+        if self.user_cache is not None:
+            self.user_cache.invalidate(data.new_user_id)
+            self.user_cache.invalidate(referrer_id)
+        if self.leaderboard is not None and referral_count is not None:
+            self.leaderboard.record(
+                TopReferrer(
+                    user_id=referrer_id,
+                    username=referrer.username.value if referrer.username else None,
+                    first_name=referrer.first_name.value,
+                    referral_count=referral_count,
+                )
+            )
+
         return True
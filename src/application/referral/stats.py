@@ -1,24 +1,39 @@
+import logging
 from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Literal
 
 from src.application.common.interactor import Interactor
+from src.application.common.transaction import TransactionManager
+from src.application.interfaces.leaderboard import ReferralLeaderboard
+from src.domain.referral import ReferralEventRepository, RollupGranularity
 from src.domain.user import UserRepository
+from src.domain.user.repository import (
+    ReferralStatsDrift,
+    TopReferrer,
+    TopReferrerCursor,
+)
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class StatsOutputDTO:
     total_users: int
     referred_count: int
     referred_percent: float
     organic_count: int
     organic_percent: float
+    is_estimate: bool = False
 
 
 class GetStatsInteractor(Interactor[None, StatsOutputDTO]):
-    def __init__(self, user_repository: UserRepository) -> None:
+    def __init__(self, user_repository: UserRepository, estimate: bool = False) -> None:
         self.user_repository = user_repository
+        self.estimate = estimate
 
     async def __call__(self, data: None = None) -> StatsOutputDTO:
-        stats = await self.user_repository.get_referral_stats()
+        stats = await self.user_repository.get_referral_stats(estimate=self.estimate)
 
         if stats.total_users > 0:
             referred_pct = stats.referred_count / stats.total_users * 100
@@ -33,10 +48,35 @@ class GetStatsInteractor(Interactor[None, StatsOutputDTO]):
             referred_percent=round(referred_pct, 1),
             organic_count=stats.organic_count,
             organic_percent=round(organic_pct, 1),
+            is_estimate=stats.is_estimate,
         )
 
 
-@dataclass
+class ReconcileStatsInteractor(Interactor[None, ReferralStatsDrift]):
+    """Recomputes the maintained user counters and fixes any drift."""
+
+    def __init__(
+        self,
+        user_repository: UserRepository,
+        transaction_manager: TransactionManager,
+    ) -> None:
+        self.user_repository = user_repository
+        self.transaction_manager = transaction_manager
+
+    async def __call__(self, data: None = None) -> ReferralStatsDrift:
+        drift = await self.user_repository.reconcile_referral_stats()
+        await self.transaction_manager.commit()
+
+        if drift.total_users or drift.referred_count:
+            logger.warning(
+                "Corrected user counter drift: users %+d, referred %+d",
+                drift.total_users,
+                drift.referred_count,
+            )
+        return drift
+
+
+@dataclass(frozen=True, slots=True)
 class TopReferrerDTO:
     user_id: int
     username: str | None
@@ -44,19 +84,143 @@ class TopReferrerDTO:
     count: int
 
 
-class GetTopReferrersInteractor(Interactor[int, list[TopReferrerDTO]]):
-    def __init__(self, user_repository: UserRepository) -> None:
+@dataclass(frozen=True, slots=True)
+class TopReferrersInputDTO:
+    limit: int = 10
+    # (count, user_id) of the row to page from: the last row of the current
+    # page going forward, the first one going backwards.
+    cursor: tuple[int, int] | None = None
+    backwards: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class TopReferrersPageDTO:
+    referrers: list[TopReferrerDTO]
+    has_next: bool
+    has_prev: bool
+
+
+class GetTopReferrersInteractor(Interactor[TopReferrersInputDTO, TopReferrersPageDTO]):
+    def __init__(
+        self,
+        user_repository: UserRepository,
+        leaderboard: ReferralLeaderboard | None = None,
+    ) -> None:
         self.user_repository = user_repository
+        self.leaderboard = leaderboard
+
+    async def __call__(
+        self, data: TopReferrersInputDTO | None = None
+    ) -> TopReferrersPageDTO:
+        if data is None:
+            data = TopReferrersInputDTO()
+        cursor = TopReferrerCursor(*data.cursor) if data.cursor else None
+        # One extra row tells whether another page follows in that direction.
+        if data.backwards and cursor is not None:
+            top = await self._get_top_referrers(limit=data.limit + 1, before=cursor)
+            has_more = len(top) > data.limit
+            top = top[-data.limit :]
+            has_next, has_prev = True, has_more
+        else:
+            top = await self._get_top_referrers(limit=data.limit + 1, after=cursor)
+            has_more = len(top) > data.limit
+            top = top[: data.limit]
+            has_next, has_prev = has_more, cursor is not None
+
+        return TopReferrersPageDTO(
+            referrers=[
+                TopReferrerDTO(
+                    user_id=r.user_id,
+                    username=r.username,
+                    first_name=r.first_name,
+                    count=r.referral_count,
+                )
+                for r in top
+            ],
+            has_next=has_next,
+            has_prev=has_prev,
+        )
 
-    async def __call__(self, data: int = 10) -> list[TopReferrerDTO]:
-        top = await self.user_repository.get_top_referrers(limit=data)
+    async def _get_top_referrers(
+        self,
+        limit: int,
+        after: TopReferrerCursor | None = None,
+        before: TopReferrerCursor | None = None,
+    ) -> list[TopReferrer]:
+        if self.leaderboard is None:
+            return await self.user_repository.get_top_referrers(
+                limit=limit, after=after, before=before
+            )
 
-        return [
-            TopReferrerDTO(
-                user_id=r.user_id,
-                username=r.username,
-                first_name=r.first_name,
-                count=r.referral_count,
+        top = self.leaderboard.page(limit, after=after, before=before)
+        if top is None and self.leaderboard.stale:
+            version = self.leaderboard.version
+            seed = await self.user_repository.get_top_referrers(
+                limit=self.leaderboard.capacity
+            )
+            self.leaderboard.reset(seed, version)
+            top = self.leaderboard.page(limit, after=after, before=before)
+        if top is None:
+            top = await self.user_repository.get_top_referrers(
+                limit=limit, after=after, before=before
             )
-            for r in top
-        ]
+        return top
+
+
+ReferralPeriod = Literal["day", "week", "month"]
+
+# Number of rollup buckets per period; the current bucket counts as one.
+PERIODS: dict[ReferralPeriod, tuple[RollupGranularity, int]] = {
+    "day": ("hour", 24),
+    "week": ("day", 7),
+    "month": ("day", 30),
+}
+
+
+def period_start(
+    period: ReferralPeriod, now: datetime
+) -> tuple[datetime, RollupGranularity]:
+    granularity, buckets = PERIODS[period]
+    now = now.astimezone(UTC).replace(minute=0, second=0, microsecond=0)
+    if granularity == "hour":
+        return now - timedelta(hours=buckets - 1), granularity
+    return now.replace(hour=0) - timedelta(days=buckets - 1), granularity
+
+
+@dataclass(frozen=True, slots=True)
+class PeriodStatsOutputDTO:
+    period: ReferralPeriod
+    since: datetime
+    referrals: int
+    top_referrers: list[TopReferrerDTO]
+
+
+class GetPeriodStatsInteractor(Interactor[ReferralPeriod, PeriodStatsOutputDTO]):
+    """Referrals of a recent period, read from the referral rollups."""
+
+    def __init__(
+        self, referral_event_repository: ReferralEventRepository, limit: int = 5
+    ) -> None:
+        self.referral_event_repository = referral_event_repository
+        self.limit = limit
+
+    async def __call__(self, data: ReferralPeriod) -> PeriodStatsOutputDTO:
+        since, granularity = period_start(data, datetime.now(UTC))
+        stats = await self.referral_event_repository.get_period_stats(
+            since, granularity, limit=self.limit
+        )
+
+        return PeriodStatsOutputDTO(
+            period=data,
+            since=since,
+            referrals=stats.referrals,
+            top_referrers=[
+                TopReferrerDTO(
+                    user_id=r.user_id,
+                    username=r.username,
+                    first_name=r.first_name,
+                    count=r.referral_count,
+                )
+                for r in stats.top_referrers
+            ],
+        )
@@ -1,5 +1,11 @@
+from dataclasses import replace
+from datetime import UTC, datetime
+
 from src.application.common.interactor import Interactor
+from src.application.common.single_flight import SingleFlight
 from src.application.common.transaction import TransactionManager
+from src.application.interfaces.activity import UserActivityBuffer
+from src.application.interfaces.cache import UserCache
 from src.application.user.dtos import (
     CreateUserInputDTO,
     CreateUserOutputDTO,
@@ -8,16 +14,52 @@ from src.application.user.dtos import (
 from src.application.user.service import UpsertUserData, UserService
 
 
+def _same_profile(cached: CreateUserOutputDTO, data: CreateUserInputDTO) -> bool:
+    return (
+        cached.username == data.username
+        and cached.first_name == data.first_name
+        and cached.last_name == data.last_name
+    )
+
+
 class CreateUserInteractor(Interactor[CreateUserInputDTO, CreateUserOutputDTO]):
     def __init__(
         self,
         user_service: UserService,
         transaction_manager: TransactionManager,
+        user_cache: UserCache | None = None,
+        activity_buffer: UserActivityBuffer | None = None,
+        single_flight: SingleFlight | None = None,
     ) -> None:
         self.user_service = user_service
         self.transaction_manager = transaction_manager
+        self.user_cache = user_cache
+        self.activity_buffer = activity_buffer
+        self.single_flight = single_flight
 
     async def __call__(self, data: CreateUserInputDTO) -> CreateUserOutputDTO:
+        if self.user_cache is not None:
+            cached = self.user_cache.get(data.id)
+            if (
+                cached is not None
+                and _same_profile(cached, data)
+                and self._record_seen(data.id)
+            ):
+                return cached
+
+        if self.single_flight is None:
+            return await self._upsert(data)
+
+        # Duplicate updates (double taps, redeliveries) share one upsert
+        # instead of queueing on the row lock. Only one of them reports
+        # the user as new.
+        dto, shared = await self.single_flight.do(
+            ("create_user", data.id, data.username, data.first_name, data.last_name),
+            lambda: self._upsert(data),
+        )
+        return replace(dto, is_new=False) if shared else dto
+
+    async def _upsert(self, data: CreateUserInputDTO) -> CreateUserOutputDTO:
         user = await self.user_service.upsert_user(
             UpsertUserData(
                 id=data.id,
@@ -29,4 +71,15 @@ class CreateUserInteractor(Interactor[CreateUserInputDTO, CreateUserOutputDTO]):
 
         await self.transaction_manager.commit()
 
-        return entity_to_dto(user)
+        dto = entity_to_dto(user)
+        if self.user_cache is not None:
+            # Whoever is served from the cache next has been seen before.
+            self.user_cache.set(replace(dto, is_new=False))
+        return dto
+
+    def _record_seen(self, user_id: int) -> bool:
+        # Without write-behind a cache hit skips the last_login_at refresh;
+        # it is written again once the entry expires.
+        if self.activity_buffer is None:
+            return True
+        return self.activity_buffer.record_seen(user_id, datetime.now(UTC))
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from src.domain.user import User
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CreateUserInputDTO:
     id: int
     username: str | None
@@ -11,13 +11,14 @@ class CreateUserInputDTO:
     last_name: str | None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CreateUserOutputDTO:
     id: int
     username: str | None
     first_name: str
     last_name: str | None
     language_code: str | None = None
+    referral_count: int = 0
     is_new: bool = False
 
 
@@ -28,5 +29,6 @@ def entity_to_dto(user: User) -> CreateUserOutputDTO:
         first_name=user.first_name.value,
         last_name=user.last_name.value if user.last_name else None,
         language_code=user.language_code.value if user.language_code else None,
+        referral_count=user.referral_count.value if user.referral_count else 0,
         is_new=user.is_new,
     )
@@ -8,12 +8,12 @@ from src.domain.user import (
 from src.domain.user.vo import UserId
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GetUserProfileInputDTO:
     user_id: UserId
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GetUserProfileOutputDTO:
     id: int
     username: str | None
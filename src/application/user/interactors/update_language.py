@@ -1,29 +1,56 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
 from src.application.common.interactor import Interactor
+from src.application.common.single_flight import SingleFlight
 from src.application.common.transaction import TransactionManager
+from src.application.interfaces.cache import UserCache
+from src.application.user.dtos import CreateUserOutputDTO, entity_to_dto
 from src.domain.user import UserRepository
 from src.domain.user.vo import LanguageCode, UserId
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UpdateLanguageDTO:
     user_id: UserId
     language_code: LanguageCode
 
 
-class UpdateLanguageInteractor(Interactor[UpdateLanguageDTO, None]):
+class UpdateLanguageInteractor(
+    Interactor[UpdateLanguageDTO, CreateUserOutputDTO | None]
+):
     def __init__(
         self,
         user_repository: UserRepository,
         transaction_manager: TransactionManager,
+        user_cache: UserCache | None = None,
+        single_flight: SingleFlight | None = None,
     ) -> None:
         self._user_repository = user_repository
         self._transaction_manager = transaction_manager
+        self._user_cache = user_cache
+        self._single_flight = single_flight
 
-    async def __call__(self, data: UpdateLanguageDTO) -> None:
-        await self._user_repository.update_language(
+    async def __call__(self, data: UpdateLanguageDTO) -> CreateUserOutputDTO | None:
+        if self._single_flight is None:
+            return await self._update(data)
+
+        dto, _ = await self._single_flight.do(
+            ("update_language", data.user_id.value, data.language_code.value),
+            lambda: self._update(data),
+        )
+        return dto
+
+    async def _update(self, data: UpdateLanguageDTO) -> CreateUserOutputDTO | None:
+        user = await self._user_repository.update_language(
             user_id=data.user_id,
             language_code=data.language_code,
         )
         await self._transaction_manager.commit()
+
+        if user is None:
+            return None
+
+        dto = entity_to_dto(user)
+        if self._user_cache is not None:
+            self._user_cache.set(replace(dto, is_new=False))
+        return dto
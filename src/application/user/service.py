@@ -1,11 +1,11 @@
 from dataclasses import dataclass
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 
 from src.domain.user import User, UserRepository
 from src.domain.user.vo import FirstName, LastName, UserId, Username
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class UpsertUserData:
     id: int
     username: str | None
@@ -14,30 +14,30 @@ class UpsertUserData:
 
 
 class UserService:
-    def __init__(self, user_repository: UserRepository) -> None:
+    def __init__(
+        self,
+        user_repository: UserRepository,
+        last_seen_granularity: timedelta = timedelta(0),
+    ) -> None:
         self.user_repository = user_repository
+        self.last_seen_granularity = last_seen_granularity
 
     async def upsert_user(self, data: UpsertUserData) -> User:
-        user_id = UserId(data.id)
-
-        existing_user = await self.user_repository.get_user(user_id)
-
         now = datetime.now(UTC)
 
+        # created_at is only used when the row is inserted; an existing user
+        # keeps its original value (and bio, referral data, language).
         user = User(
-            id=user_id,
+            id=UserId(data.id),
             first_name=FirstName(data.first_name),
             last_name=LastName(data.last_name) if data.last_name else None,
             username=Username(data.username) if data.username else None,
-            bio=existing_user.bio if existing_user else None,
-            created_at=existing_user.created_at if existing_user else now,
+            bio=None,
+            created_at=now,
             updated_at=now,
             last_login_at=now,
         )
 
-        if existing_user is None:
-            user = await self.user_repository.create_user(user)
-        else:
-            user = await self.user_repository.update_user(user)
-
-        return user
+        return await self.user_repository.upsert_user(
+            user, last_seen_granularity=self.last_seen_granularity
+        )
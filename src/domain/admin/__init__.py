@@ -1,3 +1,3 @@
-from .repository import AdminRepository
+from .repository import AdminRepository, AliveStatus
 
-__all__ = ["AdminRepository"]
+__all__ = ["AdminRepository", "AliveStatus"]
@@ -1,18 +1,58 @@
 from abc import abstractmethod
-from typing import Protocol
+from collections.abc import AsyncIterator, Mapping, Sequence
+from datetime import datetime
+from typing import Literal, Protocol
+
+# Outcome of the last alive check; other errors leave the user unchanged.
+AliveStatus = Literal["alive", "blocked", "deleted"]
 
 
 class AdminRepository(Protocol):
     @abstractmethod
-    async def get_all_user_ids(self, active_since_days: int | None = None) -> list[int]:
+    async def count_user_ids(
+        self,
+        active_since_days: int | None = None,
+        skip_checked_within_days: int | None = None,
+    ) -> int:
         """
-        Get all user IDs, optionally filtered by recent activity.
+        Count the users ``iter_user_ids`` would yield.
 
         Args:
-            active_since_days: If provided, only return users who logged in
+            active_since_days: If provided, only count users who logged in
                               within the last N days. None means all users.
+            skip_checked_within_days: If provided, leave out users whose
+                              alive status was recorded within the last N days.
 
         Returns:
-            List of Telegram user IDs.
+            Number of users, possibly off by users joining meanwhile.
         """
         raise NotImplementedError
+
+    @abstractmethod
+    def iter_user_ids(
+        self,
+        active_since_days: int | None = None,
+        skip_checked_within_days: int | None = None,
+        chunk_size: int = 1000,
+    ) -> AsyncIterator[Sequence[int]]:
+        """
+        Stream user IDs in ascending chunks, optionally filtered.
+
+        Args:
+            active_since_days: If provided, only yield users who logged in
+                              within the last N days. None means all users.
+            skip_checked_within_days: If provided, leave out users whose
+                              alive status was recorded within the last N days.
+            chunk_size: Maximum number of IDs per chunk.
+
+        Yields:
+            Chunks of Telegram user IDs. Only one chunk is held at a time.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def save_alive_statuses(
+        self, statuses: Mapping[int, AliveStatus], checked_at: datetime
+    ) -> None:
+        """Record the alive check outcome of many users in one statement."""
+        raise NotImplementedError
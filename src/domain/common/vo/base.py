@@ -1,4 +1,5 @@
 from abc import abstractmethod
+from typing import Self
 
 
 class BaseValueObject[T]:
@@ -8,6 +9,17 @@ class BaseValueObject[T]:
         self.__class__._validate(value)
         self._value = value
 
+    @classmethod
+    def trusted(cls, value: T) -> Self:
+        """Build without validation.
+
+        Only for values that were validated before they were stored,
+        e.g. columns read back from the database.
+        """
+        instance = object.__new__(cls)
+        instance._value = value
+        return instance
+
     @classmethod
     @abstractmethod
     def _validate(cls, value: T) -> None: ...
@@ -0,0 +1,68 @@
+from typing import Any, ClassVar, Self
+
+from src.domain.common.vo.base import BaseValueObject
+
+
+class InternedValueObject[T](BaseValueObject[T]):
+    """Value object that hands out one shared instance per value.
+
+    For low-cardinality types: constructing a value seen before returns the
+    existing instance without allocating. Values are still validated, and
+    only values of the exact type interned are shared, so ``1.0`` never
+    resolves to the instance of ``1``. Each subclass has its own registry,
+    bounded by ``max_interned``; values beyond it are built as regular
+    instances. ``seed`` fills it up front instead.
+    """
+
+    __slots__ = ()
+
+    max_interned: ClassVar[int] = 64
+    _interned: ClassVar[dict[Any, Any]]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._interned = {}
+
+    def __new__(cls, value: T) -> Self:
+        cls._validate(value)
+        return cls._lookup(value) or cls._build(value)
+
+    def __init__(self, value: T) -> None:
+        # Fully built in __new__; shared instances must not be re-initialised.
+        pass
+
+    def __reduce__(self) -> tuple[type[Self], tuple[T]]:
+        # Copies and unpickled instances resolve to the shared instance too.
+        return self.__class__, (self._value,)
+
+    @classmethod
+    def trusted(cls, value: T) -> Self:
+        return cls._lookup(value) or cls._build(value)
+
+    @classmethod
+    def seed(cls, *values: T) -> None:
+        """Intern ``values`` regardless of ``_should_intern``."""
+        for value in values:
+            cls._validate(value)
+            if cls._lookup(value) is None:
+                cls._interned[value] = cls._build(value, intern=False)
+
+    @classmethod
+    def _lookup(cls, value: T) -> Self | None:
+        instance = cls._interned.get(value)
+        # Equal hashes across types, e.g. 1 and 1.0 or True.
+        if instance is None or type(instance._value) is not type(value):
+            return None
+        return instance
+
+    @classmethod
+    def _build(cls, value: T, *, intern: bool = True) -> Self:
+        instance = object.__new__(cls)
+        instance._value = value
+        if intern and value not in cls._interned and cls._should_intern(value):
+            cls._interned[value] = instance
+        return instance
+
+    @classmethod
+    def _should_intern(cls, value: T) -> bool:
+        return len(cls._interned) < cls.max_interned
@@ -0,0 +1,13 @@
+from .repository import (
+    ReferralEventRepository,
+    ReferralPeriodStats,
+    RollupBatch,
+    RollupGranularity,
+)
+
+__all__ = [
+    "ReferralEventRepository",
+    "ReferralPeriodStats",
+    "RollupBatch",
+    "RollupGranularity",
+]
@@ -0,0 +1,51 @@
+from abc import abstractmethod
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Literal, Protocol
+
+from src.domain.user.repository import TopReferrer
+from src.domain.user.vo import UserId
+
+RollupGranularity = Literal["hour", "day"]
+
+
+@dataclass(frozen=True, slots=True)
+class ReferralPeriodStats:
+    referrals: int
+    top_referrers: list[TopReferrer]
+
+
+@dataclass(frozen=True, slots=True)
+class RollupBatch:
+    events: int
+    # Referrers whose deferred referral counts the batch applied.
+    referrer_ids: list[int]
+
+
+class ReferralEventRepository(Protocol):
+    @abstractmethod
+    async def add_event(
+        self, referrer_id: UserId, user_id: UserId, *, counted: bool = True
+    ) -> None:
+        """Append a referral to the event log.
+
+        ``counted=False`` leaves the referrer's count to the rollup refresh.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def refresh_rollups(self, batch_size: int) -> RollupBatch:
+        """Fold about ``batch_size`` committed events past the watermark.
+
+        Events of transactions that may still be running are left to a
+        later refresh, so inserts never wait for it. Also adds the batch's
+        uncounted events to the referrers' counts.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_period_stats(
+        self, since: datetime, granularity: RollupGranularity, limit: int = 5
+    ) -> ReferralPeriodStats:
+        """Referrals and top referrers from rollup buckets starting at ``since``."""
+        raise NotImplementedError
@@ -4,7 +4,7 @@ from datetime import datetime
 from .vo import Bio, FirstName, LanguageCode, LastName, ReferralCount, UserId, Username
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     id: UserId
     first_name: FirstName
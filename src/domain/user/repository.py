@@ -1,19 +1,32 @@
 from abc import abstractmethod
 from dataclasses import dataclass
+from datetime import datetime, timedelta
 from typing import Protocol, overload
 
 from src.domain.user.entity import User
 from src.domain.user.vo import LanguageCode, UserId, Username
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ReferralStats:
     total_users: int
     referred_count: int
     organic_count: int
+    # True when the counts come from planner statistics, not a scan.
+    is_estimate: bool = False
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class ReferralStatsDrift:
+    """Result of recomputing the maintained referral counters."""
+
+    stats: ReferralStats
+    # Recomputed value minus the previously maintained one.
+    total_users: int
+    referred_count: int
+
+
+@dataclass(frozen=True, slots=True)
 class TopReferrer:
     user_id: int
     username: str | None
@@ -21,6 +34,14 @@ class TopReferrer:
     referral_count: int
 
 
+@dataclass(frozen=True, slots=True)
+class TopReferrerCursor:
+    """Position in the leaderboard, ordered by (referral_count, user_id) desc."""
+
+    referral_count: int
+    user_id: int
+
+
 class UserRepository(Protocol):
     @overload
     async def get_user(self, identifier: UserId) -> User | None: ...
@@ -40,6 +61,25 @@ class UserRepository(Protocol):
     async def update_user(self, user: User) -> User:
         raise NotImplementedError
 
+    @abstractmethod
+    async def upsert_user(
+        self, user: User, last_seen_granularity: timedelta = timedelta(0)
+    ) -> User:
+        """Insert the user or refresh its Telegram profile in a single statement.
+
+        An existing row keeps its created_at, bio, referral_count and
+        language_code, so ``is_new`` of the returned user is only true
+        when the row was actually inserted. The row is left untouched when
+        the profile is unchanged and last_login_at is younger than
+        ``last_seen_granularity``.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def update_last_seen(self, last_seen: dict[int, datetime]) -> None:
+        """Bulk-refresh last_login_at for many users in one statement."""
+        raise NotImplementedError
+
     @abstractmethod
     async def delete_user(self, user_id: UserId) -> None: ...
 
@@ -48,21 +88,44 @@ class UserRepository(Protocol):
         raise NotImplementedError
 
     @abstractmethod
-    async def increment_referral_count(self, user_id: UserId) -> None:
+    async def increment_referral_count(self, user_id: UserId) -> int | None:
+        """Add one to the user's referral_count and return the new value.
+
+        Returns None if the user does not exist.
+        """
         raise NotImplementedError
 
     @abstractmethod
-    async def get_referral_stats(self) -> ReferralStats:
-        """Get overall referral statistics."""
+    async def get_referral_stats(self, estimate: bool = False) -> ReferralStats:
+        """Get overall referral statistics from the maintained counters.
+
+        With ``estimate`` the counts are read from table statistics instead,
+        falling back to the counters when none exist yet.
+        """
+        ...
+
+    @abstractmethod
+    async def reconcile_referral_stats(self) -> ReferralStatsDrift:
+        """Recount users from scratch and overwrite the maintained counters."""
         ...
 
     @abstractmethod
-    async def get_top_referrers(self, limit: int = 10) -> list[TopReferrer]:
-        """Get top referrers by referral count."""
+    async def get_top_referrers(
+        self,
+        limit: int = 10,
+        after: TopReferrerCursor | None = None,
+        before: TopReferrerCursor | None = None,
+    ) -> list[TopReferrer]:
+        """Get top referrers by referral count, highest first.
+
+        ``after`` returns the page following the cursor and ``before`` the
+        page preceding it; ties on referral_count are ordered by user id.
+        """
         ...
 
     @abstractmethod
     async def update_language(
         self, user_id: UserId, language_code: LanguageCode
-    ) -> None:
+    ) -> User | None:
+        """Set the user's language and return the updated user, if any."""
         raise NotImplementedError
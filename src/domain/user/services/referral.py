@@ -1,31 +1,81 @@
 import base64
+import binascii
 import hashlib
 import struct
+from collections.abc import Sequence
 
+# A code is the 8-byte XORed id in unpadded urlsafe base64.
+CODE_LENGTH = 11
 
-def encode_referral(user_id: int, secret_key: str) -> str:
-    """Encode user_id into a short referral code using XOR encryption."""
-    key_hash = hashlib.sha256(secret_key.encode()).digest()
-    key_int = int.from_bytes(key_hash[:8], "big")
+# Batches append a zero byte to each id: 9 bytes are exactly 12 base64
+# characters, so a whole batch is converted in one call and every code is
+# the first 11 characters of its group.
+_BATCH_RECORD = struct.Struct(">QB")
+_BATCH_GROUP = 12
 
-    encrypted = user_id ^ key_int
-    packed = struct.pack(">Q", encrypted)
-    return base64.urlsafe_b64encode(packed).decode().rstrip("=")
 
+class ReferralCodec:
+    """Encodes user ids into short referral codes using XOR encryption.
 
-def decode_referral(code: str, secret_key: str) -> int | None:
-    """Decode referral code back to user_id. Returns None if invalid."""
-    try:
-        padding = 4 - len(code) % 4
-        if padding != 4:
-            code += "=" * padding
+    The key is derived from the secret once, so one codec should be shared
+    by everything encoding or decoding with that secret.
+    """
 
-        packed = base64.urlsafe_b64decode(code)
-        encrypted = struct.unpack(">Q", packed)[0]
+    __slots__ = ("_key",)
 
+    def __init__(self, secret_key: str) -> None:
         key_hash = hashlib.sha256(secret_key.encode()).digest()
-        key_int = int.from_bytes(key_hash[:8], "big")
+        self._key = int.from_bytes(key_hash[:8], "big")
+
+    def encode(self, user_id: int) -> str:
+        packed = struct.pack(">Q", user_id ^ self._key)
+        return base64.urlsafe_b64encode(packed).decode().rstrip("=")
+
+    def decode(self, code: str) -> int | None:
+        """Decode a referral code back to user_id. Returns None if invalid."""
+        try:
+            padding = 4 - len(code) % 4
+            if padding != 4:
+                code += "=" * padding
+
+            packed = base64.urlsafe_b64decode(code)
+            encrypted = struct.unpack(">Q", packed)[0]
+            return encrypted ^ self._key
+        except Exception:
+            return None
+
+    def encode_many(self, user_ids: Sequence[int]) -> list[str]:
+        key = self._key
+        packed = b"".join(_BATCH_RECORD.pack(user_id ^ key, 0) for user_id in user_ids)
+        encoded = base64.urlsafe_b64encode(packed).decode()
+        return [
+            encoded[start : start + CODE_LENGTH]
+            for start in range(0, len(encoded), _BATCH_GROUP)
+        ]
 
-        return encrypted ^ key_int
-    except Exception:
-        return None
+    def decode_many(self, codes: Sequence[str]) -> list[int | None]:
+        """Decode referral codes, with None for each invalid one."""
+        if all(len(code) == CODE_LENGTH for code in codes):
+            try:
+                packed = base64.b64decode(
+                    "A".join(codes) + "A", altchars=b"-_", validate=True
+                )
+            except (binascii.Error, ValueError):
+                pass
+            else:
+                key = self._key
+                return [
+                    encrypted ^ key
+                    for encrypted, _ in _BATCH_RECORD.iter_unpack(packed)
+                ]
+        return [self.decode(code) for code in codes]
+
+
+def encode_referral(user_id: int, secret_key: str) -> str:
+    """Encode user_id into a short referral code using XOR encryption."""
+    return ReferralCodec(secret_key).encode(user_id)
+
+
+def decode_referral(code: str, secret_key: str) -> int | None:
+    """Decode referral code back to user_id. Returns None if invalid."""
+    return ReferralCodec(secret_key).decode(code)
@@ -3,6 +3,7 @@ Limits from https://limits.tginfo.me/en
 """
 
 from src.domain.common.vo.integer import PositiveInteger
+from src.domain.common.vo.interned import InternedValueObject
 from src.domain.common.vo.string import NonEmptyString
 
 
@@ -32,32 +33,41 @@ class Bio(NonEmptyString):
     max_length = 160
 
 
-class ReferralCount:
-    """Non-negative integer for referral count."""
+class ReferralCount(InternedValueObject[int]):
+    """Non-negative integer for referral count.
 
-    def __init__(self, value: int) -> None:
+    Most users have a handful of referrals, so small counts are shared
+    like Python's small-int cache.
+    """
+
+    __slots__ = ()
+
+    max_interned = 256
+
+    @classmethod
+    def _validate(cls, value: int) -> None:
         if not isinstance(value, int):
             raise TypeError("ReferralCount value must be an int")
         if value < 0:
             raise ValueError("ReferralCount cannot be negative")
-        self._value = value
 
-    @property
-    def value(self) -> int:
-        return self._value
+    @classmethod
+    def _should_intern(cls, value: int) -> bool:
+        return value < cls.max_interned
 
-    def __eq__(self, other: object) -> bool:
-        if isinstance(other, ReferralCount):
-            return self._value == other._value
-        return False
 
-    def __hash__(self) -> int:
-        return hash(self._value)
+class LanguageCode(InternedValueObject[str], NonEmptyString):
+    """Language code; only the seeded (supported) languages are shared.
 
-    def __repr__(self) -> str:
-        return f"ReferralCount({self._value})"
+    Codes come from clients and callbacks, so interning whatever shows up
+    first could fill the registry with junk.
+    """
 
+    __slots__ = ()
 
-class LanguageCode(NonEmptyString):
     min_length = 2
     max_length = 5
+
+    @classmethod
+    def _should_intern(cls, value: str) -> bool:
+        return False
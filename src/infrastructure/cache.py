@@ -0,0 +1,67 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from src.application.interfaces.cache import UserCache
+from src.application.user.dtos import CreateUserOutputDTO
+from src.infrastructure.config import UserCacheConfig
+
+
+@dataclass(slots=True)
+class CacheStats:
+    size: int = 0
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+
+class InMemoryUserCache(UserCache):
+    """Bounded LRU cache with a per-entry TTL.
+
+    Not shared between processes: entries are only as fresh as the TTL
+    unless writers invalidate them.
+    """
+
+    def __init__(self, config: UserCacheConfig) -> None:
+        self._max_size = config.max_size
+        self._ttl = config.ttl_seconds
+        self._entries: OrderedDict[int, tuple[float, CreateUserOutputDTO]] = (
+            OrderedDict()
+        )
+        self._stats = CacheStats()
+
+    @property
+    def stats(self) -> CacheStats:
+        self._stats.size = len(self._entries)
+        return self._stats
+
+    def get(self, user_id: int) -> CreateUserOutputDTO | None:
+        entry = self._entries.get(user_id)
+        if entry is None:
+            self._stats.misses += 1
+            return None
+
+        expires_at, user = entry
+        if expires_at <= time.monotonic():
+            del self._entries[user_id]
+            self._stats.expirations += 1
+            self._stats.misses += 1
+            return None
+
+        self._entries.move_to_end(user_id)
+        self._stats.hits += 1
+        return user
+
+    def set(self, user: CreateUserOutputDTO) -> None:
+        self._entries[user.id] = (time.monotonic() + self._ttl, user)
+        self._entries.move_to_end(user.id)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self._stats.evictions += 1
+
+    def invalidate(self, user_id: int) -> None:
+        self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
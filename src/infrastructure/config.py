@@ -20,6 +20,9 @@ class PostgresConfig(BaseModel):
     max_overflow: int = 20
     pool_pre_ping: bool = True
     echo_pool: bool = False
+    # "asyncpg" runs the hottest user queries directly on the driver
+    # connection instead of through the ORM.
+    user_repository: Literal["orm", "asyncpg"] = "orm"
 
     @property
     def url(self) -> str:
@@ -114,10 +117,155 @@ class SentryConfig(BaseModel):
         return v
 
 
+class WriteBehindConfig(BaseModel):
+    flush_interval_ms: int = 1000
+    flush_batch_size: int = 500
+    max_pending: int = 10_000
+
+    @field_validator("flush_interval_ms", "flush_batch_size", "max_pending")
+    @classmethod
+    def positive_validator(cls, v: int) -> int:
+        if v <= 0:
+            raise ValueError("Value must be positive")
+        return v
+
+    @model_validator(mode="after")
+    def _batch_fits_buffer(self) -> "WriteBehindConfig":
+        if self.flush_batch_size > self.max_pending:
+            raise ValueError("flush_batch_size must not exceed max_pending")
+        return self
+
+
+class UserCacheConfig(BaseModel):
+    _CHANNEL_PATTERN: ClassVar[re.Pattern[str]] = re.compile(r"^[a-z_][a-z0-9_]{0,62}$")
+
+    max_size: int = 10_000
+    ttl_seconds: float = 60
+    # Postgres LISTEN/NOTIFY channel used to invalidate entries written by
+    # other processes. Invalidation stays process-local when not set.
+    invalidation_channel: str | None = None
+
+    @field_validator("max_size", "ttl_seconds")
+    @classmethod
+    def positive_validator(cls, v: float) -> float:
+        if v <= 0:
+            raise ValueError("Value must be positive")
+        return v
+
+    @field_validator("invalidation_channel")
+    @classmethod
+    def channel_validator(cls, v: str | None) -> str | None:
+        if v is not None and not cls._CHANNEL_PATTERN.match(v):
+            raise ValueError(
+                "invalidation_channel must be a lowercase Postgres identifier"
+            )
+        return v
+
+
+class UserLoaderConfig(BaseModel):
+    # How long to collect lookups before querying; 0 batches only the
+    # lookups made within the same event-loop tick.
+    window_ms: float = 1.0
+    max_batch_size: int = 500
+
+    @field_validator("window_ms")
+    @classmethod
+    def window_validator(cls, v: float) -> float:
+        if v < 0:
+            raise ValueError("window_ms cannot be negative")
+        return v
+
+    @field_validator("max_batch_size")
+    @classmethod
+    def positive_validator(cls, v: int) -> int:
+        if v <= 0:
+            raise ValueError("Value must be positive")
+        return v
+
+
+class LeaderboardConfig(BaseModel):
+    # Number of top referrers kept in memory. Pages reaching past them are
+    # read from the database.
+    size: int = 100
+    # Reseed from the database at least this often, which also bounds
+    # staleness when other processes write without invalidation.
+    refresh_seconds: float = 300
+
+    @field_validator("size", "refresh_seconds")
+    @classmethod
+    def positive_validator(cls, v: float) -> float:
+        if v <= 0:
+            raise ValueError("Value must be positive")
+        return v
+
+
+class ReferralRollupsConfig(BaseModel):
+    # How often new referral events are folded into the hourly and daily
+    # rollups behind the period views of admin /stats.
+    refresh_interval_seconds: float = 60
+    # Events folded per transaction; a backlog is worked off in batches.
+    batch_size: int = 10_000
+
+    @field_validator("refresh_interval_seconds", "batch_size")
+    @classmethod
+    def positive_validator(cls, v: float) -> float:
+        if v <= 0:
+            raise ValueError("Value must be positive")
+        return v
+
+
+class UsersConfig(BaseModel):
+    # Skip the upsert write while the Telegram profile is unchanged and
+    # last_login_at is younger than this. 0 refreshes it on every update.
+    last_seen_granularity_seconds: int = 60
+    # Serve repeat users from an in-process cache. Disabled when not set.
+    cache: UserCacheConfig | None = None
+    # Buffer "seen at" refreshes of cached users in-process instead of
+    # rewriting the row on every update. Disabled when not set.
+    write_behind: WriteBehindConfig | None = None
+    # Batch concurrent user lookups by id into one query. Disabled when not set.
+    loader: UserLoaderConfig | None = None
+    # Serve admin /stats from table statistics instead of counting all rows.
+    estimate_stats: bool = False
+    # Serve the top referrers from memory. Disabled when not set.
+    leaderboard: LeaderboardConfig | None = None
+    # Refresh referral rollups in the bot process. Null turns the refresh
+    # off, leaving period stats stale.
+    referral_rollups: ReferralRollupsConfig | None = ReferralRollupsConfig()
+    # Leave referral_count to the rollup refresh instead of updating the
+    # referrer's row in every signup transaction, so a viral referral link
+    # does not serialize signups on one row lock. Counts then lag by up to
+    # referral_rollups.refresh_interval_seconds. Requires referral_rollups.
+    defer_referral_counts: bool = False
+
+    @field_validator("last_seen_granularity_seconds")
+    @classmethod
+    def granularity_validator(cls, v: int) -> int:
+        if v < 0:
+            raise ValueError("last_seen_granularity_seconds cannot be negative")
+        return v
+
+    @model_validator(mode="after")
+    def _write_behind_requires_cache(self) -> "UsersConfig":
+        if self.write_behind is not None and self.cache is None:
+            raise ValueError("users.write_behind requires users.cache to be set")
+        return self
+
+    @model_validator(mode="after")
+    def _deferred_counts_require_rollups(self) -> "UsersConfig":
+        # The rollup refresh is what applies deferred counts.
+        if self.defer_referral_counts and self.referral_rollups is None:
+            raise ValueError(
+                "users.defer_referral_counts requires users.referral_rollups to be set"
+            )
+        return self
+
+
 class Config(BaseModel):
     postgres: PostgresConfig
     auth: AuthConfig
     telegram: TelegramConfig
+    users: UsersConfig = UsersConfig()
     sentry: SentryConfig | None = None
 
 
@@ -1,10 +1,21 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.infrastructure.db.repos import AdminRepositoryImpl, UserRepositoryImpl
+from src.infrastructure.db.loader import UserLoader
+from src.infrastructure.db.repos import (
+    AdminRepositoryImpl,
+    ReferralEventRepositoryImpl,
+    UserRepositoryImpl,
+)
 
 
 class HolderDao:
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(
+        self,
+        session: AsyncSession,
+        user_loader: UserLoader | None = None,
+        user_repository_cls: type[UserRepositoryImpl] = UserRepositoryImpl,
+    ) -> None:
         self.session = session
-        self.user_repo = UserRepositoryImpl(session)
+        self.user_repo = user_repository_cls(session, user_loader)
         self.admin_repo = AdminRepositoryImpl(session)
+        self.referral_event_repo = ReferralEventRepositoryImpl(session)
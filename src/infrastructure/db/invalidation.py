@@ -0,0 +1,171 @@
+import asyncio
+import contextlib
+import logging
+import uuid
+from collections.abc import Iterable
+
+import asyncpg
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.interfaces.cache import UserCache
+from src.application.interfaces.leaderboard import ReferralLeaderboard
+from src.infrastructure.config import PostgresConfig
+
+logger = logging.getLogger(__name__)
+
+# Key in AsyncSession.info holding ids of users changed in the current
+# transaction.
+CHANGED_USERS_KEY = "changed_user_ids"
+
+# Postgres rejects NOTIFY payloads of 8000 bytes or more.
+MAX_PAYLOAD_BYTES = 7900
+
+
+def mark_user_changed(session: AsyncSession, user_id: int) -> None:
+    session.info.setdefault(CHANGED_USERS_KEY, set()).add(int(user_id))
+
+
+def pop_changed_users(session: AsyncSession) -> set[int]:
+    return session.info.pop(CHANGED_USERS_KEY, set())
+
+
+def encode_payloads(origin: str, user_ids: Iterable[int]) -> list[str]:
+    """Pack ids into ``"<origin>|<id>,<id>,..."`` messages under the size limit."""
+    payloads: list[str] = []
+    prefix = f"{origin}|"
+    chunk: list[str] = []
+    size = len(prefix)
+    for user_id in sorted(set(user_ids)):
+        item = str(user_id)
+        if chunk and size + len(item) + 1 > MAX_PAYLOAD_BYTES:
+            payloads.append(prefix + ",".join(chunk))
+            chunk, size = [], len(prefix)
+        chunk.append(item)
+        size += len(item) + 1
+    if chunk:
+        payloads.append(prefix + ",".join(chunk))
+    return payloads
+
+
+def decode_payload(payload: str) -> tuple[str, list[int]]:
+    origin, _, ids = payload.partition("|")
+    return origin, [int(user_id) for user_id in ids.split(",") if user_id]
+
+
+class UserInvalidationPublisher:
+    """Turns users changed in a transaction into NOTIFY messages.
+
+    ``pg_notify`` is transactional: messages are sent on commit, dropped on
+    rollback, and one message per transaction covers all of its writes.
+    """
+
+    def __init__(self, channel: str) -> None:
+        self.channel = channel
+        # Identifies this process so its listener can skip its own messages.
+        self.origin = uuid.uuid4().hex[:12]
+
+    async def publish(self, session: AsyncSession) -> None:
+        user_ids = pop_changed_users(session)
+        for payload in encode_payloads(self.origin, user_ids):
+            await session.execute(select(func.pg_notify(self.channel, payload)))
+
+
+class UserInvalidationListener:
+    """Drops cache entries changed by other processes.
+
+    Listens on a dedicated asyncpg connection outside the pool and reconnects
+    when it is lost. The cache is cleared on every (re)connect because
+    messages sent while disconnected are not replayed. Any foreign change
+    may move a referral count, so it also invalidates the leaderboard. A
+    failing handler forces a reconnect, so the invalidation it dropped is
+    covered by the clear.
+    """
+
+    reconnect_delay = 1.0
+    max_reconnect_delay = 30.0
+
+    def __init__(
+        self,
+        postgres: PostgresConfig,
+        cache: UserCache,
+        channel: str,
+        origin: str,
+        leaderboard: ReferralLeaderboard | None = None,
+    ) -> None:
+        self._postgres = postgres
+        self._cache = cache
+        self._channel = channel
+        self._origin = origin
+        self._leaderboard = leaderboard
+        self._task: asyncio.Task[None] | None = None
+        self._lost: asyncio.Event | None = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(
+                self._run(), name="user-invalidation-listener"
+            )
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    def handle(self, payload: str) -> None:
+        origin, user_ids = decode_payload(payload)
+        if origin == self._origin:
+            return
+        for user_id in user_ids:
+            self._cache.invalidate(user_id)
+        if user_ids and self._leaderboard is not None:
+            self._leaderboard.invalidate()
+
+    def _on_notification(
+        self, _connection: asyncpg.Connection, _pid: int, _channel: str, payload: str
+    ) -> None:
+        try:
+            self.handle(payload)
+        except ValueError:
+            logger.warning("Ignoring malformed invalidation payload %r", payload)
+        except Exception:
+            logger.exception("Failed to apply user invalidation %r", payload)
+            if self._lost is not None:
+                self._lost.set()
+
+    async def _run(self) -> None:
+        delay = self.reconnect_delay
+        while True:
+            try:
+                await self._listen()
+                delay = self.reconnect_delay
+            except Exception:
+                # Only cancellation ends the listener; anything else would
+                # leave the cache stale for the rest of the process.
+                logger.exception("User invalidation listener failed")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.max_reconnect_delay)
+
+    async def _listen(self) -> None:
+        lost = self._lost = asyncio.Event()
+        connection = await asyncpg.connect(
+            host=self._postgres.host,
+            port=self._postgres.port,
+            user=self._postgres.user,
+            password=self._postgres.password,
+            database=self._postgres.db,
+        )
+        try:
+            connection.add_termination_listener(lambda _: lost.set())
+            await connection.add_listener(self._channel, self._on_notification)
+            self._cache.clear()
+            if self._leaderboard is not None:
+                self._leaderboard.invalidate()
+            logger.info("Listening for user invalidations on %r", self._channel)
+            await lost.wait()
+            logger.warning("User invalidation listener connection lost")
+        finally:
+            with contextlib.suppress(Exception):
+                await connection.close(timeout=5)
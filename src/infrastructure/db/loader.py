@@ -0,0 +1,123 @@
+import asyncio
+import logging
+from collections import Counter
+from dataclasses import dataclass, field
+
+from sqlalchemy import BIGINT, any_, literal, select
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.domain.user.entity import User
+from src.infrastructure.config import UserLoaderConfig
+from src.infrastructure.db.mappers import UserMapper
+from src.infrastructure.db.models.user import UserModel
+
+logger = logging.getLogger(__name__)
+
+# users.id is a BIGINT. A larger id (e.g. from a crafted referral code) would
+# make the whole batch's array parameter fail, so it never joins a batch.
+MAX_USER_ID = 2**63 - 1
+
+
+@dataclass(slots=True)
+class UserLoaderStats:
+    loads: int = 0
+    batches: int = 0
+    largest_batch: int = 0
+    # Number of batches per size bucket; a key is the bucket's upper bound
+    # (1, 2, 4, 8, ...).
+    batch_sizes: Counter[int] = field(default_factory=Counter)
+
+    def record(self, size: int) -> None:
+        self.batches += 1
+        self.largest_batch = max(self.largest_batch, size)
+        self.batch_sizes[1 << (size - 1).bit_length()] += 1
+
+
+class UserLoader:
+    """Coalesces concurrent user lookups by id into one ``id = ANY(...)`` query.
+
+    Lookups arriving within ``window_ms`` (or the same event-loop tick when it
+    is 0) share a batch. Batches read through their own short-lived session,
+    so they only see committed data.
+    """
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        config: UserLoaderConfig,
+    ) -> None:
+        self._session_maker = session_maker
+        self._window = config.window_ms / 1000
+        self._max_batch_size = config.max_batch_size
+        self._pending: dict[int, list[asyncio.Future[User | None]]] = {}
+        self._scheduled: asyncio.Handle | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+        self.stats = UserLoaderStats()
+
+    async def load(self, user_id: int) -> User | None:
+        if user_id > MAX_USER_ID:
+            return None
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[User | None] = loop.create_future()
+        self._pending.setdefault(user_id, []).append(future)
+        self.stats.loads += 1
+
+        if len(self._pending) >= self._max_batch_size:
+            self._dispatch()
+        elif self._scheduled is None:
+            if self._window:
+                self._scheduled = loop.call_later(self._window, self._dispatch)
+            else:
+                self._scheduled = loop.call_soon(self._dispatch)
+
+        return await future
+
+    async def close(self) -> None:
+        self._dispatch()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _dispatch(self) -> None:
+        if self._scheduled is not None:
+            self._scheduled.cancel()
+            self._scheduled = None
+        if not self._pending:
+            return
+
+        batch, self._pending = self._pending, {}
+        task = asyncio.create_task(self._resolve(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _resolve(
+        self, batch: dict[int, list[asyncio.Future[User | None]]]
+    ) -> None:
+        self.stats.record(len(batch))
+        try:
+            users = await self._fetch(list(batch))
+        except Exception as e:
+            logger.exception("Failed to load a batch of %d users", len(batch))
+            for futures in batch.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+
+        for user_id, futures in batch.items():
+            user = users.get(user_id)
+            for future in futures:
+                if not future.done():
+                    future.set_result(user)
+
+    async def _fetch(self, user_ids: list[int]) -> dict[int, User]:
+        stmt = select(UserModel).where(
+            UserModel.id == any_(literal(user_ids, ARRAY(BIGINT)))
+        )
+        async with self._session_maker() as session:
+            result = await session.execute(stmt)
+            return {
+                model.id.value: UserMapper.to_domain(model)
+                for model in result.scalars()
+            }
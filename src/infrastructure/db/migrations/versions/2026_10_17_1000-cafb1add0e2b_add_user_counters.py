@@ -0,0 +1,44 @@
+"""add_user_counters
+
+Revision ID: cafb1add0e2b
+Revises: e0b5590257d6
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "cafb1add0e2b"
+down_revision: str | Sequence[str] | None = "e0b5590257d6"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create sharded user counters and backfill them from users."""
+    op.create_table(
+        "user_counters",
+        sa.Column("name", sa.String(32), nullable=False),
+        sa.Column("shard", sa.SMALLINT(), nullable=False),
+        sa.Column("value", sa.BIGINT(), server_default="0", nullable=False),
+        sa.PrimaryKeyConstraint("name", "shard"),
+    )
+    # Users written by processes still running the previous release are not
+    # counted; the reconcile job corrects that drift after the rollout.
+    op.execute(
+        """
+        INSERT INTO user_counters (name, shard, value)
+        SELECT 'users', 0, count(*) FROM users
+        UNION ALL
+        SELECT 'referred_users', 0, count(referred_by) FROM users
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop user counters."""
+    op.drop_table("user_counters")
@@ -0,0 +1,59 @@
+"""add_referral_count_index
+
+Revision ID: 98f171e84e59
+Revises: cafb1add0e2b
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "98f171e84e59"
+down_revision: str | Sequence[str] | None = "cafb1add0e2b"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+INDEX = "ix_users_referral_count_id"
+
+
+def _drop_invalid_index() -> None:
+    # A failed concurrent build leaves an INVALID index behind, which
+    # IF NOT EXISTS would keep.
+    invalid = op.get_bind().scalar(
+        sa.text(
+            "SELECT NOT indisvalid FROM pg_index WHERE indexrelid = to_regclass(:name)"
+        ),
+        {"name": INDEX},
+    )
+    if invalid:
+        op.drop_index(INDEX, table_name="users", postgresql_concurrently=True)
+
+
+def upgrade() -> None:
+    """Index referrers for the leaderboard without blocking writes."""
+    # CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        _drop_invalid_index()
+        op.create_index(
+            INDEX,
+            "users",
+            ["referral_count", "id"],
+            postgresql_where=sa.text("referral_count > 0"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Drop the leaderboard index."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            INDEX,
+            table_name="users",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,87 @@
+"""add_referral_events
+
+Revision ID: 5a1f28178246
+Revises: 98f171e84e59
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5a1f28178246"
+down_revision: str | Sequence[str] | None = "98f171e84e59"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create the referral event log and its hourly/daily rollups."""
+    op.create_table(
+        "referral_events",
+        sa.Column("id", sa.BIGINT(), sa.Identity(), nullable=False),
+        sa.Column("referrer_id", sa.BIGINT(), nullable=False),
+        sa.Column("user_id", sa.BIGINT(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.Column(
+            "xact_id",
+            sa.BIGINT(),
+            server_default=sa.text("pg_current_xact_id()::text::bigint"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_referral_events_xact_id", "referral_events", ["xact_id"])
+    for table in ("referral_rollups_hourly", "referral_rollups_daily"):
+        op.create_table(
+            table,
+            sa.Column("bucket", sa.DateTime(timezone=True), nullable=False),
+            sa.Column("referrer_id", sa.BIGINT(), nullable=False),
+            sa.Column("referrals", sa.INTEGER(), nullable=False),
+            sa.PrimaryKeyConstraint("bucket", "referrer_id"),
+        )
+    op.create_table(
+        "rollup_watermarks",
+        sa.Column("name", sa.String(64), nullable=False),
+        sa.Column("last_xact_id", sa.BIGINT(), server_default="0", nullable=False),
+        sa.PrimaryKeyConstraint("name"),
+    )
+    # Referrals are processed right after signup, so created_at stands in
+    # for the time of past referrals. Each gets its own negative transaction
+    # id, below every real one, so the refresher folds them in batches.
+    op.execute(
+        """
+        INSERT INTO referral_events (referrer_id, user_id, created_at, xact_id)
+        SELECT
+            referred_by,
+            id,
+            created_at,
+            row_number() OVER (ORDER BY created_at, id) - count(*) OVER () - 1
+        FROM users
+        WHERE referred_by IS NOT NULL
+        ORDER BY created_at, id
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO rollup_watermarks (name, last_xact_id)
+        SELECT 'referral_events', coalesce(min(xact_id), 0) - 1
+        FROM referral_events
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop the referral event log and its rollups."""
+    op.drop_table("rollup_watermarks")
+    op.drop_table("referral_rollups_daily")
+    op.drop_table("referral_rollups_hourly")
+    op.drop_table("referral_events")
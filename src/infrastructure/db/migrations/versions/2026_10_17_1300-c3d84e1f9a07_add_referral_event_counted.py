@@ -0,0 +1,33 @@
+"""add_referral_event_counted
+
+Revision ID: c3d84e1f9a07
+Revises: 5a1f28178246
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c3d84e1f9a07"
+down_revision: str | Sequence[str] | None = "5a1f28178246"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Flag referral events whose count is left to the rollup refresh."""
+    # Existing events were counted on signup. A constant default does not
+    # rewrite the table.
+    op.add_column(
+        "referral_events",
+        sa.Column("counted", sa.Boolean(), server_default=sa.true(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    """Drop the counted flag of referral events."""
+    op.drop_column("referral_events", "counted")
@@ -0,0 +1,58 @@
+"""add_last_login_at_index
+
+Revision ID: 7b2e9c4d1f36
+Revises: c3d84e1f9a07
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7b2e9c4d1f36"
+down_revision: str | Sequence[str] | None = "c3d84e1f9a07"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+INDEX = "ix_users_last_login_at"
+
+
+def _drop_invalid_index() -> None:
+    # A failed concurrent build leaves an INVALID index behind, which
+    # IF NOT EXISTS would keep.
+    invalid = op.get_bind().scalar(
+        sa.text(
+            "SELECT NOT indisvalid FROM pg_index WHERE indexrelid = to_regclass(:name)"
+        ),
+        {"name": INDEX},
+    )
+    if invalid:
+        op.drop_index(INDEX, table_name="users", postgresql_concurrently=True)
+
+
+def upgrade() -> None:
+    """Index last_login_at for activity filters without blocking writes."""
+    # CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        _drop_invalid_index()
+        op.create_index(
+            INDEX,
+            "users",
+            ["last_login_at"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Drop the last_login_at index."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            INDEX,
+            table_name="users",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,34 @@
+"""add_user_alive_status
+
+Revision ID: 4e8a6b2d9c17
+Revises: 7b2e9c4d1f36
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4e8a6b2d9c17"
+down_revision: str | Sequence[str] | None = "7b2e9c4d1f36"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Record the outcome of the last alive check per user."""
+    # Nullable without a default: no table rewrite.
+    op.add_column("users", sa.Column("alive_status", sa.String(16), nullable=True))
+    op.add_column(
+        "users",
+        sa.Column("alive_checked_at", sa.DateTime(timezone=True), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Drop the alive check columns."""
+    op.drop_column("users", "alive_checked_at")
+    op.drop_column("users", "alive_status")
@@ -1,5 +1,17 @@
+from .counter import UserCounterModel
+from .referral import (
+    ReferralDailyRollupModel,
+    ReferralEventModel,
+    ReferralHourlyRollupModel,
+    RollupWatermarkModel,
+)
 from .user import UserModel
 
 __all__ = [
+    "ReferralDailyRollupModel",
+    "ReferralEventModel",
+    "ReferralHourlyRollupModel",
+    "RollupWatermarkModel",
+    "UserCounterModel",
     "UserModel",
 ]
@@ -0,0 +1,20 @@
+from sqlalchemy import BIGINT, SMALLINT, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import BaseORMModel
+
+# Increments for one counter are spread over this many rows so concurrent
+# transactions rarely wait on the same row lock. Readers sum every shard,
+# so the number can be changed at any time.
+COUNTER_SHARDS = 16
+
+TOTAL_USERS_COUNTER = "users"
+REFERRED_USERS_COUNTER = "referred_users"
+
+
+class UserCounterModel(BaseORMModel):
+    __tablename__ = "user_counters"
+
+    name: Mapped[str] = mapped_column(String(32), primary_key=True)
+    shard: Mapped[int] = mapped_column(SMALLINT, primary_key=True)
+    value: Mapped[int] = mapped_column(BIGINT, server_default="0")
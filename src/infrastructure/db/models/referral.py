@@ -0,0 +1,69 @@
+from datetime import datetime
+
+from sqlalchemy import (
+    BIGINT,
+    INTEGER,
+    TIMESTAMP,
+    Boolean,
+    Identity,
+    Index,
+    String,
+    func,
+    text,
+    true,
+)
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import BaseORMModel
+
+REFERRAL_EVENTS_WATERMARK = "referral_events"
+
+# Id of the inserting transaction. Ids are handed out when a transaction
+# first writes, not when it commits, so they order events by commit
+# visibility only below the oldest running transaction (snapshot xmin).
+# Events backfilled from users have negative ids, one per event.
+CURRENT_XACT_ID = text("pg_current_xact_id()::text::bigint")
+
+
+class ReferralEventModel(BaseORMModel):
+    """Append-only log of processed referrals."""
+
+    __tablename__ = "referral_events"
+    __table_args__ = (Index("ix_referral_events_xact_id", "xact_id"),)
+
+    id: Mapped[int] = mapped_column(BIGINT, Identity(), primary_key=True)
+    referrer_id: Mapped[int] = mapped_column(BIGINT)
+    user_id: Mapped[int] = mapped_column(BIGINT)
+    created_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True), server_default=func.now()
+    )
+    # False when the referrer's referral_count is left to the rollup refresh.
+    counted: Mapped[bool] = mapped_column(Boolean, server_default=true())
+    xact_id: Mapped[int] = mapped_column(BIGINT, server_default=CURRENT_XACT_ID)
+
+
+class ReferralHourlyRollupModel(BaseORMModel):
+    __tablename__ = "referral_rollups_hourly"
+
+    # Start of the UTC hour.
+    bucket: Mapped[datetime] = mapped_column(TIMESTAMP(timezone=True), primary_key=True)
+    referrer_id: Mapped[int] = mapped_column(BIGINT, primary_key=True)
+    referrals: Mapped[int] = mapped_column(INTEGER)
+
+
+class ReferralDailyRollupModel(BaseORMModel):
+    __tablename__ = "referral_rollups_daily"
+
+    # Start of the UTC day.
+    bucket: Mapped[datetime] = mapped_column(TIMESTAMP(timezone=True), primary_key=True)
+    referrer_id: Mapped[int] = mapped_column(BIGINT, primary_key=True)
+    referrals: Mapped[int] = mapped_column(INTEGER)
+
+
+class RollupWatermarkModel(BaseORMModel):
+    """Transaction id of the last events folded into the rollups."""
+
+    __tablename__ = "rollup_watermarks"
+
+    name: Mapped[str] = mapped_column(String(64), primary_key=True)
+    last_xact_id: Mapped[int] = mapped_column(BIGINT, server_default="0")
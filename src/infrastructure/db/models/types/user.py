@@ -10,6 +10,9 @@ from src.domain.user.vo import (
     Username,
 )
 
+# Values read back from the database were validated when they were written,
+# so result processing builds value objects without validating them again.
+
 
 class UserIdType(TypeDecorator):
     impl = BIGINT
@@ -29,7 +32,7 @@ class UserIdType(TypeDecorator):
     ) -> UserId | None:
         if value is None:
             return None
-        return UserId(value)
+        return UserId.trusted(value)
 
 
 class FirstNameType(TypeDecorator):
@@ -50,7 +53,7 @@ class FirstNameType(TypeDecorator):
     ) -> FirstName | None:
         if value is None:
             return None
-        return FirstName(value)
+        return FirstName.trusted(value)
 
 
 class LastNameType(TypeDecorator):
@@ -71,7 +74,7 @@ class LastNameType(TypeDecorator):
     ) -> LastName | None:
         if value is None:
             return None
-        return LastName(value)
+        return LastName.trusted(value)
 
 
 class UsernameType(TypeDecorator):
@@ -92,7 +95,7 @@ class UsernameType(TypeDecorator):
     ) -> Username | None:
         if value is None:
             return None
-        return Username(value)
+        return Username.trusted(value)
 
 
 class BioType(TypeDecorator):
@@ -111,7 +114,7 @@ class BioType(TypeDecorator):
     def process_result_value(self, value: str | None, dialect: Dialect) -> Bio | None:
         if value is None:
             return None
-        return Bio(value)
+        return Bio.trusted(value)
 
 
 class ReferralCountType(TypeDecorator):
@@ -132,7 +135,7 @@ class ReferralCountType(TypeDecorator):
     ) -> ReferralCount | None:
         if value is None:
             return None
-        return ReferralCount(value)
+        return ReferralCount.trusted(value)
 
 
 class LanguageCodeType(TypeDecorator):
@@ -153,4 +156,4 @@ class LanguageCodeType(TypeDecorator):
     ) -> LanguageCode | None:
         if value is None:
             return None
-        return LanguageCode(value)
+        return LanguageCode.trusted(value)
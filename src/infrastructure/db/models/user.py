@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import TIMESTAMP, ForeignKey, func
+from sqlalchemy import TIMESTAMP, ForeignKey, Index, String, func, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.domain.user.vo import (
@@ -27,6 +27,17 @@ from .types.user import (
 
 class UserModel(BaseORMModel):
     __tablename__ = "users"
+    __table_args__ = (
+        # Leaderboard pages walk this index by (referral_count, id).
+        Index(
+            "ix_users_referral_count_id",
+            "referral_count",
+            "id",
+            postgresql_where=text("referral_count > 0"),
+        ),
+        # Activity filter of check_alive (users seen in the last N days).
+        Index("ix_users_last_login_at", "last_login_at"),
+    )
 
     id: Mapped[UserId] = mapped_column(UserIdType, primary_key=True)
     first_name: Mapped[FirstName] = mapped_column(FirstNameType)
@@ -53,3 +64,8 @@ class UserModel(BaseORMModel):
     language_code: Mapped[LanguageCode | None] = mapped_column(
         LanguageCodeType, server_default="en", nullable=True
     )
+    # Outcome of the last admin alive check (alive, blocked or deleted).
+    alive_status: Mapped[str | None] = mapped_column(String(16), nullable=True)
+    alive_checked_at: Mapped[datetime | None] = mapped_column(
+        TIMESTAMP(timezone=True), nullable=True
+    )
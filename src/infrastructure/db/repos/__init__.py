@@ -1,7 +1,11 @@
 from .admin import AdminRepositoryImpl
+from .referral import ReferralEventRepositoryImpl
 from .user import UserRepositoryImpl
+from .user_asyncpg import AsyncpgUserRepository
 
 __all__ = [
     "AdminRepositoryImpl",
+    "AsyncpgUserRepository",
+    "ReferralEventRepositoryImpl",
     "UserRepositoryImpl",
 ]
@@ -1,20 +1,118 @@
+from array import array
+from collections.abc import AsyncIterator, Mapping
 from datetime import UTC, datetime, timedelta
 
-from sqlalchemy import select
+from sqlalchemy import (
+    BIGINT,
+    Select,
+    String,
+    cast,
+    func,
+    literal,
+    or_,
+    select,
+    type_coerce,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
 
-from src.domain.admin.repository import AdminRepository
+from src.domain.admin.repository import AdminRepository, AliveStatus
+from src.infrastructure.db.models.counter import TOTAL_USERS_COUNTER, UserCounterModel
 from src.infrastructure.db.models.user import UserModel
 from src.infrastructure.db.repos.base import BaseSQLAlchemyRepo
 
 
+def _filter_users[T: Select](
+    query: T,
+    active_since_days: int | None,
+    skip_checked_within_days: int | None,
+) -> T:
+    now = datetime.now(UTC)
+    if active_since_days is not None:
+        cutoff = now - timedelta(days=active_since_days)
+        query = query.where(UserModel.last_login_at >= cutoff)
+    if skip_checked_within_days is not None:
+        cutoff = now - timedelta(days=skip_checked_within_days)
+        query = query.where(
+            or_(
+                UserModel.alive_checked_at.is_(None),
+                UserModel.alive_checked_at < cutoff,
+            )
+        )
+    return query
+
+
 class AdminRepositoryImpl(AdminRepository, BaseSQLAlchemyRepo):
-    async def get_all_user_ids(self, active_since_days: int | None = None) -> list[int]:
-        stmt = select(UserModel.id)
+    async def count_user_ids(
+        self,
+        active_since_days: int | None = None,
+        skip_checked_within_days: int | None = None,
+    ) -> int:
+        if active_since_days is None and skip_checked_within_days is None:
+            # The sharded counter instead of counting every row.
+            query = select(cast(func.sum(UserCounterModel.value), BIGINT)).where(
+                UserCounterModel.name == TOTAL_USERS_COUNTER
+            )
+        else:
+            query = _filter_users(
+                select(func.count()).select_from(UserModel),
+                active_since_days,
+                skip_checked_within_days,
+            )
+        count = await self._session.scalar(query)
+        await self._release_if_idle()
+        return count or 0
+
+    async def iter_user_ids(
+        self,
+        active_since_days: int | None = None,
+        skip_checked_within_days: int | None = None,
+        chunk_size: int = 1000,
+    ) -> AsyncIterator[array[int]]:
+        # Plain ints straight from the driver, without UserId value objects.
+        user_id = type_coerce(UserModel.id, BIGINT)
+        query = _filter_users(
+            select(user_id).order_by(user_id).limit(chunk_size),
+            active_since_days,
+            skip_checked_within_days,
+        )
 
-        if active_since_days is not None:
-            cutoff = datetime.now(UTC) - timedelta(days=active_since_days)
-            stmt = stmt.where(UserModel.last_login_at >= cutoff)
+        # Keyset pages on the primary key: each chunk is a short indexed
+        # query, so the first one returns at once and no connection is held
+        # while the caller works through a chunk.
+        page = query
+        while True:
+            chunk = array("q", await self._session.scalars(page))
+            await self._release_if_idle()
+            if chunk:
+                yield chunk
+            if len(chunk) < chunk_size:
+                return
+            page = query.where(user_id > chunk[-1])
 
-        result = await self._session.execute(stmt)
-        # UserModel.id is a UserId value object, extract .value
-        return [row[0].value for row in result.all()]
+    async def save_alive_statuses(
+        self, statuses: Mapping[int, AliveStatus], checked_at: datetime
+    ) -> None:
+        if not statuses:
+            return
+        # One UPDATE ... FROM unnest() with two array parameters, however
+        # many users the batch holds.
+        checked = select(
+            func.unnest(literal(list(statuses), ARRAY(BIGINT))).label("id"),
+            func.unnest(literal(list(statuses.values()), ARRAY(String))).label(
+                "status"
+            ),
+        ).subquery("checked")
+        stmt = (
+            update(UserModel)
+            .where(UserModel.id == checked.c.id)
+            .values(
+                alive_status=checked.c.status,
+                alive_checked_at=checked_at,
+                # A check says nothing new about the profile itself.
+                updated_at=UserModel.updated_at,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        await self._session.execute(stmt)
+        self._mark_write()
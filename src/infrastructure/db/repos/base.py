@@ -1,6 +1,23 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
+# Key in AsyncSession.info set while the current transaction has uncommitted
+# writes.
+WRITES_PENDING_KEY = "writes_pending"
+
 
 class BaseSQLAlchemyRepo:
     def __init__(self, session: AsyncSession):
         self._session = session
+
+    def _mark_write(self) -> None:
+        self._session.info[WRITES_PENDING_KEY] = True
+
+    async def _release_if_idle(self) -> None:
+        """Return the connection to the pool after a read-only transaction.
+
+        Call once the results are consumed. Without this the connection stays
+        checked out until the request scope ends, e.g. across slow Telegram API
+        calls in a handler. Reads inside a write transaction keep it.
+        """
+        if not self._session.info.get(WRITES_PENDING_KEY):
+            await self._session.reset()
@@ -0,0 +1,168 @@
+from datetime import datetime
+
+from sqlalchemy import ColumnElement, func, select, text, update
+from sqlalchemy.dialects.postgresql import insert
+
+from src.domain.referral.repository import (
+    ReferralEventRepository,
+    ReferralPeriodStats,
+    RollupBatch,
+    RollupGranularity,
+)
+from src.domain.user.repository import TopReferrer
+from src.domain.user.vo import UserId
+from src.infrastructure.db.invalidation import mark_user_changed
+from src.infrastructure.db.models.referral import (
+    REFERRAL_EVENTS_WATERMARK,
+    ReferralDailyRollupModel,
+    ReferralEventModel,
+    ReferralHourlyRollupModel,
+    RollupWatermarkModel,
+)
+from src.infrastructure.db.models.user import UserModel
+from src.infrastructure.db.repos.base import BaseSQLAlchemyRepo
+
+# Every transaction below the snapshot xmin has finished: its events are
+# visible now and no more can appear. Folding only those lets the watermark
+# advance without locking out concurrent inserts.
+VISIBLE_XACT_HORIZON = text(
+    "SELECT pg_snapshot_xmin(pg_current_snapshot())::text::bigint"
+)
+
+ROLLUPS = {
+    "hour": ReferralHourlyRollupModel,
+    "day": ReferralDailyRollupModel,
+}
+
+
+class ReferralEventRepositoryImpl(ReferralEventRepository, BaseSQLAlchemyRepo):
+    async def add_event(
+        self, referrer_id: UserId, user_id: UserId, *, counted: bool = True
+    ) -> None:
+        stmt = insert(ReferralEventModel).values(
+            referrer_id=referrer_id.value, user_id=user_id.value, counted=counted
+        )
+        await self._session.execute(stmt)
+        self._mark_write()
+
+    async def refresh_rollups(self, batch_size: int) -> RollupBatch:
+        await self._session.execute(
+            insert(RollupWatermarkModel)
+            .values(name=REFERRAL_EVENTS_WATERMARK, last_xact_id=0)
+            .on_conflict_do_nothing()
+        )
+        self._mark_write()
+        # Concurrent refreshers queue here and continue from the new value.
+        watermark = await self._session.scalar(
+            select(RollupWatermarkModel.last_xact_id)
+            .where(RollupWatermarkModel.name == REFERRAL_EVENTS_WATERMARK)
+            .with_for_update()
+        )
+        horizon = await self._session.scalar(VISIBLE_XACT_HORIZON)
+
+        # Whole transactions only, so a batch may run over batch_size.
+        batch = (
+            select(ReferralEventModel.xact_id)
+            .where(
+                ReferralEventModel.xact_id > watermark,
+                ReferralEventModel.xact_id < horizon,
+            )
+            .order_by(ReferralEventModel.xact_id)
+            .limit(batch_size)
+            .subquery()
+        )
+        upper = await self._session.scalar(select(func.max(batch.c.xact_id)))
+        if upper is None:
+            return RollupBatch(events=0, referrer_ids=[])
+        in_batch = (
+            ReferralEventModel.xact_id > watermark,
+            ReferralEventModel.xact_id <= upper,
+        )
+        folded = await self._session.scalar(select(func.count()).where(*in_batch))
+
+        for unit, model in ROLLUPS.items():
+            bucket = func.date_trunc(unit, ReferralEventModel.created_at, "UTC")
+            events = (
+                select(
+                    bucket.label("bucket"),
+                    ReferralEventModel.referrer_id,
+                    func.count(),
+                )
+                .where(*in_batch)
+                .group_by("bucket", ReferralEventModel.referrer_id)
+            )
+            stmt = insert(model).from_select(
+                ["bucket", "referrer_id", "referrals"], events
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[model.bucket, model.referrer_id],
+                set_={"referrals": model.referrals + stmt.excluded.referrals},
+            )
+            await self._session.execute(stmt)
+
+        referrer_ids = await self._apply_deferred_counts(in_batch)
+        await self._session.execute(
+            update(RollupWatermarkModel)
+            .where(RollupWatermarkModel.name == REFERRAL_EVENTS_WATERMARK)
+            .values(last_xact_id=upper)
+        )
+        return RollupBatch(events=folded, referrer_ids=referrer_ids)
+
+    async def _apply_deferred_counts(
+        self, in_batch: tuple[ColumnElement[bool], ...]
+    ) -> list[int]:
+        # One update per referrer per batch instead of one per referral.
+        deltas = (
+            select(ReferralEventModel.referrer_id, func.count().label("referrals"))
+            .where(*in_batch, ReferralEventModel.counted.is_(False))
+            .group_by(ReferralEventModel.referrer_id)
+            .subquery("deltas")
+        )
+        stmt = (
+            update(UserModel)
+            .where(UserModel.id == deltas.c.referrer_id)
+            .values(referral_count=UserModel.referral_count + deltas.c.referrals)
+            .returning(UserModel.id)
+            .execution_options(synchronize_session=False)
+        )
+        referrer_ids = [user_id.value for user_id in await self._session.scalars(stmt)]
+        for referrer_id in referrer_ids:
+            mark_user_changed(self._session, referrer_id)
+        return referrer_ids
+
+    async def get_period_stats(
+        self, since: datetime, granularity: RollupGranularity, limit: int = 5
+    ) -> ReferralPeriodStats:
+        # Reads only the buckets of the period, however long the history is.
+        model = ROLLUPS[granularity]
+        referrals = await self._session.scalar(
+            select(func.coalesce(func.sum(model.referrals), 0)).where(
+                model.bucket >= since
+            )
+        )
+
+        total = func.sum(model.referrals).label("total")
+        query = (
+            select(UserModel.id, UserModel.username, UserModel.first_name, total)
+            .select_from(model)
+            .join(UserModel, UserModel.id == model.referrer_id)
+            .where(model.bucket >= since)
+            .group_by(UserModel.id)
+            .order_by(total.desc(), UserModel.id.desc())
+            .limit(limit)
+        )
+        rows = (await self._session.execute(query)).all()
+        await self._release_if_idle()
+
+        return ReferralPeriodStats(
+            referrals=referrals,
+            top_referrers=[
+                TopReferrer(
+                    user_id=user_id.value,
+                    username=username.value if username else None,
+                    first_name=first_name.value,
+                    referral_count=count,
+                )
+                for user_id, username, first_name, count in rows
+            ],
+        )
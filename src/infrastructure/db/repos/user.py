@@ -1,16 +1,119 @@
-from sqlalchemy import func, select, update
-from sqlalchemy.dialects.postgresql import insert
+from datetime import datetime, timedelta
+
+from sqlalchemy import (
+    BIGINT,
+    TIMESTAMP,
+    Row,
+    cast,
+    delete,
+    func,
+    literal,
+    or_,
+    select,
+    text,
+    tuple_,
+    union_all,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.user.entity import User
-from src.domain.user.repository import ReferralStats, TopReferrer, UserRepository
+from src.domain.user.repository import (
+    ReferralStats,
+    ReferralStatsDrift,
+    TopReferrer,
+    TopReferrerCursor,
+    UserRepository,
+)
 from src.domain.user.vo import LanguageCode, UserId, Username
+from src.infrastructure.db.invalidation import mark_user_changed
+from src.infrastructure.db.loader import UserLoader
 from src.infrastructure.db.mappers import UserMapper
+from src.infrastructure.db.models.counter import (
+    COUNTER_SHARDS,
+    REFERRED_USERS_COUNTER,
+    TOTAL_USERS_COUNTER,
+    UserCounterModel,
+)
 from src.infrastructure.db.models.user import UserModel
-from src.infrastructure.db.repos.base import BaseSQLAlchemyRepo
+from src.infrastructure.db.repos.base import WRITES_PENDING_KEY, BaseSQLAlchemyRepo
+
+# Row count and the share of non-null referred_by from the planner
+# statistics kept up to date by (auto)analyze.
+ESTIMATE_REFERRAL_STATS = """
+SELECT c.reltuples, s.null_frac
+FROM pg_class c
+LEFT JOIN pg_stats s
+    ON s.schemaname = c.relnamespace::regnamespace::name
+    AND s.tablename = c.relname
+    AND s.attname = 'referred_by'
+WHERE c.oid = to_regclass('users')
+"""
+
+# Blocks counter increments, but not reads or user writes, until commit.
+LOCK_COUNTERS = "LOCK TABLE user_counters IN SHARE ROW EXCLUSIVE MODE"
+
+
+def estimate_referral_stats(row: Row | tuple | None) -> ReferralStats | None:
+    """Build estimated stats, or None if the table has not been analyzed."""
+    if row is None:
+        return None
+    reltuples, null_frac = row
+    if reltuples is None or reltuples < 0 or null_frac is None:
+        return None
+
+    total = round(reltuples)
+    referred = round(total * (1 - null_frac))
+    return ReferralStats(
+        total_users=total,
+        referred_count=referred,
+        organic_count=total - referred,
+        is_estimate=True,
+    )
+
+
+def counters_to_stats(counters: dict[str, int]) -> ReferralStats:
+    total = counters.get(TOTAL_USERS_COUNTER, 0)
+    referred = counters.get(REFERRED_USERS_COUNTER, 0)
+    return ReferralStats(
+        total_users=total,
+        referred_count=referred,
+        organic_count=total - referred,
+    )
 
 
 class UserRepositoryImpl(UserRepository, BaseSQLAlchemyRepo):
+    def __init__(
+        self, session: AsyncSession, user_loader: UserLoader | None = None
+    ) -> None:
+        BaseSQLAlchemyRepo.__init__(self, session)
+        self._user_loader = user_loader
+
+    def _can_batch(self, identifier: UserId | Username) -> bool:
+        # The loader reads committed data only, so lookups inside a write
+        # transaction go through the session.
+        return (
+            isinstance(identifier, UserId)
+            and self._user_loader is not None
+            and not self._session.info.get(WRITES_PENDING_KEY)
+        )
+
+    async def _increment_counter(self, name: str, user_id: int) -> None:
+        # Sharding by user id keeps concurrent signups off a single row.
+        stmt = insert(UserCounterModel).values(
+            name=name, shard=user_id % COUNTER_SHARDS, value=1
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[UserCounterModel.name, UserCounterModel.shard],
+            set_={"value": UserCounterModel.value + stmt.excluded.value},
+        )
+        await self._session.execute(stmt)
+
     async def get_user(self, identifier: UserId | Username) -> User | None:
+        if self._can_batch(identifier):
+            return await self._user_loader.load(identifier.value)
+
         if isinstance(identifier, UserId):
             stmt = select(UserModel).where(UserModel.id == identifier)
         else:  # by == "username"
@@ -19,6 +122,7 @@ class UserRepositoryImpl(UserRepository, BaseSQLAlchemyRepo):
         result = await self._session.execute(stmt)
 
         user_model = result.scalars().first()
+        await self._release_if_idle()
 
         return UserMapper.to_domain(user_model) if user_model else None
 
@@ -38,7 +142,9 @@ class UserRepositoryImpl(UserRepository, BaseSQLAlchemyRepo):
         )
 
         result = await self._session.execute(stmt)
+        self._mark_write()
         orm_model = result.scalar_one()
+        await self._increment_counter(TOTAL_USERS_COUNTER, user.id.value)
         return UserMapper.to_domain(orm_model)
 
     async def update_user(self, user: User) -> User:
@@ -55,54 +161,205 @@ class UserRepositoryImpl(UserRepository, BaseSQLAlchemyRepo):
             .returning(UserModel)
         )
         result = await self._session.execute(stmt)
+        self._mark_write()
         orm_model = result.scalar_one()
+        mark_user_changed(self._session, user.id.value)
         return UserMapper.to_domain(orm_model)
 
+    async def upsert_user(
+        self, user: User, last_seen_granularity: timedelta = timedelta(0)
+    ) -> User:
+        table = UserModel.__table__
+        stmt = insert(UserModel).values(
+            id=user.id.value,
+            username=user.username.value if user.username else None,
+            first_name=user.first_name.value,
+            last_name=user.last_name.value if user.last_name else None,
+            created_at=user.created_at,
+            updated_at=user.updated_at,
+            last_login_at=user.last_login_at,
+        )
+        # Only Telegram profile fields and timestamps are refreshed on conflict;
+        # created_at stays untouched, which keeps `User.is_new` accurate.
+        # The update is skipped entirely when nothing changed and last_login_at
+        # is still fresh. A row that is still "new" is always touched, so that
+        # is_new is reported for the first update only.
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.id],
+            set_={
+                "username": stmt.excluded.username,
+                "first_name": stmt.excluded.first_name,
+                "last_name": stmt.excluded.last_name,
+                "updated_at": stmt.excluded.updated_at,
+                "last_login_at": stmt.excluded.last_login_at,
+            },
+            where=or_(
+                table.c.username.is_distinct_from(stmt.excluded.username),
+                table.c.first_name.is_distinct_from(stmt.excluded.first_name),
+                table.c.last_name.is_distinct_from(stmt.excluded.last_name),
+                table.c.last_login_at == table.c.created_at,
+                table.c.last_login_at
+                <= stmt.excluded.last_login_at - last_seen_granularity,
+            ),
+        )
+        upserted = stmt.returning(*table.c).cte("upserted")
+        # A skipped update returns no row, so fall back to the stored one
+        # within the same statement.
+        unchanged = select(table).where(
+            table.c.id == user.id.value,
+            ~select(upserted.c.id).exists(),
+        )
+        query = (
+            select(UserModel)
+            .from_statement(union_all(select(upserted), unchanged))
+            .execution_options(populate_existing=True)
+        )
+
+        result = await self._session.execute(query)
+        self._mark_write()
+        upserted = UserMapper.to_domain(result.scalar_one())
+        if upserted.is_new:
+            await self._increment_counter(TOTAL_USERS_COUNTER, user.id.value)
+        return upserted
+
+    async def update_last_seen(self, last_seen: dict[int, datetime]) -> None:
+        if not last_seen:
+            return
+
+        seen = select(
+            func.unnest(literal(list(last_seen), ARRAY(BIGINT))).label("id"),
+            func.unnest(
+                literal(list(last_seen.values()), ARRAY(TIMESTAMP(timezone=True)))
+            ).label("seen_at"),
+        ).subquery("seen")
+        stmt = (
+            update(UserModel)
+            .where(
+                UserModel.id == seen.c.id,
+                # Never move last_login_at backwards if a write-through
+                # already stored a newer value.
+                UserModel.last_login_at < seen.c.seen_at,
+            )
+            .values(last_login_at=seen.c.seen_at, updated_at=seen.c.seen_at)
+            .execution_options(synchronize_session=False)
+        )
+        await self._session.execute(stmt)
+        self._mark_write()
+
     async def delete_user(self, user_id: UserId) -> None:
         raise NotImplementedError
 
     async def set_referred_by(self, user_id: UserId, referrer_id: UserId) -> None:
+        # The locked subquery yields the value being replaced, so the referred
+        # counter only moves when a user gets their first referrer.
+        previous = (
+            select(UserModel.id, UserModel.referred_by)
+            .where(UserModel.id == user_id)
+            .with_for_update()
+            .subquery("previous")
+        )
         stmt = (
             update(UserModel)
-            .where(UserModel.id == user_id)
+            .where(UserModel.id == previous.c.id)
             .values(referred_by=referrer_id)
+            .returning(previous.c.referred_by)
+            .execution_options(synchronize_session=False)
         )
-        await self._session.execute(stmt)
+        row = (await self._session.execute(stmt)).first()
+        self._mark_write()
+        mark_user_changed(self._session, user_id.value)
+        if row is not None and row.referred_by is None:
+            await self._increment_counter(REFERRED_USERS_COUNTER, user_id.value)
 
-    async def increment_referral_count(self, user_id: UserId) -> None:
+    async def increment_referral_count(self, user_id: UserId) -> int | None:
         stmt = (
             update(UserModel)
             .where(UserModel.id == user_id)
             .values(referral_count=UserModel.referral_count + 1)
+            .returning(UserModel.referral_count)
         )
-        await self._session.execute(stmt)
+        referral_count = (await self._session.execute(stmt)).scalar_one_or_none()
+        self._mark_write()
+        mark_user_changed(self._session, user_id.value)
+        return referral_count.value if referral_count is not None else None
 
-    async def get_referral_stats(self) -> ReferralStats:
-        total_query = select(func.count()).select_from(UserModel)
-        referred_query = (
-            select(func.count())
-            .select_from(UserModel)
-            .where(UserModel.referred_by.isnot(None))
-        )
+    async def get_referral_stats(self, estimate: bool = False) -> ReferralStats:
+        if estimate:
+            row = (await self._session.execute(text(ESTIMATE_REFERRAL_STATS))).first()
+            stats = estimate_referral_stats(row)
+            if stats is not None:
+                await self._release_if_idle()
+                return stats
 
-        total = (await self._session.execute(total_query)).scalar() or 0
-        referred = (await self._session.execute(referred_query)).scalar() or 0
+        stats = counters_to_stats(await self._read_counters())
+        await self._release_if_idle()
+        return stats
 
-        return ReferralStats(
-            total_users=total,
-            referred_count=referred,
-            organic_count=total - referred,
+    async def reconcile_referral_stats(self) -> ReferralStatsDrift:
+        # Transactions that already counted their user commit before the
+        # lock is granted and are included in the recount. The rest wait
+        # and add their increment on top of the rewritten value.
+        await self._session.execute(text(LOCK_COUNTERS))
+        maintained = counters_to_stats(await self._read_counters())
+
+        query = select(
+            func.count(),
+            func.count().filter(UserModel.referred_by.isnot(None)),
+        ).select_from(UserModel)
+        total, referred = (await self._session.execute(query)).one()
+
+        await self._session.execute(delete(UserCounterModel))
+        await self._session.execute(
+            insert(UserCounterModel).values(
+                [
+                    {"name": TOTAL_USERS_COUNTER, "shard": 0, "value": total},
+                    {"name": REFERRED_USERS_COUNTER, "shard": 0, "value": referred},
+                ]
+            )
         )
+        self._mark_write()
 
-    async def get_top_referrers(self, limit: int = 10) -> list[TopReferrer]:
-        query = (
-            select(UserModel)
-            .where(UserModel.referral_count > 0)
-            .order_by(UserModel.referral_count.desc())
-            .limit(limit)
+        return ReferralStatsDrift(
+            stats=ReferralStats(
+                total_users=total,
+                referred_count=referred,
+                organic_count=total - referred,
+            ),
+            total_users=total - maintained.total_users,
+            referred_count=referred - maintained.referred_count,
         )
-        result = await self._session.execute(query)
+
+    async def _read_counters(self) -> dict[str, int]:
+        query = select(
+            UserCounterModel.name, cast(func.sum(UserCounterModel.value), BIGINT)
+        ).group_by(UserCounterModel.name)
+        return dict((await self._session.execute(query)).tuples().all())
+
+    async def get_top_referrers(
+        self,
+        limit: int = 10,
+        after: TopReferrerCursor | None = None,
+        before: TopReferrerCursor | None = None,
+    ) -> list[TopReferrer]:
+        # Served by the partial ix_users_referral_count_id index: a keyset
+        # page reads only `limit` entries however deep it is.
+        key = tuple_(UserModel.referral_count, UserModel.id)
+        query = select(UserModel).where(UserModel.referral_count > 0)
+        if before is not None:
+            # Walk the index upwards from the cursor, then flip the page.
+            query = query.where(
+                key > tuple_(before.referral_count, before.user_id)
+            ).order_by(UserModel.referral_count, UserModel.id)
+        else:
+            if after is not None:
+                query = query.where(key < tuple_(after.referral_count, after.user_id))
+            query = query.order_by(UserModel.referral_count.desc(), UserModel.id.desc())
+
+        result = await self._session.execute(query.limit(limit))
         users = result.scalars().all()
+        await self._release_if_idle()
+        if before is not None:
+            users.reverse()
 
         return [
             TopReferrer(
@@ -116,10 +373,15 @@ class UserRepositoryImpl(UserRepository, BaseSQLAlchemyRepo):
 
     async def update_language(
         self, user_id: UserId, language_code: LanguageCode
-    ) -> None:
+    ) -> User | None:
         stmt = (
             update(UserModel)
             .where(UserModel.id == user_id)
             .values(language_code=language_code)
+            .returning(UserModel)
         )
-        await self._session.execute(stmt)
+        result = await self._session.execute(stmt)
+        self._mark_write()
+        mark_user_changed(self._session, user_id.value)
+        orm_model = result.scalar_one_or_none()
+        return UserMapper.to_domain(orm_model) if orm_model else None
@@ -0,0 +1,251 @@
+from collections.abc import Sequence
+from datetime import timedelta
+
+from src.domain.user.entity import User
+from src.domain.user.repository import ReferralStats, TopReferrer, TopReferrerCursor
+from src.domain.user.vo import (
+    Bio,
+    FirstName,
+    LanguageCode,
+    LastName,
+    ReferralCount,
+    UserId,
+    Username,
+)
+from src.infrastructure.db.invalidation import mark_user_changed
+from src.infrastructure.db.models.counter import (
+    COUNTER_SHARDS,
+    REFERRED_USERS_COUNTER,
+    TOTAL_USERS_COUNTER,
+)
+from src.infrastructure.db.repos.user import (
+    ESTIMATE_REFERRAL_STATS,
+    UserRepositoryImpl,
+    counters_to_stats,
+    estimate_referral_stats,
+)
+
+USER_COLUMNS = (
+    "id, first_name, last_name, username, bio, created_at, updated_at, "
+    "last_login_at, referred_by, referral_count, language_code"
+)
+
+GET_BY_ID = f"SELECT {USER_COLUMNS} FROM users WHERE id = $1"  # noqa: S608
+GET_BY_USERNAME = f"SELECT {USER_COLUMNS} FROM users WHERE username = $1"  # noqa: S608
+
+# Same semantics as UserRepositoryImpl.upsert_user: skip the update while
+# the profile is unchanged and last_login_at is fresh, and fall back to the
+# stored row within the same statement.
+UPSERT = f"""
+WITH upserted AS (
+    INSERT INTO users AS u (
+        id, username, first_name, last_name, created_at, updated_at, last_login_at
+    )
+    VALUES ($1, $2, $3, $4, $5, $6, $7)
+    ON CONFLICT (id) DO UPDATE SET
+        username = excluded.username,
+        first_name = excluded.first_name,
+        last_name = excluded.last_name,
+        updated_at = excluded.updated_at,
+        last_login_at = excluded.last_login_at
+    WHERE u.username IS DISTINCT FROM excluded.username
+        OR u.first_name IS DISTINCT FROM excluded.first_name
+        OR u.last_name IS DISTINCT FROM excluded.last_name
+        OR u.last_login_at = u.created_at
+        OR u.last_login_at <= excluded.last_login_at - $8::interval
+    RETURNING {USER_COLUMNS}
+)
+SELECT {USER_COLUMNS} FROM upserted
+UNION ALL
+SELECT {USER_COLUMNS} FROM users
+WHERE id = $1 AND NOT EXISTS (SELECT 1 FROM upserted)
+"""  # noqa: S608
+
+UPDATE_LANGUAGE = (
+    f"UPDATE users SET language_code = $2 WHERE id = $1 RETURNING {USER_COLUMNS}"  # noqa: S608
+)
+SET_REFERRED_BY = """
+UPDATE users SET referred_by = $2
+FROM (SELECT id, referred_by FROM users WHERE id = $1 FOR UPDATE) AS previous
+WHERE users.id = previous.id
+RETURNING previous.referred_by
+"""
+INCREMENT_REFERRAL_COUNT = (
+    "UPDATE users SET referral_count = referral_count + 1 WHERE id = $1"
+    " RETURNING referral_count"
+)
+INCREMENT_COUNTER = """
+INSERT INTO user_counters AS c (name, shard, value) VALUES ($1, $2, 1)
+ON CONFLICT (name, shard) DO UPDATE SET value = c.value + excluded.value
+"""
+READ_COUNTERS = "SELECT name, sum(value)::bigint FROM user_counters GROUP BY name"
+TOP_REFERRERS = """
+SELECT id, username, first_name, referral_count FROM users
+WHERE referral_count > 0
+ORDER BY referral_count DESC, id DESC
+LIMIT $1
+"""
+TOP_REFERRERS_AFTER = """
+SELECT id, username, first_name, referral_count FROM users
+WHERE referral_count > 0 AND (referral_count, id) < ($2, $3)
+ORDER BY referral_count DESC, id DESC
+LIMIT $1
+"""
+# Ascending from the cursor; the caller reverses the page.
+TOP_REFERRERS_BEFORE = """
+SELECT id, username, first_name, referral_count FROM users
+WHERE referral_count > 0 AND (referral_count, id) > ($2, $3)
+ORDER BY referral_count, id
+LIMIT $1
+"""
+
+
+def record_to_user(record: Sequence) -> User:
+    (
+        user_id,
+        first_name,
+        last_name,
+        username,
+        bio,
+        created_at,
+        updated_at,
+        last_login_at,
+        referred_by,
+        referral_count,
+        language_code,
+    ) = record
+    return User(
+        id=UserId.trusted(user_id),
+        first_name=FirstName.trusted(first_name),
+        last_name=LastName.trusted(last_name) if last_name is not None else None,
+        username=Username.trusted(username) if username is not None else None,
+        bio=Bio.trusted(bio) if bio is not None else None,
+        created_at=created_at,
+        updated_at=updated_at,
+        last_login_at=last_login_at,
+        referred_by=UserId.trusted(referred_by) if referred_by is not None else None,
+        referral_count=ReferralCount.trusted(referral_count),
+        language_code=LanguageCode.trusted(language_code) if language_code else None,
+    )
+
+
+class AsyncpgUserRepository(UserRepositoryImpl):
+    """UserRepository running the hot queries directly on asyncpg.
+
+    Statements run on the driver connection underneath the session, so they
+    share its transaction and are committed by the TransactionManager. The
+    first statement of a transaction goes through the session's connection,
+    which sends the lazy BEGIN with it. asyncpg prepares and caches each statement per connection. Rows become
+    entities without the ORM identity map, TypeDecorators or UserMapper.
+    Methods not overridden here use the ORM implementation.
+    """
+
+    async def _fetch(self, query: str, *args: object) -> Sequence[Sequence]:
+        connection = await self._session.connection()
+        driver = (await connection.get_raw_connection()).driver_connection
+        if driver.is_in_transaction():
+            return await driver.fetch(query, *args)
+        # The SQLAlchemy adapter issues BEGIN lazily on its first statement.
+        # Send this one through it so raw statements never run in autocommit
+        # and the session still owns the transaction.
+        result = await connection.exec_driver_sql(query, args)
+        return result.all() if result.returns_rows else []
+
+    async def _fetchrow(self, query: str, *args: object) -> Sequence | None:
+        records = await self._fetch(query, *args)
+        return records[0] if records else None
+
+    async def _increment_counter(self, name: str, user_id: int) -> None:
+        await self._fetch(INCREMENT_COUNTER, name, user_id % COUNTER_SHARDS)
+
+    async def get_user(self, identifier: UserId | Username) -> User | None:
+        if self._can_batch(identifier):
+            return await self._user_loader.load(identifier.value)
+
+        query = GET_BY_ID if isinstance(identifier, UserId) else GET_BY_USERNAME
+        record = await self._fetchrow(query, identifier.value)
+        await self._release_if_idle()
+        return record_to_user(record) if record else None
+
+    async def upsert_user(
+        self, user: User, last_seen_granularity: timedelta = timedelta(0)
+    ) -> User:
+        record = await self._fetchrow(
+            UPSERT,
+            user.id.value,
+            user.username.value if user.username else None,
+            user.first_name.value,
+            user.last_name.value if user.last_name else None,
+            user.created_at,
+            user.updated_at,
+            user.last_login_at,
+            last_seen_granularity,
+        )
+        self._mark_write()
+        upserted = record_to_user(record)
+        if upserted.is_new:
+            await self._increment_counter(TOTAL_USERS_COUNTER, user.id.value)
+        return upserted
+
+    async def update_language(
+        self, user_id: UserId, language_code: LanguageCode
+    ) -> User | None:
+        record = await self._fetchrow(
+            UPDATE_LANGUAGE, user_id.value, language_code.value
+        )
+        self._mark_write()
+        mark_user_changed(self._session, user_id.value)
+        return record_to_user(record) if record else None
+
+    async def set_referred_by(self, user_id: UserId, referrer_id: UserId) -> None:
+        record = await self._fetchrow(SET_REFERRED_BY, user_id.value, referrer_id.value)
+        self._mark_write()
+        mark_user_changed(self._session, user_id.value)
+        if record is not None and record[0] is None:
+            await self._increment_counter(REFERRED_USERS_COUNTER, user_id.value)
+
+    async def increment_referral_count(self, user_id: UserId) -> int | None:
+        record = await self._fetchrow(INCREMENT_REFERRAL_COUNT, user_id.value)
+        self._mark_write()
+        mark_user_changed(self._session, user_id.value)
+        return record[0] if record else None
+
+    async def get_referral_stats(self, estimate: bool = False) -> ReferralStats:
+        if estimate:
+            row = await self._fetchrow(ESTIMATE_REFERRAL_STATS)
+            stats = estimate_referral_stats(row)
+            if stats is not None:
+                await self._release_if_idle()
+                return stats
+
+        records = await self._fetch(READ_COUNTERS)
+        await self._release_if_idle()
+        return counters_to_stats(dict(records))
+
+    async def get_top_referrers(
+        self,
+        limit: int = 10,
+        after: TopReferrerCursor | None = None,
+        before: TopReferrerCursor | None = None,
+    ) -> list[TopReferrer]:
+        if before is not None:
+            records = await self._fetch(
+                TOP_REFERRERS_BEFORE, limit, before.referral_count, before.user_id
+            )
+            records = records[::-1]
+        elif after is not None:
+            records = await self._fetch(
+                TOP_REFERRERS_AFTER, limit, after.referral_count, after.user_id
+            )
+        else:
+            records = await self._fetch(TOP_REFERRERS, limit)
+        await self._release_if_idle()
+        return [
+            TopReferrer(
+                user_id=user_id,
+                username=username,
+                first_name=first_name,
+                referral_count=referral_count,
+            )
+            for user_id, username, first_name, referral_count in records
+        ]
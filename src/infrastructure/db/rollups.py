@@ -0,0 +1,103 @@
+import asyncio
+import contextlib
+import logging
+from dataclasses import dataclass
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.application.interfaces.cache import UserCache
+from src.application.interfaces.leaderboard import ReferralLeaderboard
+from src.infrastructure.config import ReferralRollupsConfig
+from src.infrastructure.db.invalidation import UserInvalidationPublisher
+from src.infrastructure.db.repos import ReferralEventRepositoryImpl
+from src.infrastructure.db.transaction import TransactionManagerImpl
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class RollupRefreshStats:
+    refreshes: int = 0
+    folded: int = 0
+    # Referrers whose deferred referral counts were applied.
+    recounted: int = 0
+    failures: int = 0
+
+
+class ReferralRollupRefresher:
+    """Periodically folds new referral events into the rollup tables.
+
+    Each refresh works off the whole backlog in ``batch_size`` transactions.
+    Refreshers in several processes are safe: they serialize on the
+    watermark row. Referral counts deferred to the refresh are applied in
+    the same transactions, so cached referrers and the leaderboard are
+    invalidated afterwards.
+    """
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        config: ReferralRollupsConfig,
+        *,
+        publisher: UserInvalidationPublisher | None = None,
+        user_cache: UserCache | None = None,
+        leaderboard: ReferralLeaderboard | None = None,
+    ) -> None:
+        self._session_maker = session_maker
+        self._config = config
+        self._publisher = publisher
+        self._user_cache = user_cache
+        self._leaderboard = leaderboard
+        self._task: asyncio.Task[None] | None = None
+        self.stats = RollupRefreshStats()
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(
+                self._run(), name="referral-rollup-refresher"
+            )
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def refresh(self) -> int:
+        folded = 0
+        while True:
+            async with self._session_maker() as session:
+                batch = await ReferralEventRepositoryImpl(session).refresh_rollups(
+                    self._config.batch_size
+                )
+                await TransactionManagerImpl(session, self._publisher).commit()
+            self._invalidate(batch.referrer_ids)
+            folded += batch.events
+            if batch.events < self._config.batch_size:
+                break
+
+        self.stats.refreshes += 1
+        self.stats.folded += folded
+        if folded:
+            logger.debug("Folded %d referral events into rollups", folded)
+        return folded
+
+    def _invalidate(self, referrer_ids: list[int]) -> None:
+        if not referrer_ids:
+            return
+        self.stats.recounted += len(referrer_ids)
+        if self._user_cache is not None:
+            for referrer_id in referrer_ids:
+                self._user_cache.invalidate(referrer_id)
+        if self._leaderboard is not None:
+            self._leaderboard.invalidate()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except Exception:
+                self.stats.failures += 1
+                logger.exception("Failed to refresh referral rollups")
+            await asyncio.sleep(self._config.refresh_interval_seconds)
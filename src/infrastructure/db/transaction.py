@@ -1,17 +1,34 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.application.common.transaction import TransactionManager
+from src.infrastructure.db.invalidation import (
+    UserInvalidationPublisher,
+    pop_changed_users,
+)
+from src.infrastructure.db.repos.base import WRITES_PENDING_KEY
 
 
 class TransactionManagerImpl(TransactionManager):
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(
+        self,
+        session: AsyncSession,
+        invalidation_publisher: UserInvalidationPublisher | None = None,
+    ) -> None:
         self.session = session
+        self.invalidation_publisher = invalidation_publisher
 
     async def commit(self) -> None:
+        if self.invalidation_publisher is not None:
+            await self.invalidation_publisher.publish(self.session)
+        else:
+            pop_changed_users(self.session)
         await self.session.commit()
+        self.session.info.pop(WRITES_PENDING_KEY, None)
 
     async def flush(self) -> None:
         await self.session.flush()
 
     async def rollback(self) -> None:
+        pop_changed_users(self.session)
         await self.session.rollback()
+        self.session.info.pop(WRITES_PENDING_KEY, None)
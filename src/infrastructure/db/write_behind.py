@@ -0,0 +1,123 @@
+import asyncio
+import contextlib
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.application.interfaces.activity import UserActivityBuffer
+from src.infrastructure.config import WriteBehindConfig
+from src.infrastructure.db.repos import UserRepositoryImpl
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class WriteBehindStats:
+    pending: int = 0
+    recorded: int = 0
+    rejected: int = 0
+    flushed: int = 0
+    flush_failures: int = 0
+    # Age of the oldest unflushed "seen at" event, in seconds.
+    lag_seconds: float = 0.0
+
+
+class LastSeenWriteBehind(UserActivityBuffer):
+    """Collects last_login_at refreshes and flushes them as one bulk UPDATE.
+
+    A flush happens every ``flush_interval_ms`` or as soon as
+    ``flush_batch_size`` users are pending, and once more on ``stop()``.
+    """
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        config: WriteBehindConfig,
+    ) -> None:
+        self._session_maker = session_maker
+        self._config = config
+        self._pending: dict[int, datetime] = {}
+        self._oldest_pending_at: float | None = None
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self._stats = WriteBehindStats()
+
+    @property
+    def stats(self) -> WriteBehindStats:
+        self._stats.pending = len(self._pending)
+        self._stats.lag_seconds = (
+            time.monotonic() - self._oldest_pending_at
+            if self._oldest_pending_at is not None
+            else 0.0
+        )
+        return self._stats
+
+    def record_seen(self, user_id: int, seen_at: datetime) -> bool:
+        if user_id not in self._pending and len(self._pending) >= (
+            self._config.max_pending
+        ):
+            self._stats.rejected += 1
+            return False
+
+        self._pending[user_id] = seen_at
+        self._stats.recorded += 1
+        if self._oldest_pending_at is None:
+            self._oldest_pending_at = time.monotonic()
+        if len(self._pending) >= self._config.flush_batch_size:
+            self._wakeup.set()
+        return True
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="last-seen-flusher")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        await self.flush()
+
+    async def flush(self) -> None:
+        if not self._pending:
+            return
+
+        batch, self._pending = self._pending, {}
+        self._oldest_pending_at = None
+        try:
+            async with self._session_maker() as session:
+                await UserRepositoryImpl(session).update_last_seen(batch)
+                await session.commit()
+        except Exception:
+            self._stats.flush_failures += 1
+            logger.exception("Failed to flush %d last-seen updates", len(batch))
+            self._requeue(batch)
+            return
+
+        self._stats.flushed += len(batch)
+        logger.debug(
+            "Flushed %d last-seen updates, %d pending", len(batch), len(self._pending)
+        )
+
+    def _requeue(self, batch: dict[int, datetime]) -> None:
+        """Put a failed batch back, keeping newer events and the size bound."""
+        for user_id, seen_at in batch.items():
+            if user_id in self._pending:
+                continue
+            if len(self._pending) >= self._config.max_pending:
+                break
+            self._pending[user_id] = seen_at
+        if self._pending and self._oldest_pending_at is None:
+            self._oldest_pending_at = time.monotonic()
+
+    async def _run(self) -> None:
+        interval = self._config.flush_interval_ms / 1000
+        while True:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout=interval)
+            self._wakeup.clear()
+            await self.flush()
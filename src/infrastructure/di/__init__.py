@@ -1,11 +1,13 @@
 from src.infrastructure.i18n import I18nProvider
 
 from .auth import AuthProvider
+from .cache import CacheProvider
 from .db import DBProvider
 from .interactors import interactor_providers
 
 infra_providers = [
     AuthProvider(),
+    CacheProvider(),
     I18nProvider(),
     DBProvider(),
 ]
@@ -0,0 +1,56 @@
+from collections.abc import AsyncIterable
+
+from dishka import Provider, Scope, provide
+
+from src.application.interfaces.cache import UserCache
+from src.application.interfaces.leaderboard import ReferralLeaderboard
+from src.infrastructure.cache import InMemoryUserCache
+from src.infrastructure.config import Config
+from src.infrastructure.db.invalidation import (
+    UserInvalidationListener,
+    UserInvalidationPublisher,
+)
+from src.infrastructure.leaderboard import InMemoryReferralLeaderboard
+
+
+class CacheProvider(Provider):
+    scope = Scope.APP
+
+    @provide
+    def get_invalidation_publisher(
+        self, config: Config
+    ) -> UserInvalidationPublisher | None:
+        cache_config = config.users.cache
+        if cache_config is None or cache_config.invalidation_channel is None:
+            return None
+        return UserInvalidationPublisher(cache_config.invalidation_channel)
+
+    @provide
+    def get_referral_leaderboard(self, config: Config) -> ReferralLeaderboard | None:
+        if config.users.leaderboard is None:
+            return None
+        # Seeded by the first read, see GetTopReferrersInteractor.
+        return InMemoryReferralLeaderboard(config.users.leaderboard)
+
+    @provide
+    async def get_user_cache(
+        self,
+        config: Config,
+        publisher: UserInvalidationPublisher | None,
+        leaderboard: ReferralLeaderboard | None,
+    ) -> AsyncIterable[UserCache | None]:
+        if config.users.cache is None:
+            yield None
+            return
+
+        cache = InMemoryUserCache(config.users.cache)
+        if publisher is None:
+            yield cache
+            return
+
+        listener = UserInvalidationListener(
+            config.postgres, cache, publisher.channel, publisher.origin, leaderboard
+        )
+        listener.start()
+        yield cache
+        await listener.stop()
@@ -4,12 +4,21 @@ from dishka import Provider, Scope, from_context, provide
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 
 from src.application.common.transaction import TransactionManager
+from src.application.interfaces.activity import UserActivityBuffer
+from src.application.interfaces.cache import UserCache
+from src.application.interfaces.leaderboard import ReferralLeaderboard
 from src.domain.admin import AdminRepository
+from src.domain.referral import ReferralEventRepository
 from src.domain.user import UserRepository
 from src.infrastructure.config import Config
 from src.infrastructure.db.factory import create_engine, create_session_maker
 from src.infrastructure.db.holder import HolderDao
+from src.infrastructure.db.invalidation import UserInvalidationPublisher
+from src.infrastructure.db.loader import UserLoader
+from src.infrastructure.db.repos import AsyncpgUserRepository, UserRepositoryImpl
+from src.infrastructure.db.rollups import ReferralRollupRefresher
 from src.infrastructure.db.transaction import TransactionManagerImpl
+from src.infrastructure.db.write_behind import LastSeenWriteBehind
 
 
 class DBProvider(Provider):
@@ -30,6 +39,59 @@ class DBProvider(Provider):
     ) -> async_sessionmaker[AsyncSession]:
         return create_session_maker(engine)
 
+    @provide(scope=Scope.APP)
+    async def get_activity_buffer(
+        self,
+        config: Config,
+        session_maker: async_sessionmaker[AsyncSession],
+    ) -> AsyncIterable[UserActivityBuffer | None]:
+        if config.users.write_behind is None:
+            yield None
+            return
+
+        buffer = LastSeenWriteBehind(session_maker, config.users.write_behind)
+        buffer.start()
+        yield buffer
+        await buffer.stop()
+
+    @provide(scope=Scope.APP)
+    async def get_user_loader(
+        self,
+        config: Config,
+        session_maker: async_sessionmaker[AsyncSession],
+    ) -> AsyncIterable[UserLoader | None]:
+        if config.users.loader is None:
+            yield None
+            return
+
+        loader = UserLoader(session_maker, config.users.loader)
+        yield loader
+        await loader.close()
+
+    @provide(scope=Scope.APP)
+    async def get_rollup_refresher(
+        self,
+        config: Config,
+        session_maker: async_sessionmaker[AsyncSession],
+        publisher: UserInvalidationPublisher | None,
+        user_cache: UserCache | None,
+        leaderboard: ReferralLeaderboard | None,
+    ) -> AsyncIterable[ReferralRollupRefresher | None]:
+        if config.users.referral_rollups is None:
+            yield None
+            return
+
+        refresher = ReferralRollupRefresher(
+            session_maker,
+            config.users.referral_rollups,
+            publisher=publisher,
+            user_cache=user_cache,
+            leaderboard=leaderboard,
+        )
+        refresher.start()
+        yield refresher
+        await refresher.stop()
+
     @provide(scope=Scope.REQUEST)
     async def get_session(
         self,
@@ -41,16 +103,24 @@ class DBProvider(Provider):
     @provide(scope=Scope.REQUEST)
     async def get_holder_dao(
         self,
+        config: Config,
         session: AsyncSession,
+        user_loader: UserLoader | None,
     ) -> HolderDao:
-        return HolderDao(session)
+        user_repository_cls = (
+            AsyncpgUserRepository
+            if config.postgres.user_repository == "asyncpg"
+            else UserRepositoryImpl
+        )
+        return HolderDao(session, user_loader, user_repository_cls)
 
     @provide(scope=Scope.REQUEST)
     async def get_transaction_manager(
         self,
         session: AsyncSession,
+        invalidation_publisher: UserInvalidationPublisher | None,
     ) -> TransactionManager:
-        return TransactionManagerImpl(session)
+        return TransactionManagerImpl(session, invalidation_publisher)
 
     @provide(scope=Scope.REQUEST)
     async def get_user_repository(
@@ -65,3 +135,10 @@ class DBProvider(Provider):
         holder_dao: HolderDao,
     ) -> AdminRepository:
         return holder_dao.admin_repo
+
+    @provide(scope=Scope.REQUEST)
+    async def get_referral_event_repository(
+        self,
+        holder_dao: HolderDao,
+    ) -> ReferralEventRepository:
+        return holder_dao.referral_event_repo
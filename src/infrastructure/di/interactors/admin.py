@@ -1,6 +1,7 @@
 from dishka import Provider, Scope, provide
 
 from src.application.admin import CheckAliveInteractor
+from src.application.common.transaction import TransactionManager
 from src.domain.admin import AdminRepository
 
 
@@ -11,5 +12,9 @@ class AdminInteractorProvider(Provider):
     def provide_check_alive_interactor(
         self,
         admin_repository: AdminRepository,
+        transaction_manager: TransactionManager,
     ) -> CheckAliveInteractor:
-        return CheckAliveInteractor(admin_repository=admin_repository)
+        return CheckAliveInteractor(
+            admin_repository=admin_repository,
+            transaction_manager=transaction_manager,
+        )
@@ -1,50 +1,99 @@
 from dishka import Provider, Scope, provide
 
 from src.application.common.transaction import TransactionManager
+from src.application.interfaces.cache import UserCache
+from src.application.interfaces.leaderboard import ReferralLeaderboard
 from src.application.referral.get_info import GetReferralInfoInteractor
 from src.application.referral.process import ProcessReferralInteractor
-from src.application.referral.stats import GetStatsInteractor, GetTopReferrersInteractor
+from src.application.referral.stats import (
+    GetPeriodStatsInteractor,
+    GetStatsInteractor,
+    GetTopReferrersInteractor,
+    ReconcileStatsInteractor,
+)
+from src.domain.referral import ReferralEventRepository
 from src.domain.user import UserRepository
+from src.domain.user.services.referral import ReferralCodec
 from src.infrastructure.config import Config
 
 
 class ReferralInteractorProvider(Provider):
     scope = Scope.REQUEST
 
+    @provide(scope=Scope.APP)
+    def provide_referral_codec(self, config: Config) -> ReferralCodec:
+        return ReferralCodec(config.auth.secret_key)
+
     @provide
     def provide_process_referral_interactor(
         self,
         user_repository: UserRepository,
+        referral_event_repository: ReferralEventRepository,
         transaction_manager: TransactionManager,
+        codec: ReferralCodec,
         config: Config,
+        *,
+        user_cache: UserCache | None,
+        leaderboard: ReferralLeaderboard | None,
     ) -> ProcessReferralInteractor:
         return ProcessReferralInteractor(
             user_repository=user_repository,
+            referral_event_repository=referral_event_repository,
             transaction_manager=transaction_manager,
-            secret_key=config.auth.secret_key,
+            codec=codec,
+            user_cache=user_cache,
+            leaderboard=leaderboard,
+            defer_count=config.users.defer_referral_counts,
         )
 
     @provide
     def provide_get_referral_info_interactor(
         self,
         user_repository: UserRepository,
-        config: Config,
+        codec: ReferralCodec,
     ) -> GetReferralInfoInteractor:
         return GetReferralInfoInteractor(
             user_repository=user_repository,
-            secret_key=config.auth.secret_key,
+            codec=codec,
         )
 
     @provide
     def provide_get_stats_interactor(
         self,
         user_repository: UserRepository,
+        config: Config,
     ) -> GetStatsInteractor:
-        return GetStatsInteractor(user_repository=user_repository)
+        return GetStatsInteractor(
+            user_repository=user_repository,
+            estimate=config.users.estimate_stats,
+        )
+
+    @provide
+    def provide_get_period_stats_interactor(
+        self,
+        referral_event_repository: ReferralEventRepository,
+    ) -> GetPeriodStatsInteractor:
+        return GetPeriodStatsInteractor(
+            referral_event_repository=referral_event_repository
+        )
+
+    @provide
+    def provide_reconcile_stats_interactor(
+        self,
+        user_repository: UserRepository,
+        transaction_manager: TransactionManager,
+    ) -> ReconcileStatsInteractor:
+        return ReconcileStatsInteractor(
+            user_repository=user_repository,
+            transaction_manager=transaction_manager,
+        )
 
     @provide
     def provide_get_top_referrers_interactor(
         self,
         user_repository: UserRepository,
+        leaderboard: ReferralLeaderboard | None,
     ) -> GetTopReferrersInteractor:
-        return GetTopReferrersInteractor(user_repository=user_repository)
+        return GetTopReferrersInteractor(
+            user_repository=user_repository, leaderboard=leaderboard
+        )
@@ -1,22 +1,38 @@
+from datetime import timedelta
+
 from dishka import Provider, Scope, provide
 
+from src.application.common.single_flight import SingleFlight
 from src.application.common.transaction import TransactionManager
+from src.application.interfaces.activity import UserActivityBuffer
+from src.application.interfaces.cache import UserCache
 from src.application.user.create import CreateUserInteractor
 from src.application.user.get_me import GetUserProfileInteractor
 from src.application.user.interactors.update_language import UpdateLanguageInteractor
 from src.application.user.service import UserService
 from src.domain.user import UserRepository
+from src.infrastructure.config import Config
 
 
 class UserInteractorProvider(Provider):
     scope = Scope.REQUEST
 
+    @provide(scope=Scope.APP)
+    def provide_single_flight(self) -> SingleFlight:
+        return SingleFlight()
+
     @provide
     def provide_user_service(
         self,
         user_repository: UserRepository,
+        config: Config,
     ) -> UserService:
-        return UserService(user_repository)
+        return UserService(
+            user_repository,
+            last_seen_granularity=timedelta(
+                seconds=config.users.last_seen_granularity_seconds
+            ),
+        )
 
     @provide
     def provide_user_profile_interactor(
@@ -32,10 +48,16 @@ class UserInteractorProvider(Provider):
         self,
         user_service: UserService,
         transaction_manager: TransactionManager,
+        user_cache: UserCache | None,
+        activity_buffer: UserActivityBuffer | None,
+        single_flight: SingleFlight,
     ) -> CreateUserInteractor:
         return CreateUserInteractor(
             user_service=user_service,
             transaction_manager=transaction_manager,
+            user_cache=user_cache,
+            activity_buffer=activity_buffer,
+            single_flight=single_flight,
         )
 
     @provide
@@ -43,8 +65,12 @@ class UserInteractorProvider(Provider):
         self,
         user_repository: UserRepository,
         transaction_manager: TransactionManager,
+        user_cache: UserCache | None,
+        single_flight: SingleFlight,
     ) -> UpdateLanguageInteractor:
         return UpdateLanguageInteractor(
             user_repository=user_repository,
             transaction_manager=transaction_manager,
+            user_cache=user_cache,
+            single_flight=single_flight,
         )
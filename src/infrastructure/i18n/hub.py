@@ -5,9 +5,14 @@ from pathlib import Path
 from fluent_compiler.bundle import FluentBundle
 from fluentogram import FluentTranslator, TranslatorHub
 
+from src.domain.user.vo import LanguageCode
+
 SUPPORTED_LANGUAGES = ("en", "ru")
 DEFAULT_LANGUAGE = "en"
 
+# Users only ever have one of these, so they are the codes worth sharing.
+LanguageCode.seed(*SUPPORTED_LANGUAGES)
+
 
 def load_ftl_files(locale_dir: Path, language: str) -> str:
     """Load and concatenate all .ftl files for a language."""
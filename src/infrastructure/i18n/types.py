@@ -29,6 +29,9 @@ if TYPE_CHECKING:
         def settings_language_changed(self) -> str: ...
         def settings_language_title(self) -> str: ...
         def settings_title(self) -> str: ...
+        def stats_back_btn(self) -> str: ...
+        def stats_estimated_note(self) -> str: ...
+        def stats_next_btn(self) -> str: ...
         def stats_no_inviters(self) -> str: ...
         def stats_overview(
             self,
@@ -39,8 +42,20 @@ if TYPE_CHECKING:
             organic: _I18nArg,
             organic_pct: _I18nArg,
         ) -> str: ...
+        def stats_period_day_btn(self) -> str: ...
+        def stats_period_day_header(self) -> str: ...
+        def stats_period_month_btn(self) -> str: ...
+        def stats_period_month_header(self) -> str: ...
+        def stats_period_referrals(self, *, count: _I18nArg) -> str: ...
+        def stats_period_top_header(self) -> str: ...
+        def stats_period_week_btn(self) -> str: ...
+        def stats_period_week_header(self) -> str: ...
+        def stats_prev_btn(self) -> str: ...
         def stats_top_inviters_btn(self) -> str: ...
         def stats_top_inviters_header(self, *, limit: _I18nArg) -> str: ...
+        def stats_top_inviters_page_header(
+            self, *, first: _I18nArg, last: _I18nArg
+        ) -> str: ...
         def welcome(self, *, name: _I18nArg) -> str: ...
 
 else:
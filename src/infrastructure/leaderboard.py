@@ -0,0 +1,128 @@
+import bisect
+import time
+from dataclasses import dataclass
+
+from src.application.interfaces.leaderboard import ReferralLeaderboard
+from src.domain.user.repository import TopReferrer, TopReferrerCursor
+from src.infrastructure.config import LeaderboardConfig
+
+
+@dataclass(slots=True)
+class LeaderboardStats:
+    hits: int = 0
+    misses: int = 0
+    reseeds: int = 0
+    invalidations: int = 0
+
+
+def _sort_key(referrer: TopReferrer) -> tuple[int, int]:
+    # Ascending sort key for the leaderboard order (count, id) descending.
+    return -referrer.referral_count, -referrer.user_id
+
+
+def _cursor_key(cursor: TopReferrerCursor) -> tuple[int, int]:
+    return -cursor.referral_count, -cursor.user_id
+
+
+class InMemoryReferralLeaderboard(ReferralLeaderboard):
+    """The exact top-K referrers of the last seed plus the increments since.
+
+    Referral counts only grow, so applying each committed count keeps the
+    set exact: a user outside it can only enter by passing its last entry,
+    which then drops out. When the seed held fewer than K referrers the
+    board is complete and every page can be served; otherwise pages must
+    fit within the K entries.
+    """
+
+    def __init__(self, config: LeaderboardConfig) -> None:
+        self._capacity = config.size
+        self._refresh = config.refresh_seconds
+        self._entries: list[TopReferrer] = []
+        self._by_id: dict[int, TopReferrer] = {}
+        self._complete = False
+        self._expires_at = 0.0
+        self._version = 0
+        self.stats = LeaderboardStats()
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    @property
+    def stale(self) -> bool:
+        return self._expires_at <= time.monotonic()
+
+    def page(
+        self,
+        limit: int,
+        after: TopReferrerCursor | None = None,
+        before: TopReferrerCursor | None = None,
+    ) -> list[TopReferrer] | None:
+        if self.stale:
+            self.stats.misses += 1
+            return None
+
+        entries = self._entries
+        if before is not None:
+            stop = bisect.bisect_left(entries, _cursor_key(before), key=_sort_key)
+            # Referrers between the last entry and the cursor are unknown.
+            if stop == len(entries) and not self._complete:
+                self.stats.misses += 1
+                return None
+            page = entries[max(stop - limit, 0) : stop]
+        else:
+            start = 0
+            if after is not None:
+                start = bisect.bisect_right(entries, _cursor_key(after), key=_sort_key)
+            if start + limit > len(entries) and not self._complete:
+                self.stats.misses += 1
+                return None
+            page = entries[start : start + limit]
+
+        self.stats.hits += 1
+        return page
+
+    def record(self, referrer: TopReferrer) -> None:
+        if self.stale:
+            # A seed may be loading; make it retry rather than miss this.
+            self._version += 1
+            return
+
+        current = self._by_id.get(referrer.user_id)
+        if current is not None:
+            # Updates may arrive out of commit order; counts never decrease.
+            if referrer.referral_count <= current.referral_count:
+                return
+            self._remove(current)
+        elif not self._complete and _sort_key(referrer) > _sort_key(self._entries[-1]):
+            return
+
+        bisect.insort(self._entries, referrer, key=_sort_key)
+        self._by_id[referrer.user_id] = referrer
+        if len(self._entries) > self._capacity:
+            self._remove(self._entries[-1])
+            self._complete = False
+
+    def reset(self, top: list[TopReferrer], version: int) -> None:
+        if version != self._version:
+            return
+
+        self._entries = sorted(top[: self._capacity], key=_sort_key)
+        self._by_id = {referrer.user_id: referrer for referrer in self._entries}
+        self._complete = len(top) < self._capacity
+        self._expires_at = time.monotonic() + self._refresh
+        self.stats.reseeds += 1
+
+    def invalidate(self) -> None:
+        self._expires_at = 0.0
+        self._version += 1
+        self.stats.invalidations += 1
+
+    def _remove(self, referrer: TopReferrer) -> None:
+        index = bisect.bisect_left(self._entries, _sort_key(referrer), key=_sort_key)
+        del self._entries[index]
+        del self._by_id[referrer.user_id]
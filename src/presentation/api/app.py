@@ -64,4 +64,10 @@ def create_app() -> Litestar:
     )
 
     setup_dishka(container=container, app=app)
+
+    async def close_container() -> None:
+        # Runs app-scoped finalizers, e.g. the final write-behind flush.
+        await container.close()
+
+    app.on_shutdown.append(close_container)
     return app
@@ -10,6 +10,7 @@ from dishka.integrations.aiogram import setup_dishka
 from fluentogram import TranslatorHub
 
 from src.infrastructure.config import Config, load_config
+from src.infrastructure.db.rollups import ReferralRollupRefresher
 from src.infrastructure.di import (
     infra_providers,
     interactor_providers,
@@ -50,17 +51,24 @@ async def main() -> None:
 
         await notify_admins_on_startup(bot, config, hub)
 
-    if config.telegram.mode == "webhook":
-        if config.telegram.webhook is None:
-            # Defensive: the config validator already enforces this invariant,
-            # so this branch should be unreachable. We keep the explicit check
-            # because `assert` is stripped under `python -O`.
-            raise RuntimeError(
-                "telegram.webhook must be set when telegram.mode is 'webhook'"
-            )
-        await run_webhook(bot, dp, config)
-    else:
-        await dp.start_polling(bot)
+    # Resolving it starts the background refresh.
+    await container.get(ReferralRollupRefresher | None)
+
+    try:
+        if config.telegram.mode == "webhook":
+            if config.telegram.webhook is None:
+                # Defensive: the config validator already enforces this invariant,
+                # so this branch should be unreachable. We keep the explicit check
+                # because `assert` is stripped under `python -O`.
+                raise RuntimeError(
+                    "telegram.webhook must be set when telegram.mode is 'webhook'"
+                )
+            await run_webhook(bot, dp, config)
+        else:
+            await dp.start_polling(bot)
+    finally:
+        # Runs app-scoped finalizers, e.g. the final write-behind flush.
+        await container.close()
 
 
 if __name__ == "__main__":
@@ -5,11 +5,15 @@ from dishka.integrations.aiogram import FromDishka, inject
 from src.application.admin import (
     CheckAliveInput,
     CheckAliveInteractor,
+    CheckAliveProgress,
     CheckAliveResult,
 )
 
 router = Router(name="admin_check_alive")
 
+# "Unchecked" skips users whose status was recorded this recently.
+RECHECK_AFTER_DAYS = 7
+
 
 def _build_filter_keyboard() -> InlineKeyboardMarkup:
     """Build keyboard with activity filter options."""
@@ -23,6 +27,12 @@ def _build_filter_keyboard() -> InlineKeyboardMarkup:
                 InlineKeyboardButton(text="7 Days", callback_data="check_alive:7"),
                 InlineKeyboardButton(text="1 Day", callback_data="check_alive:1"),
             ],
+            [
+                InlineKeyboardButton(
+                    text=f"Unchecked in {RECHECK_AFTER_DAYS} Days",
+                    callback_data="check_alive:unchecked",
+                ),
+            ],
             [
                 InlineKeyboardButton(text="Back", callback_data="admin:back_to_stats"),
             ],
@@ -43,10 +53,16 @@ def _build_back_button() -> InlineKeyboardMarkup:
     )
 
 
-def _format_progress(processed: int, total: int) -> str:
+def _format_progress(progress: CheckAliveProgress) -> str:
     """Format progress message during check."""
+    processed, total = progress.processed, progress.total
     percent = (processed / total * 100) if total > 0 else 0
-    return f"Checking alive users...\n\nProgress: {processed}/{total} ({percent:.1f}%)"
+    return (
+        "Checking alive users...\n\n"
+        f"Progress: {processed}/{total} ({percent:.1f}%)\n"
+        f"Speed: {progress.throughput:.1f} users/s, "
+        f"concurrency: {progress.concurrency}"
+    )
 
 
 def _format_result(result: CheckAliveResult) -> str:
@@ -71,8 +87,12 @@ def _format_result(result: CheckAliveResult) -> str:
     if result.other_errors > 0:
         lines.append(f"Other errors: {result.other_errors} ({other_pct:.1f}%)")
 
-    if result.rate_limited > 0:
-        lines.append(f"\nRate limited retries: {result.rate_limited}")
+    if result.gave_up > 0:
+        gave_up_pct = result.gave_up / total * 100
+        lines.append(f"Unchecked (rate limited): {result.gave_up} ({gave_up_pct:.1f}%)")
+
+    if result.retried > 0:
+        lines.append(f"\nChecked after a rate limit retry: {result.retried}")
 
     return "\n".join(lines)
 
@@ -100,22 +120,21 @@ async def cb_check_alive_handler(
     # Parse filter from callback data
     filter_value = callback.data.split(":")[1]
     if filter_value == "all":
-        active_since_days = None
+        data = CheckAliveInput()
         filter_label = "all users"
+    elif filter_value == "unchecked":
+        data = CheckAliveInput(skip_checked_within_days=RECHECK_AFTER_DAYS)
+        filter_label = f"users not checked in last {RECHECK_AFTER_DAYS} day(s)"
     else:
-        active_since_days = int(filter_value)
-        filter_label = f"users active in last {active_since_days} day(s)"
+        data = CheckAliveInput(active_since_days=int(filter_value))
+        filter_label = f"users active in last {filter_value} day(s)"
 
     await callback.message.edit_text(f"Starting alive check for {filter_label}...")
 
     last_result = None
-    async for progress in interactor.execute(
-        bot=bot, data=CheckAliveInput(active_since_days=active_since_days)
-    ):
+    async for progress in interactor.execute(bot=bot, data=data):
         last_result = progress.current_result
-        await callback.message.edit_text(
-            _format_progress(progress.processed, progress.total)
-        )
+        await callback.message.edit_text(_format_progress(progress))
 
     if last_result is None:
         await callback.message.edit_text(
@@ -8,12 +8,25 @@ from aiogram.types import (
 )
 from dishka.integrations.aiogram import FromDishka, inject
 
-from src.application.referral.stats import GetStatsInteractor, GetTopReferrersInteractor
+from src.application.referral.stats import (
+    PERIODS,
+    GetPeriodStatsInteractor,
+    GetStatsInteractor,
+    GetTopReferrersInteractor,
+    TopReferrersInputDTO,
+)
 from src.infrastructure.i18n import TranslatorRunner
-from src.presentation.bot.utils.markups.admin import stats_main_markup
+from src.presentation.bot.utils.cb_data import StatsPeriodCBData, TopReferrersCBData
+from src.presentation.bot.utils.markups.admin import (
+    stats_back_markup,
+    stats_main_markup,
+    top_referrers_markup,
+)
 
 logger = logging.getLogger(__name__)
 
+TOP_REFERRERS_PAGE_SIZE = 10
+
 router = Router(name="admin_stats")
 
 
@@ -29,14 +42,18 @@ async def stats_handler(
     logger.info("Admin %s requested stats", update.from_user.id)
     stats = await interactor()
 
+    text = i18n.stats_overview(
+        total=stats.total_users,
+        referred=stats.referred_count,
+        referred_pct=stats.referred_percent,
+        organic=stats.organic_count,
+        organic_pct=stats.organic_percent,
+    )
+    if stats.is_estimate:
+        text += "\n" + i18n.stats_estimated_note()
+
     kwargs = {
-        "text": i18n.stats_overview(
-            total=stats.total_users,
-            referred=stats.referred_count,
-            referred_pct=stats.referred_percent,
-            organic=stats.organic_count,
-            organic_pct=stats.organic_percent,
-        ),
+        "text": text,
         "reply_markup": stats_main_markup(i18n),
     }
 
@@ -47,27 +64,101 @@ async def stats_handler(
 
 
 @router.callback_query(F.data == "ref_top")
+@router.callback_query(TopReferrersCBData.filter())
 @inject
 async def ref_top_callback(
     callback: CallbackQuery,
     i18n: TranslatorRunner,
     interactor: FromDishka[GetTopReferrersInteractor],
+    callback_data: TopReferrersCBData | None = None,
 ) -> None:
-    """Handle top referrers callback."""
+    """Handle top referrers callback and its next/prev pages."""
     logger.info("Admin %s requested top referrers", callback.from_user.id)
 
-    limit = 10
-    top = await interactor(limit)
+    limit = TOP_REFERRERS_PAGE_SIZE
+    if callback_data is None:
+        data = TopReferrersInputDTO(limit=limit)
+        rank = 1
+    else:
+        data = TopReferrersInputDTO(
+            limit=limit,
+            cursor=(callback_data.count, callback_data.user_id),
+            backwards=callback_data.backwards,
+        )
+        rank = callback_data.rank
+    page = await interactor(data)
+    top = page.referrers
+    if not page.has_prev:
+        rank = 1
 
     if not top:
-        await callback.message.edit_text(text=i18n.stats_no_inviters())
+        await callback.message.edit_text(
+            text=i18n.stats_no_inviters(), reply_markup=top_referrers_markup(i18n)
+        )
         await callback.answer()
         return
 
-    text = i18n.stats_top_inviters_header(limit=limit) + "\n\n"
-    for i, ref in enumerate(top, 1):
+    if rank == 1:
+        text = i18n.stats_top_inviters_header(limit=limit) + "\n\n"
+    else:
+        text = (
+            i18n.stats_top_inviters_page_header(first=rank, last=rank + len(top) - 1)
+            + "\n\n"
+        )
+    for i, ref in enumerate(top, rank):
         name = f"@{ref.username}" if ref.username else ref.first_name
         text += f"{i}. {name} — {ref.count}\n"
 
-    await callback.message.edit_text(text=text)
+    # Ranks are carried in the buttons; counting rows above a page would
+    # defeat the keyset.
+    prev_page = next_page = None
+    if page.has_prev:
+        prev_page = TopReferrersCBData(
+            count=top[0].count,
+            user_id=top[0].user_id,
+            backwards=True,
+            rank=max(rank - limit, 1),
+        )
+    if page.has_next:
+        next_page = TopReferrersCBData(
+            count=top[-1].count,
+            user_id=top[-1].user_id,
+            backwards=False,
+            rank=rank + len(top),
+        )
+
+    await callback.message.edit_text(
+        text=text, reply_markup=top_referrers_markup(i18n, prev_page, next_page)
+    )
+    await callback.answer()
+
+
+@router.callback_query(StatsPeriodCBData.filter(F.period.in_(PERIODS)))
+@inject
+async def stats_period_callback(
+    callback: CallbackQuery,
+    callback_data: StatsPeriodCBData,
+    i18n: TranslatorRunner,
+    interactor: FromDishka[GetPeriodStatsInteractor],
+) -> None:
+    """Handle referral stats for the last day, week or month."""
+    logger.info(
+        "Admin %s requested %s stats", callback.from_user.id, callback_data.period
+    )
+    stats = await interactor(callback_data.period)
+
+    headers = {
+        "day": i18n.stats_period_day_header,
+        "week": i18n.stats_period_week_header,
+        "month": i18n.stats_period_month_header,
+    }
+    text = headers[stats.period]() + "\n\n"
+    text += i18n.stats_period_referrals(count=stats.referrals) + "\n"
+    if stats.top_referrers:
+        text += "\n" + i18n.stats_period_top_header() + "\n"
+        for i, ref in enumerate(stats.top_referrers, 1):
+            name = f"@{ref.username}" if ref.username else ref.first_name
+            text += f"{i}. {name} — {ref.count}\n"
+
+    await callback.message.edit_text(text=text, reply_markup=stats_back_markup(i18n))
     await callback.answer()
@@ -3,11 +3,11 @@ from aiogram.types import CallbackQuery
 from dishka.integrations.aiogram import FromDishka, inject
 from fluentogram import TranslatorHub
 
+from src.application.user.dtos import CreateUserOutputDTO
 from src.application.user.interactors.update_language import (
     UpdateLanguageDTO,
     UpdateLanguageInteractor,
 )
-from src.domain.user import UserRepository
 from src.domain.user.vo import LanguageCode, UserId
 from src.infrastructure.i18n import TranslatorRunner
 from src.presentation.bot.utils import edit_or_answer
@@ -23,8 +23,8 @@ async def onboarding_language_selected(
     callback: CallbackQuery,
     callback_data: OnboardingCBData,
     interactor: FromDishka[UpdateLanguageInteractor],
-    user_repository: FromDishka[UserRepository],
     hub: FromDishka[TranslatorHub],
+    user: CreateUserOutputDTO,
 ) -> None:
     """Handle language selection during onboarding."""
     await callback.answer()
@@ -32,21 +32,20 @@ async def onboarding_language_selected(
     user_id = UserId(callback.from_user.id)
     new_language = LanguageCode(callback_data.code)
 
-    # Save language preference
-    await interactor(
+    # Save language preference; the updated user comes back from the write
+    updated = await interactor(
         UpdateLanguageDTO(
             user_id=user_id,
             language_code=new_language,
         )
     )
+    user = updated or user
 
-    # Get user and translator for new language
-    user = await user_repository.get_user(user_id)
     i18n: TranslatorRunner = hub.get_translator_by_locale(new_language.value)
 
     # Show welcome message in chosen language
     await edit_or_answer(
         callback,
-        text=i18n.welcome(name=user.first_name.value if user else "User"),
+        text=i18n.welcome(name=user.first_name),
         reply_markup=get_welcome_keyboard(i18n),
     )
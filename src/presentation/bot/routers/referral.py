@@ -7,6 +7,7 @@ from src.application.referral.get_info import (
     GetReferralInfoInputDTO,
     GetReferralInfoInteractor,
 )
+from src.application.user.dtos import CreateUserOutputDTO
 from src.infrastructure.config import Config
 from src.infrastructure.i18n import TranslatorRunner
 
@@ -20,10 +21,12 @@ async def referral_handler(
     i18n: TranslatorRunner,
     get_referral_info: FromDishka[GetReferralInfoInteractor],
     config: FromDishka[Config],
+    user: CreateUserOutputDTO,
 ) -> None:
     """Show user's referral link and statistics."""
-    user_id = message.from_user.id
-    info = await get_referral_info(GetReferralInfoInputDTO(user_id=user_id))
+    info = await get_referral_info(
+        GetReferralInfoInputDTO(user_id=user.id, referral_count=user.referral_count)
+    )
 
     if info is None:
         await message.answer(text=i18n.referral_user_not_found())
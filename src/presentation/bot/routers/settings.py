@@ -5,11 +5,11 @@ from aiogram.types import CallbackQuery
 from dishka.integrations.aiogram import FromDishka, inject
 from fluentogram import TranslatorHub
 
+from src.application.user.dtos import CreateUserOutputDTO
 from src.application.user.interactors.update_language import (
     UpdateLanguageDTO,
     UpdateLanguageInteractor,
 )
-from src.domain.user import UserRepository
 from src.domain.user.vo import LanguageCode, UserId
 from src.infrastructure.i18n import TranslatorRunner
 from src.presentation.bot.utils import edit_or_answer
@@ -46,13 +46,11 @@ async def settings_menu(
 async def language_menu(
     callback: CallbackQuery,
     i18n: TranslatorRunner,
-    user_repository: FromDishka[UserRepository],
+    user: CreateUserOutputDTO,
 ) -> None:
     """Handle Language button in settings."""
     logger.info("User %s opened language menu", callback.from_user.id)
-    user_id = UserId(callback.from_user.id)
-    user = await user_repository.get_user(user_id)
-    current_language = user.language_code if user else None
+    current_language = LanguageCode(user.language_code) if user.language_code else None
 
     await edit_or_answer(
         update=callback,
@@ -100,16 +98,14 @@ async def change_language(
 async def back_to_main_menu(
     callback: CallbackQuery,
     i18n: TranslatorRunner,
-    user_repository: FromDishka[UserRepository],
+    user: CreateUserOutputDTO,
 ) -> None:
     """Handle Back button to return to main menu."""
     logger.info("User %s returned to main menu from settings", callback.from_user.id)
-    user_id = UserId(callback.from_user.id)
-    user = await user_repository.get_user(user_id)
 
     await edit_or_answer(
         update=callback,
-        text=i18n.welcome(name=user.first_name.value if user else "User"),
+        text=i18n.welcome(name=user.first_name),
         reply_markup=get_welcome_keyboard(i18n),
     )
     await callback.answer()
@@ -13,3 +13,15 @@ class LanguageCBData(CallbackData, prefix="lang"):
 
 class OnboardingCBData(CallbackData, prefix="onboard"):
     code: str  # "en" or "ru"
+
+
+class TopReferrersCBData(CallbackData, prefix="ref_top"):
+    # Leaderboard position to page from, see TopReferrersInputDTO.
+    count: int
+    user_id: int
+    backwards: bool
+    rank: int  # rank of the first row on the requested page
+
+
+class StatsPeriodCBData(CallbackData, prefix="stats_period"):
+    period: str  # "day", "week" or "month"
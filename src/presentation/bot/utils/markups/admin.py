@@ -1,6 +1,7 @@
 from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 
 from src.infrastructure.i18n import TranslatorRunner
+from src.presentation.bot.utils.cb_data import StatsPeriodCBData, TopReferrersCBData
 
 
 def stats_main_markup(i18n: TranslatorRunner) -> InlineKeyboardMarkup:
@@ -15,6 +16,57 @@ def stats_main_markup(i18n: TranslatorRunner) -> InlineKeyboardMarkup:
                     text=i18n.check_alive_btn(),
                     callback_data="check_alive",
                 ),
+            ],
+            [
+                InlineKeyboardButton(
+                    text=i18n.stats_period_day_btn(),
+                    callback_data=StatsPeriodCBData(period="day").pack(),
+                ),
+                InlineKeyboardButton(
+                    text=i18n.stats_period_week_btn(),
+                    callback_data=StatsPeriodCBData(period="week").pack(),
+                ),
+                InlineKeyboardButton(
+                    text=i18n.stats_period_month_btn(),
+                    callback_data=StatsPeriodCBData(period="month").pack(),
+                ),
+            ],
+        ]
+    )
+
+
+def top_referrers_markup(
+    i18n: TranslatorRunner,
+    prev_page: TopReferrersCBData | None = None,
+    next_page: TopReferrersCBData | None = None,
+) -> InlineKeyboardMarkup:
+    pages = []
+    if prev_page is not None:
+        pages.append(
+            InlineKeyboardButton(
+                text=i18n.stats_prev_btn(), callback_data=prev_page.pack()
+            )
+        )
+    if next_page is not None:
+        pages.append(
+            InlineKeyboardButton(
+                text=i18n.stats_next_btn(), callback_data=next_page.pack()
+            )
+        )
+
+    back = InlineKeyboardButton(
+        text=i18n.stats_back_btn(), callback_data="admin:back_to_stats"
+    )
+    return InlineKeyboardMarkup(inline_keyboard=[row for row in (pages, [back]) if row])
+
+
+def stats_back_markup(i18n: TranslatorRunner) -> InlineKeyboardMarkup:
+    return InlineKeyboardMarkup(
+        inline_keyboard=[
+            [
+                InlineKeyboardButton(
+                    text=i18n.stats_back_btn(), callback_data="admin:back_to_stats"
+                )
             ]
         ]
     )
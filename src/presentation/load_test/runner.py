@@ -23,6 +23,7 @@ from rich.progress import (
 from src.infrastructure.config import Config, load_config
 from src.infrastructure.di import (
     AuthProvider,
+    CacheProvider,
     DBProvider,
     I18nProvider,
     interactor_providers,
@@ -55,6 +56,7 @@ async def setup_dispatcher(config: Config) -> tuple[Dispatcher, Bot]:
 
     container = make_async_container(
         AuthProvider(),
+        CacheProvider(),
         DBProvider(),
         I18nProvider(),
         *interactor_providers,
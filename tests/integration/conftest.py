@@ -22,6 +22,7 @@ from src.infrastructure.config import Config
 from src.infrastructure.db.models.base import BaseORMModel
 from src.infrastructure.di import (
     AuthProvider,
+    CacheProvider,
     DBProvider,
     interactor_providers,
 )
@@ -159,6 +160,7 @@ async def dishka_container_for_tests(
 
     container = make_async_container(
         AuthProvider(),
+        CacheProvider(),
         DBProvider(worker_postgres_config),
         *interactor_providers,
         context={Config: worker_config, AuthService: test_auth_service},
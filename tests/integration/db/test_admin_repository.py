@@ -0,0 +1,82 @@
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.db.repos import AdminRepositoryImpl
+
+PROFILE_UPDATED = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+async def seed_users(session: AsyncSession, *user_ids: int) -> None:
+    await session.execute(
+        text(
+            "INSERT INTO users (id, first_name, updated_at)"
+            " SELECT id, 'User', :updated_at FROM unnest(CAST(:ids AS bigint[])) id"
+        ),
+        {"ids": list(user_ids), "updated_at": PROFILE_UPDATED},
+    )
+    await session.commit()
+
+
+async def alive_statuses(session: AsyncSession) -> list[tuple]:
+    result = await session.execute(
+        text(
+            "SELECT id, alive_status, alive_checked_at, updated_at"
+            " FROM users ORDER BY id"
+        )
+    )
+    return [tuple(row) for row in result]
+
+
+class TestSaveAliveStatuses:
+    async def test_persists_status_and_time_per_user(
+        self, native_db_session: AsyncSession
+    ):
+        await seed_users(native_db_session, 1, 2, 3, 4)
+        repository = AdminRepositoryImpl(native_db_session)
+        first_run = datetime(2026, 3, 1, tzinfo=UTC)
+        second_run = first_run + timedelta(days=1)
+
+        await repository.save_alive_statuses(
+            {1: "alive", 2: "blocked", 3: "deleted"}, checked_at=first_run
+        )
+        await repository.save_alive_statuses({1: "blocked"}, checked_at=second_run)
+        await native_db_session.commit()
+
+        assert await alive_statuses(native_db_session) == [
+            (1, "blocked", second_run, PROFILE_UPDATED),
+            (2, "blocked", first_run, PROFILE_UPDATED),
+            (3, "deleted", first_run, PROFILE_UPDATED),
+            (4, None, None, PROFILE_UPDATED),
+        ]
+
+    async def test_ignores_unknown_users(self, native_db_session: AsyncSession):
+        await seed_users(native_db_session, 1)
+        repository = AdminRepositoryImpl(native_db_session)
+        checked_at = datetime(2026, 3, 1, tzinfo=UTC)
+
+        await repository.save_alive_statuses({1: "alive", 2: "alive"}, checked_at)
+        await native_db_session.commit()
+
+        assert await alive_statuses(native_db_session) == [
+            (1, "alive", checked_at, PROFILE_UPDATED),
+        ]
+
+    async def test_skips_recently_checked_users(self, native_db_session: AsyncSession):
+        await seed_users(native_db_session, 1, 2, 3)
+        repository = AdminRepositoryImpl(native_db_session)
+        now = datetime.now(UTC)
+        await repository.save_alive_statuses({1: "alive"}, now - timedelta(days=1))
+        await repository.save_alive_statuses({2: "alive"}, now - timedelta(days=30))
+        await native_db_session.commit()
+
+        count = await repository.count_user_ids(skip_checked_within_days=7)
+        user_ids = [
+            user_id
+            async for chunk in repository.iter_user_ids(skip_checked_within_days=7)
+            for user_id in chunk
+        ]
+
+        assert count == 2
+        assert user_ids == [2, 3]
@@ -0,0 +1,76 @@
+from collections.abc import AsyncIterator
+from typing import Any
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession
+
+from src.infrastructure.db.repos import AdminRepositoryImpl
+
+ACTIVITY_INDEX = "ix_users_last_login_at"
+
+
+@pytest.fixture
+async def connection(sqlalchemy_engine: AsyncEngine) -> AsyncIterator[AsyncConnection]:
+    # Users seen over the last ~3 years, one per hour, so that a "last day"
+    # filter matches 24 of them. Rolled back at the end.
+    async with sqlalchemy_engine.connect() as conn, conn.begin() as transaction:
+        await conn.execute(
+            text(
+                "INSERT INTO users (id, first_name, last_login_at)"
+                " SELECT 10000000 + g, 'User', now() - g * interval '1 hour'"
+                " FROM generate_series(1, 25000) g"
+            )
+        )
+        await conn.execute(text("ANALYZE users"))
+        yield conn
+        await transaction.rollback()
+
+
+async def explain_statements(
+    conn: AsyncConnection, statements: list[tuple[str, Any]]
+) -> list[str]:
+    plans = []
+    for statement, parameters in statements:
+        result = await conn.exec_driver_sql(f"EXPLAIN {statement}", parameters)
+        plans.append("\n".join(row[0] for row in result))
+    return plans
+
+
+async def captured(conn: AsyncConnection, query: Any) -> list[tuple[str, Any]]:
+    """Run ``query(repository)`` and return the SQL it sent."""
+    statements: list[tuple[str, Any]] = []
+
+    def capture(_conn, _cursor, statement, parameters, _context, _many) -> None:
+        statements.append((statement, parameters))
+
+    sync_engine = conn.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", capture)
+    try:
+        session = AsyncSession(bind=conn, join_transaction_mode="create_savepoint")
+        await query(AdminRepositoryImpl(session))
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", capture)
+    return [(s, p) for s, p in statements if "last_login_at" in s]
+
+
+class TestActivityFilterPlans:
+    async def test_count_uses_last_login_index(self, connection: AsyncConnection):
+        statements = await captured(
+            connection, lambda repo: repo.count_user_ids(active_since_days=1)
+        )
+
+        [plan] = await explain_statements(connection, statements)
+        assert ACTIVITY_INDEX in plan
+        assert "Seq Scan" not in plan
+
+    async def test_id_chunks_use_last_login_index(self, connection: AsyncConnection):
+        async def first_chunk(repo: AdminRepositoryImpl) -> None:
+            async for _ in repo.iter_user_ids(active_since_days=1, chunk_size=10):
+                break
+
+        statements = await captured(connection, first_chunk)
+
+        [plan] = await explain_statements(connection, statements)
+        assert ACTIVITY_INDEX in plan
+        assert "Seq Scan" not in plan
@@ -0,0 +1,192 @@
+import asyncio
+from datetime import UTC, datetime
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.domain.referral import RollupBatch
+from src.domain.user.vo import UserId
+from src.infrastructure.db.repos import ReferralEventRepositoryImpl
+
+MORNING = datetime(2026, 3, 10, 9, 15, tzinfo=UTC)
+NOON = datetime(2026, 3, 10, 12, 40, tzinfo=UTC)
+
+
+async def add_events(
+    session_maker: async_sessionmaker[AsyncSession],
+    *events: tuple[int, datetime],
+    counted: bool = True,
+) -> None:
+    """Log each ``(referrer_id, created_at)`` in its own transaction."""
+    for user_id, (referrer_id, created_at) in enumerate(events, start=100):
+        async with session_maker() as session:
+            await session.execute(
+                text(
+                    "INSERT INTO referral_events"
+                    " (referrer_id, user_id, created_at, counted)"
+                    " VALUES (:referrer_id, :user_id, :created_at, :counted)"
+                ),
+                {
+                    "referrer_id": referrer_id,
+                    "user_id": user_id,
+                    "created_at": created_at,
+                    "counted": counted,
+                },
+            )
+            await session.commit()
+
+
+async def refresh(
+    session_maker: async_sessionmaker[AsyncSession], batch_size: int = 100
+) -> RollupBatch:
+    async with session_maker() as session:
+        batch = await ReferralEventRepositoryImpl(session).refresh_rollups(batch_size)
+        await session.commit()
+        return batch
+
+
+async def rollups(session: AsyncSession, table: str) -> list[tuple]:
+    result = await session.execute(
+        text(f"SELECT bucket, referrer_id, referrals FROM {table} ORDER BY 1, 2")  # noqa: S608
+    )
+    return [tuple(row) for row in result]
+
+
+class TestRefreshRollups:
+    async def test_folds_events_into_hourly_and_daily_buckets(
+        self,
+        native_db_session: AsyncSession,
+        async_session_maker: async_sessionmaker[AsyncSession],
+    ):
+        await add_events(
+            async_session_maker, (1, MORNING), (1, MORNING), (2, NOON), (1, NOON)
+        )
+
+        batch = await refresh(async_session_maker)
+
+        assert batch.events == 4
+        assert await rollups(native_db_session, "referral_rollups_hourly") == [
+            (datetime(2026, 3, 10, 9, tzinfo=UTC), 1, 2),
+            (datetime(2026, 3, 10, 12, tzinfo=UTC), 1, 1),
+            (datetime(2026, 3, 10, 12, tzinfo=UTC), 2, 1),
+        ]
+        assert await rollups(native_db_session, "referral_rollups_daily") == [
+            (datetime(2026, 3, 10, tzinfo=UTC), 1, 3),
+            (datetime(2026, 3, 10, tzinfo=UTC), 2, 1),
+        ]
+
+    async def test_watermark_folds_each_event_once(
+        self,
+        native_db_session: AsyncSession,
+        async_session_maker: async_sessionmaker[AsyncSession],
+    ):
+        await add_events(async_session_maker, (1, MORNING), (1, MORNING), (1, NOON))
+
+        first = await refresh(async_session_maker, batch_size=2)
+        second = await refresh(async_session_maker, batch_size=2)
+        third = await refresh(async_session_maker, batch_size=2)
+        await add_events(async_session_maker, (1, NOON))
+        fourth = await refresh(async_session_maker, batch_size=2)
+
+        assert [b.events for b in (first, second, third, fourth)] == [2, 1, 0, 1]
+        assert await rollups(native_db_session, "referral_rollups_daily") == [
+            (datetime(2026, 3, 10, tzinfo=UTC), 1, 4),
+        ]
+
+    async def test_leaves_events_of_open_transactions_for_later(
+        self,
+        native_db_session: AsyncSession,
+        async_session_maker: async_sessionmaker[AsyncSession],
+    ):
+        async with async_session_maker() as open_session:
+            await ReferralEventRepositoryImpl(open_session).add_event(
+                UserId(1), UserId(100)
+            )
+            await add_events(async_session_maker, (2, NOON))
+
+            # Neither waits for the open transaction nor skips its event.
+            batch = await asyncio.wait_for(refresh(async_session_maker), 5)
+            assert batch.events == 0
+
+            await open_session.commit()
+
+        batch = await refresh(async_session_maker)
+
+        assert batch.events == 2
+        daily = await rollups(native_db_session, "referral_rollups_daily")
+        assert sorted((referrer_id, n) for _, referrer_id, n in daily) == [
+            (1, 1),
+            (2, 1),
+        ]
+
+    async def test_applies_deferred_referral_counts(
+        self,
+        native_db_session: AsyncSession,
+        async_session_maker: async_sessionmaker[AsyncSession],
+    ):
+        await native_db_session.execute(
+            text(
+                "INSERT INTO users (id, first_name, referral_count)"
+                " VALUES (1, 'Ann', 5), (2, 'Bob', 1)"
+            )
+        )
+        await native_db_session.commit()
+        await add_events(async_session_maker, (1, NOON), (1, NOON), counted=False)
+        await add_events(async_session_maker, (2, NOON))
+
+        batch = await refresh(async_session_maker)
+
+        assert batch.referrer_ids == [1]
+        counts = await native_db_session.execute(
+            text("SELECT id, referral_count FROM users ORDER BY id")
+        )
+        assert counts.all() == [(1, 7), (2, 1)]
+
+
+class TestGetPeriodStats:
+    async def test_sums_buckets_from_period_start(
+        self,
+        native_db_session: AsyncSession,
+        async_session_maker: async_sessionmaker[AsyncSession],
+    ):
+        await native_db_session.execute(
+            text(
+                "INSERT INTO users (id, first_name, username)"
+                " VALUES (1, 'Ann', 'ann_ref'), (2, 'Bob', NULL), (3, 'Cy', NULL)"
+            )
+        )
+        await native_db_session.commit()
+        await add_events(
+            async_session_maker,
+            (1, MORNING),
+            (2, NOON),
+            (2, NOON),
+            (3, NOON),
+            (3, NOON),
+        )
+        await refresh(async_session_maker)
+        repository = ReferralEventRepositoryImpl(native_db_session)
+
+        day = await repository.get_period_stats(
+            datetime(2026, 3, 10, tzinfo=UTC), "day", limit=2
+        )
+        afternoon = await repository.get_period_stats(
+            datetime(2026, 3, 10, 10, tzinfo=UTC), "hour"
+        )
+
+        assert day.referrals == 5
+        # Ties are broken by the higher user id.
+        assert [(r.user_id, r.referral_count) for r in day.top_referrers] == [
+            (3, 2),
+            (2, 2),
+        ]
+        assert afternoon.referrals == 4
+        assert 1 not in {r.user_id for r in afternoon.top_referrers}
+
+    async def test_empty_period(self, native_db_session: AsyncSession):
+        stats = await ReferralEventRepositoryImpl(native_db_session).get_period_stats(
+            datetime(2026, 3, 10, tzinfo=UTC), "day"
+        )
+
+        assert stats.referrals == 0
+        assert stats.top_referrers == []
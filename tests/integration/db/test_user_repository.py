@@ -0,0 +1,211 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.user.entity import User
+from src.domain.user.vo import FirstName, LanguageCode, LastName, UserId, Username
+from src.infrastructure.db.repos import UserRepositoryImpl
+from src.infrastructure.db.repos.user_asyncpg import AsyncpgUserRepository
+
+SIGNUP = datetime(2026, 1, 1, tzinfo=UTC)
+GRANULARITY = timedelta(minutes=1)
+
+
+def telegram_user(
+    seen_at: datetime, first_name: str = "John", user_id: int = 1
+) -> User:
+    """The user as built from a Telegram update seen at ``seen_at``."""
+    return User(
+        id=UserId(user_id),
+        first_name=FirstName(first_name),
+        last_name=LastName("Doe"),
+        username=Username("johndoe"),
+        bio=None,
+        created_at=seen_at,
+        updated_at=seen_at,
+        last_login_at=seen_at,
+    )
+
+
+@pytest.fixture(
+    params=[UserRepositoryImpl, AsyncpgUserRepository], ids=["orm", "asyncpg"]
+)
+def repository(request, native_db_session: AsyncSession) -> UserRepositoryImpl:
+    return request.param(native_db_session)
+
+
+async def stored_row(session: AsyncSession) -> dict:
+    # xmin changes whenever the row is rewritten.
+    result = await session.execute(
+        text("SELECT xmin::text AS version, * FROM users WHERE id = 1")
+    )
+    return dict(result.mappings().one())
+
+
+class TestUpsertUser:
+    async def test_insert_returns_new_user(
+        self, repository: UserRepositoryImpl, native_db_session: AsyncSession
+    ):
+        user = await repository.upsert_user(telegram_user(SIGNUP), GRANULARITY)
+        await native_db_session.commit()
+
+        assert user.is_new
+        assert user.created_at == SIGNUP
+        row = await stored_row(native_db_session)
+        assert row["first_name"] == "John"
+        assert row["created_at"] == row["last_login_at"] == SIGNUP
+
+    async def test_first_update_is_written_and_not_new(
+        self, repository: UserRepositoryImpl, native_db_session: AsyncSession
+    ):
+        await repository.upsert_user(telegram_user(SIGNUP), GRANULARITY)
+        await native_db_session.commit()
+        seen_at = SIGNUP + timedelta(seconds=5)
+
+        # Within the window, but a new row is always touched once.
+        user = await repository.upsert_user(telegram_user(seen_at), GRANULARITY)
+        await native_db_session.commit()
+
+        assert not user.is_new
+        assert user.created_at == SIGNUP
+        assert user.last_login_at == seen_at
+
+    async def test_unchanged_profile_within_window_is_not_written(
+        self, repository: UserRepositoryImpl, native_db_session: AsyncSession
+    ):
+        await repository.upsert_user(telegram_user(SIGNUP), GRANULARITY)
+        seen_at = SIGNUP + timedelta(hours=1)
+        await repository.upsert_user(telegram_user(seen_at), GRANULARITY)
+        await native_db_session.commit()
+        before = await stored_row(native_db_session)
+
+        user = await repository.upsert_user(
+            telegram_user(seen_at + timedelta(seconds=30)), GRANULARITY
+        )
+        await native_db_session.commit()
+
+        assert await stored_row(native_db_session) == before
+        # The stored row is still returned.
+        assert user.last_login_at == seen_at
+        assert user.first_name == FirstName("John")
+        assert not user.is_new
+
+    async def test_stale_last_login_is_written(
+        self, repository: UserRepositoryImpl, native_db_session: AsyncSession
+    ):
+        await repository.upsert_user(telegram_user(SIGNUP), GRANULARITY)
+        seen_at = SIGNUP + timedelta(hours=1)
+        await repository.upsert_user(telegram_user(seen_at), GRANULARITY)
+
+        user = await repository.upsert_user(
+            telegram_user(seen_at + GRANULARITY), GRANULARITY
+        )
+        await native_db_session.commit()
+
+        assert user.last_login_at == seen_at + GRANULARITY
+
+    async def test_profile_change_is_written(
+        self, repository: UserRepositoryImpl, native_db_session: AsyncSession
+    ):
+        await repository.upsert_user(telegram_user(SIGNUP), GRANULARITY)
+        seen_at = SIGNUP + timedelta(hours=1)
+        await repository.upsert_user(telegram_user(seen_at), GRANULARITY)
+        await native_db_session.commit()
+
+        changed_at = seen_at + timedelta(seconds=30)
+        user = await repository.upsert_user(
+            telegram_user(changed_at, first_name="Johnny"), GRANULARITY
+        )
+        await native_db_session.commit()
+
+        assert user.first_name == FirstName("Johnny")
+        assert user.last_login_at == changed_at
+        row = await stored_row(native_db_session)
+        assert row["first_name"] == "Johnny"
+        assert row["created_at"] == SIGNUP
+
+    async def test_preserves_fields_not_from_telegram(
+        self, repository: UserRepositoryImpl, native_db_session: AsyncSession
+    ):
+        await repository.upsert_user(telegram_user(SIGNUP), GRANULARITY)
+        await native_db_session.execute(
+            text(
+                "UPDATE users SET bio = 'Hello', referral_count = 7,"
+                " language_code = 'ru' WHERE id = 1"
+            )
+        )
+        await native_db_session.commit()
+
+        user = await repository.upsert_user(
+            telegram_user(SIGNUP + timedelta(hours=1), first_name="Johnny"),
+            GRANULARITY,
+        )
+        await native_db_session.commit()
+
+        assert user.bio.value == "Hello"
+        assert user.referral_count.value == 7
+        assert user.language_code == LanguageCode("ru")
+        row = await stored_row(native_db_session)
+        assert (row["bio"], row["referral_count"], row["language_code"]) == (
+            "Hello",
+            7,
+            "ru",
+        )
+
+
+class TestUserCounters:
+    async def test_create_and_upsert_count_new_users_once(
+        self, repository: UserRepositoryImpl, native_db_session: AsyncSession
+    ):
+        await repository.create_user(telegram_user(SIGNUP))
+        await repository.upsert_user(telegram_user(SIGNUP, user_id=2))
+        await repository.upsert_user(
+            telegram_user(SIGNUP + timedelta(hours=1), user_id=2)
+        )
+        await native_db_session.commit()
+
+        stats = await repository.get_referral_stats()
+
+        assert stats.total_users == 2
+        assert stats.referred_count == 0
+
+    async def test_set_referred_by_counts_first_referrer_only(
+        self, repository: UserRepositoryImpl, native_db_session: AsyncSession
+    ):
+        for user_id in (1, 2, 3):
+            await repository.upsert_user(telegram_user(SIGNUP, user_id=user_id))
+        await repository.set_referred_by(UserId(1), UserId(2))
+        await repository.set_referred_by(UserId(1), UserId(3))
+        await native_db_session.commit()
+
+        stats = await repository.get_referral_stats()
+
+        assert (stats.total_users, stats.referred_count) == (3, 1)
+
+    async def test_reconcile_fixes_drift(
+        self, repository: UserRepositoryImpl, native_db_session: AsyncSession
+    ):
+        await repository.upsert_user(telegram_user(SIGNUP))
+        # Rows written around the repository, e.g. by a bulk import.
+        await native_db_session.execute(
+            text(
+                "INSERT INTO users (id, first_name, referred_by)"
+                " VALUES (2, 'Ann', NULL), (3, 'Bob', 2)"
+            )
+        )
+        await repository.set_referred_by(UserId(1), UserId(2))
+        await native_db_session.commit()
+
+        drift = await repository.reconcile_referral_stats()
+        await native_db_session.commit()
+
+        assert (drift.total_users, drift.referred_count) == (2, 1)
+        assert (drift.stats.total_users, drift.stats.referred_count) == (3, 2)
+        stats = await repository.get_referral_stats()
+        assert (stats.total_users, stats.referred_count) == (3, 2)
+        counters = await native_db_session.execute(
+            text("SELECT count(*) FROM user_counters")
+        )
+        assert counters.scalar() == 2
@@ -0,0 +1,205 @@
+import asyncio
+import time
+from array import array
+from collections.abc import AsyncIterator
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from aiogram.exceptions import TelegramForbiddenError, TelegramRetryAfter
+
+from src.application.admin import CheckAliveInput, CheckAliveInteractor
+from src.application.admin.check_alive import (
+    INITIAL_CONCURRENCY,
+    MAX_ATTEMPTS,
+    SAVE_BATCH_SIZE,
+)
+
+
+def admin_repository(user_ids: list[int], count: int | None = None) -> Mock:
+    async def iter_user_ids(
+        active_since_days: int | None = None,
+        skip_checked_within_days: int | None = None,
+        chunk_size: int = 1000,
+    ) -> AsyncIterator[array[int]]:
+        for start in range(0, len(user_ids), chunk_size):
+            yield array("q", user_ids[start : start + chunk_size])
+
+    repository = Mock()
+    repository.count_user_ids = AsyncMock(
+        return_value=len(user_ids) if count is None else count
+    )
+    repository.iter_user_ids = Mock(side_effect=iter_user_ids)
+    repository.save_alive_statuses = AsyncMock()
+    return repository
+
+
+def check_alive(
+    repository: Mock, transaction_manager: AsyncMock | None = None
+) -> CheckAliveInteractor:
+    return CheckAliveInteractor(
+        admin_repository=repository,
+        transaction_manager=transaction_manager or AsyncMock(),
+    )
+
+
+@pytest.fixture
+def bot() -> Mock:
+    bot = Mock()
+    bot.send_chat_action = AsyncMock()
+    return bot
+
+
+class TestCheckAliveInteractor:
+    async def test_streams_users_and_reports_progress(self, bot: Mock) -> None:
+        repository = admin_repository(list(range(1, 2501)))
+        interactor = check_alive(repository)
+
+        progress = [
+            p
+            async for p in interactor.execute(bot, CheckAliveInput(active_since_days=7))
+        ]
+
+        repository.iter_user_ids.assert_called_once_with(
+            active_since_days=7, skip_checked_within_days=None, chunk_size=1000
+        )
+        assert bot.send_chat_action.await_count == 2500
+        assert [p.processed for p in progress] == list(range(100, 2501, 100))
+        assert progress[-1].total == 2500
+        assert progress[-1].current_result.alive == 2500
+        assert progress[-1].throughput > 0
+        assert progress[-1].concurrency >= 1
+
+    async def test_slow_user_does_not_hold_back_others(self, bot: Mock) -> None:
+        others_done = asyncio.Event()
+        checked = 0
+
+        async def send_chat_action(chat_id: int, action: str) -> None:
+            nonlocal checked
+            if chat_id == 1:
+                # Would deadlock if user 1 waited for the rest of its batch.
+                await asyncio.wait_for(others_done.wait(), 5)
+            checked += 1
+            if checked == 199:
+                others_done.set()
+
+        bot.send_chat_action.side_effect = send_chat_action
+        interactor = check_alive(admin_repository(list(range(1, 201))))
+
+        progress = [p async for p in interactor.execute(bot, CheckAliveInput())]
+
+        assert progress[-1].current_result.alive == 200
+
+    async def test_retries_rate_limited_user(self, bot: Mock) -> None:
+        bot.send_chat_action.side_effect = [
+            TelegramRetryAfter(method=Mock(), message="flood", retry_after=0),
+            *[None] * 100,
+        ]
+        interactor = check_alive(admin_repository(list(range(1, 101))))
+
+        progress = [p async for p in interactor.execute(bot, CheckAliveInput())]
+
+        result = progress[-1].current_result
+        assert result.alive == 100
+        assert result.retried == 1
+        assert result.gave_up == 0
+        assert bot.send_chat_action.await_count == 101
+
+    async def test_gives_up_after_max_attempts(self, bot: Mock) -> None:
+        async def send_chat_action(chat_id: int, action: str) -> None:
+            if chat_id == 1:
+                raise TelegramRetryAfter(method=Mock(), message="flood", retry_after=0)
+
+        bot.send_chat_action.side_effect = send_chat_action
+        interactor = check_alive(admin_repository([1, 2]))
+
+        progress = [p async for p in interactor.execute(bot, CheckAliveInput())]
+
+        result = progress[-1].current_result
+        assert (result.total, result.alive, result.gave_up) == (2, 1, 1)
+        assert result.retried == 0
+        assert bot.send_chat_action.await_count == MAX_ATTEMPTS + 1
+
+    async def test_flood_wait_pauses_all_workers(self, bot: Mock) -> None:
+        sent_at: list[float] = []
+
+        async def send_chat_action(chat_id: int, action: str) -> None:
+            sent_at.append(time.monotonic())
+            if len(sent_at) == 1:
+                raise TelegramRetryAfter(method=Mock(), message="flood", retry_after=1)
+
+        bot.send_chat_action.side_effect = send_chat_action
+        interactor = check_alive(admin_repository(list(range(1, 11))))
+
+        started = time.monotonic()
+        [p async for p in interactor.execute(bot, CheckAliveInput())]
+
+        # Sends started together with the rate-limited one may go through;
+        # everything after it waits for the flood wait to end.
+        assert len(sent_at) == 11
+        assert sum(t - started >= 1 for t in sent_at) >= 11 - INITIAL_CONCURRENCY
+
+    async def test_counts_blocked_users(self, bot: Mock) -> None:
+        bot.send_chat_action.side_effect = [
+            None,
+            TelegramForbiddenError(method=Mock(), message="blocked"),
+        ]
+        interactor = check_alive(admin_repository([1, 2]))
+
+        progress = [p async for p in interactor.execute(bot, CheckAliveInput())]
+
+        assert len(progress) == 1
+        result = progress[0].current_result
+        assert (result.total, result.alive, result.blocked) == (2, 1, 1)
+
+    async def test_final_report_is_exact_when_count_was_off(self, bot: Mock) -> None:
+        repository = admin_repository(list(range(1, 151)), count=200)
+        interactor = check_alive(repository)
+
+        progress = [p async for p in interactor.execute(bot, CheckAliveInput())]
+
+        assert [(p.processed, p.total) for p in progress] == [(100, 200), (150, 150)]
+
+    async def test_no_users_yields_nothing(self, bot: Mock) -> None:
+        interactor = check_alive(admin_repository([]))
+
+        progress = [p async for p in interactor.execute(bot, CheckAliveInput())]
+
+        assert progress == []
+        bot.send_chat_action.assert_not_awaited()
+
+    async def test_saves_statuses_in_batches(self, bot: Mock) -> None:
+        async def send_chat_action(chat_id: int, action: str) -> None:
+            if chat_id == 2:
+                raise TelegramForbiddenError(method=Mock(), message="blocked")
+            if chat_id == 3:
+                raise TelegramRetryAfter(method=Mock(), message="flood", retry_after=0)
+
+        bot.send_chat_action.side_effect = send_chat_action
+        repository = admin_repository(list(range(1, SAVE_BATCH_SIZE + 101)))
+        transaction_manager = AsyncMock()
+        interactor = check_alive(repository, transaction_manager)
+
+        [p async for p in interactor.execute(bot, CheckAliveInput())]
+
+        batches = [c.args[0] for c in repository.save_alive_statuses.await_args_list]
+        assert [len(batch) for batch in batches] == [SAVE_BATCH_SIZE, 99]
+        saved = batches[0] | batches[1]
+        assert saved[1] == "alive"
+        assert saved[2] == "blocked"
+        # Still rate limited after every attempt, so nothing is known.
+        assert 3 not in saved
+        assert transaction_manager.commit.await_count == 2
+
+    async def test_skips_recently_checked_users(self, bot: Mock) -> None:
+        repository = admin_repository([1, 2])
+        interactor = check_alive(repository)
+
+        data = CheckAliveInput(skip_checked_within_days=7)
+        [p async for p in interactor.execute(bot, data)]
+
+        repository.count_user_ids.assert_awaited_once_with(
+            active_since_days=None, skip_checked_within_days=7
+        )
+        assert (
+            repository.iter_user_ids.call_args.kwargs["skip_checked_within_days"] == 7
+        )
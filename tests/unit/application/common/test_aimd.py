@@ -0,0 +1,79 @@
+import asyncio
+import time
+
+import pytest
+
+from src.application.common.aimd import AimdLimiter
+
+
+class TestAimdLimiter:
+    async def test_grows_by_one_per_window_of_successes(self):
+        limiter = AimdLimiter(initial=2, maximum=10)
+
+        for _ in range(2):
+            epoch = await limiter.acquire()
+            await limiter.release(epoch, latency=0.1, overloaded=False)
+
+        assert limiter.limit == 2
+        epoch = await limiter.acquire()
+        await limiter.release(epoch, latency=0.1, overloaded=False)
+        assert limiter.limit == 3
+
+    async def test_halves_once_per_window_on_overload(self):
+        limiter = AimdLimiter(initial=8)
+        epochs = [await limiter.acquire() for _ in range(4)]
+
+        for epoch in epochs:
+            await limiter.release(epoch, latency=0.1, overloaded=True)
+
+        assert limiter.limit == 4
+        epoch = await limiter.acquire()
+        await limiter.release(epoch, latency=0.1, overloaded=True)
+        assert limiter.limit == 2
+
+    async def test_slow_answers_count_as_overload(self):
+        limiter = AimdLimiter(initial=4, latency_target=1.0)
+
+        epoch = await limiter.acquire()
+        await limiter.release(epoch, latency=2.5, overloaded=False)
+
+        assert limiter.limit == 2
+
+    async def test_stays_within_bounds(self):
+        limiter = AimdLimiter(initial=2, minimum=2, maximum=3)
+
+        for _ in range(20):
+            epoch = await limiter.acquire()
+            await limiter.release(epoch, latency=0.1, overloaded=False)
+        assert limiter.limit == 3
+
+        for _ in range(5):
+            epoch = await limiter.acquire()
+            await limiter.release(epoch, latency=0.1, overloaded=True)
+        assert limiter.limit == 2
+
+    async def test_acquire_waits_for_free_slot(self):
+        limiter = AimdLimiter(initial=1)
+        epoch = await limiter.acquire()
+
+        waiting = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        assert not waiting.done()
+
+        await limiter.release(epoch, latency=0.1, overloaded=False)
+        await asyncio.wait_for(waiting, 1)
+        assert limiter.in_flight == 1
+
+    def test_rejects_inconsistent_bounds(self):
+        with pytest.raises(ValueError):
+            AimdLimiter(initial=10, maximum=5)
+
+    async def test_pause_holds_back_new_calls(self):
+        limiter = AimdLimiter(initial=4)
+        limiter.pause(0.05)
+
+        started = time.monotonic()
+        epoch = await limiter.acquire()
+
+        assert time.monotonic() - started >= 0.05
+        await limiter.release(epoch, latency=0.1, overloaded=False)
@@ -0,0 +1,108 @@
+import asyncio
+
+import pytest
+
+from src.application.common.single_flight import SingleFlight
+
+
+class TestSingleFlight:
+    async def test_concurrent_calls_share_one_execution(self):
+        flight = SingleFlight()
+        calls = 0
+
+        async def operation() -> int:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return 42
+
+        results = await asyncio.gather(*(flight.do("k", operation) for _ in range(3)))
+
+        assert calls == 1
+        assert sorted(results) == [(42, False), (42, True), (42, True)]
+        assert flight.shared == 2
+
+    async def test_different_keys_run_separately(self):
+        flight = SingleFlight()
+
+        async def operation() -> int:
+            await asyncio.sleep(0)
+            return 1
+
+        results = await asyncio.gather(
+            flight.do("a", operation), flight.do("b", operation)
+        )
+
+        assert results == [(1, False), (1, False)]
+
+    async def test_sequential_calls_are_not_shared(self):
+        flight = SingleFlight()
+        calls = 0
+
+        async def operation() -> int:
+            nonlocal calls
+            calls += 1
+            return calls
+
+        assert await flight.do("k", operation) == (1, False)
+        assert await flight.do("k", operation) == (2, False)
+
+    async def test_error_is_shared(self):
+        flight = SingleFlight()
+
+        async def operation() -> int:
+            await asyncio.sleep(0.01)
+            raise RuntimeError("boom")
+
+        results = await asyncio.gather(
+            flight.do("k", operation), flight.do("k", operation), return_exceptions=True
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    async def test_waiter_takes_over_when_leader_is_cancelled(self):
+        flight = SingleFlight()
+        started = asyncio.Event()
+
+        async def slow() -> str:
+            started.set()
+            await asyncio.sleep(10)
+            return "slow"
+
+        async def fast() -> str:
+            return "fast"
+
+        leader = asyncio.create_task(flight.do("k", slow))
+        await started.wait()
+        follower = asyncio.create_task(flight.do("k", fast))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert await follower == ("fast", False)
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+
+    async def test_waiter_cancelled_with_leader_stays_cancelled(self):
+        flight = SingleFlight()
+        started = asyncio.Event()
+        runs = 0
+
+        async def slow() -> str:
+            nonlocal runs
+            runs += 1
+            started.set()
+            await asyncio.sleep(10)
+            return "slow"
+
+        leader = asyncio.create_task(flight.do("k", slow))
+        await started.wait()
+        follower = asyncio.create_task(flight.do("k", slow))
+        await asyncio.sleep(0)
+        leader.cancel()
+        follower.cancel()
+
+        results = await asyncio.gather(leader, follower, return_exceptions=True)
+
+        assert all(isinstance(r, asyncio.CancelledError) for r in results)
+        assert runs == 1
+        assert follower.cancelled()
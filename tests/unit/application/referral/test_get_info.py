@@ -9,7 +9,7 @@ from src.application.referral.get_info import (
     GetReferralInfoOutputDTO,
 )
 from src.domain.user import User
-from src.domain.user.services.referral import decode_referral
+from src.domain.user.services.referral import ReferralCodec, decode_referral
 from src.domain.user.vo import FirstName, ReferralCount, UserId
 
 
@@ -27,7 +27,7 @@ def user_repository() -> Mock:
 def interactor(user_repository: Mock, secret_key: str) -> GetReferralInfoInteractor:
     return GetReferralInfoInteractor(
         user_repository=user_repository,
-        secret_key=secret_key,
+        codec=ReferralCodec(secret_key),
     )
 
 
@@ -76,3 +76,18 @@ class TestGetReferralInfoInteractor:
         result = await interactor(GetReferralInfoInputDTO(user_id=999))
 
         assert result is None
+
+    async def test_known_referral_count_skips_read(
+        self,
+        interactor: GetReferralInfoInteractor,
+        user_repository: Mock,
+    ) -> None:
+        user_repository.get_user = AsyncMock()
+
+        result = await interactor(
+            GetReferralInfoInputDTO(user_id=123456789, referral_count=3)
+        )
+
+        assert result is not None
+        assert result.referral_count == 3
+        user_repository.get_user.assert_not_called()
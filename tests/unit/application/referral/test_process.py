@@ -7,7 +7,9 @@ from src.application.referral.process import (
     ProcessReferralInteractor,
 )
 from src.domain.user.entity import User
-from src.domain.user.services.referral import encode_referral
+from src.domain.user.repository import TopReferrer
+from src.domain.user.services.referral import ReferralCodec, encode_referral
+from src.domain.user.vo import FirstName, UserId
 
 
 @pytest.fixture
@@ -20,6 +22,13 @@ def user_repository() -> Mock:
     return Mock()
 
 
+@pytest.fixture
+def referral_event_repository() -> Mock:
+    repository = Mock()
+    repository.add_event = AsyncMock()
+    return repository
+
+
 @pytest.fixture
 def transaction_manager() -> Mock:
     manager = Mock()
@@ -30,13 +39,15 @@ def transaction_manager() -> Mock:
 @pytest.fixture
 def interactor(
     user_repository: Mock,
+    referral_event_repository: Mock,
     transaction_manager: Mock,
     secret_key: str,
 ) -> ProcessReferralInteractor:
     return ProcessReferralInteractor(
         user_repository=user_repository,
+        referral_event_repository=referral_event_repository,
         transaction_manager=transaction_manager,
-        secret_key=secret_key,
+        codec=ReferralCodec(secret_key),
     )
 
 
@@ -63,6 +74,56 @@ class TestProcessReferralInteractor:
         assert result is True
         user_repository.set_referred_by.assert_called_once()
 
+    async def test_valid_referral_logs_event(
+        self,
+        interactor: ProcessReferralInteractor,
+        user_repository: Mock,
+        referral_event_repository: Mock,
+        secret_key: str,
+    ) -> None:
+        code = encode_referral(100, secret_key)
+        user_repository.get_user = AsyncMock(return_value=Mock(spec=User))
+        user_repository.set_referred_by = AsyncMock()
+        user_repository.increment_referral_count = AsyncMock()
+
+        await interactor(ProcessReferralInputDTO(new_user_id=200, referral_code=code))
+
+        referral_event_repository.add_event.assert_awaited_once_with(
+            UserId(100), UserId(200), counted=True
+        )
+
+    async def test_deferred_count_skips_referrer_row(
+        self,
+        user_repository: Mock,
+        referral_event_repository: Mock,
+        transaction_manager: Mock,
+        secret_key: str,
+    ) -> None:
+        leaderboard = Mock()
+        interactor = ProcessReferralInteractor(
+            user_repository=user_repository,
+            referral_event_repository=referral_event_repository,
+            transaction_manager=transaction_manager,
+            codec=ReferralCodec(secret_key),
+            leaderboard=leaderboard,
+            defer_count=True,
+        )
+        user_repository.get_user = AsyncMock(return_value=Mock(spec=User))
+        user_repository.set_referred_by = AsyncMock()
+        user_repository.increment_referral_count = AsyncMock()
+        code = encode_referral(100, secret_key)
+
+        result = await interactor(
+            ProcessReferralInputDTO(new_user_id=200, referral_code=code)
+        )
+
+        assert result is True
+        referral_event_repository.add_event.assert_awaited_once_with(
+            UserId(100), UserId(200), counted=False
+        )
+        user_repository.increment_referral_count.assert_not_awaited()
+        leaderboard.record.assert_not_called()
+
     async def test_invalid_code_returns_false(
         self,
         interactor: ProcessReferralInteractor,
@@ -101,3 +162,61 @@ class TestProcessReferralInteractor:
         )
 
         assert result is False
+
+    async def test_valid_referral_invalidates_cached_users(
+        self,
+        user_repository: Mock,
+        referral_event_repository: Mock,
+        transaction_manager: Mock,
+        secret_key: str,
+    ) -> None:
+        cache = Mock()
+        interactor = ProcessReferralInteractor(
+            user_repository=user_repository,
+            referral_event_repository=referral_event_repository,
+            transaction_manager=transaction_manager,
+            codec=ReferralCodec(secret_key),
+            user_cache=cache,
+        )
+        user_repository.get_user = AsyncMock(return_value=Mock(spec=User))
+        user_repository.set_referred_by = AsyncMock()
+        user_repository.increment_referral_count = AsyncMock()
+
+        await interactor(
+            ProcessReferralInputDTO(
+                new_user_id=200, referral_code=encode_referral(100, secret_key)
+            )
+        )
+
+        invalidated = {call.args[0] for call in cache.invalidate.call_args_list}
+        assert invalidated == {100, 200}
+
+    async def test_valid_referral_records_new_count_in_leaderboard(
+        self,
+        user_repository: Mock,
+        referral_event_repository: Mock,
+        transaction_manager: Mock,
+        secret_key: str,
+    ) -> None:
+        leaderboard = Mock()
+        interactor = ProcessReferralInteractor(
+            user_repository=user_repository,
+            referral_event_repository=referral_event_repository,
+            transaction_manager=transaction_manager,
+            codec=ReferralCodec(secret_key),
+            leaderboard=leaderboard,
+        )
+        referrer = Mock(spec=User, username=None, first_name=FirstName("Ann"))
+        user_repository.get_user = AsyncMock(return_value=referrer)
+        user_repository.set_referred_by = AsyncMock()
+        user_repository.increment_referral_count = AsyncMock(return_value=7)
+
+        await interactor(
+            ProcessReferralInputDTO(
+                new_user_id=200, referral_code=encode_referral(100, secret_key)
+            )
+        )
+
+        leaderboard.record.assert_called_once_with(
+            TopReferrer(user_id=100, username=None, first_name="Ann", referral_count=7)
+        )
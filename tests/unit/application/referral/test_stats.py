@@ -1,14 +1,25 @@
+from datetime import UTC, datetime
 from unittest.mock import AsyncMock, Mock
 
 import pytest
 
 from src.application.referral.stats import (
+    GetPeriodStatsInteractor,
     GetStatsInteractor,
     GetTopReferrersInteractor,
+    ReconcileStatsInteractor,
     StatsOutputDTO,
     TopReferrerDTO,
+    TopReferrersInputDTO,
+    period_start,
+)
+from src.domain.referral import ReferralPeriodStats
+from src.domain.user.repository import (
+    ReferralStats,
+    ReferralStatsDrift,
+    TopReferrer,
+    TopReferrerCursor,
 )
-from src.domain.user.repository import ReferralStats, TopReferrer
 
 
 class TestGetStatsInteractor:
@@ -56,6 +67,44 @@ class TestGetStatsInteractor:
         assert result.referred_percent == 0
         assert result.organic_percent == 0
 
+    async def test_passes_estimate_flag(self, user_repository: Mock) -> None:
+        user_repository.get_referral_stats = AsyncMock(
+            return_value=ReferralStats(
+                total_users=1000,
+                referred_count=250,
+                organic_count=750,
+                is_estimate=True,
+            )
+        )
+        interactor = GetStatsInteractor(user_repository=user_repository, estimate=True)
+
+        result = await interactor()
+
+        user_repository.get_referral_stats.assert_awaited_once_with(estimate=True)
+        assert result.is_estimate is True
+        assert result.referred_percent == 25.0
+
+
+class TestReconcileStatsInteractor:
+    async def test_commits_recomputed_counters(self) -> None:
+        drift = ReferralStatsDrift(
+            stats=ReferralStats(total_users=10, referred_count=4, organic_count=6),
+            total_users=2,
+            referred_count=0,
+        )
+        user_repository = Mock()
+        user_repository.reconcile_referral_stats = AsyncMock(return_value=drift)
+        transaction_manager = AsyncMock()
+        interactor = ReconcileStatsInteractor(
+            user_repository=user_repository,
+            transaction_manager=transaction_manager,
+        )
+
+        result = await interactor()
+
+        assert result is drift
+        transaction_manager.commit.assert_awaited_once()
+
 
 class TestGetTopReferrersInteractor:
     @pytest.fixture
@@ -80,9 +129,168 @@ class TestGetTopReferrersInteractor:
             ]
         )
 
-        result = await interactor(10)
+        result = await interactor(TopReferrersInputDTO(limit=10))
+
+        assert len(result.referrers) == 2
+        assert isinstance(result.referrers[0], TopReferrerDTO)
+        assert result.referrers[0].count == 10
+        assert result.referrers[1].username is None
+        assert result.has_next is False
+        assert result.has_prev is False
+
+    @staticmethod
+    def _referrers(*ids: int) -> list[TopReferrer]:
+        return [
+            TopReferrer(user_id=i, username=None, first_name="U", referral_count=5)
+            for i in ids
+        ]
+
+    async def test_fetches_one_extra_row_to_detect_next_page(
+        self, interactor: GetTopReferrersInteractor, user_repository: Mock
+    ) -> None:
+        user_repository.get_top_referrers = AsyncMock(
+            return_value=self._referrers(9, 8, 7)
+        )
+
+        result = await interactor(TopReferrersInputDTO(limit=2, cursor=(5, 10)))
+
+        user_repository.get_top_referrers.assert_awaited_once_with(
+            limit=3,
+            after=TopReferrerCursor(referral_count=5, user_id=10),
+            before=None,
+        )
+        assert [r.user_id for r in result.referrers] == [9, 8]
+        assert result.has_next is True
+        assert result.has_prev is True
+
+    async def test_pages_backwards_from_cursor(
+        self, interactor: GetTopReferrersInteractor, user_repository: Mock
+    ) -> None:
+        user_repository.get_top_referrers = AsyncMock(
+            return_value=self._referrers(13, 12, 11)
+        )
+
+        result = await interactor(
+            TopReferrersInputDTO(limit=2, cursor=(5, 10), backwards=True)
+        )
+
+        user_repository.get_top_referrers.assert_awaited_once_with(
+            limit=3,
+            after=None,
+            before=TopReferrerCursor(referral_count=5, user_id=10),
+        )
+        assert [r.user_id for r in result.referrers] == [12, 11]
+        assert result.has_next is True
+        assert result.has_prev is True
+
+    async def test_serves_page_from_leaderboard(self, user_repository: Mock) -> None:
+        leaderboard = Mock()
+        leaderboard.page.return_value = self._referrers(3, 2)
+        user_repository.get_top_referrers = AsyncMock()
+        interactor = GetTopReferrersInteractor(
+            user_repository=user_repository, leaderboard=leaderboard
+        )
+
+        result = await interactor(TopReferrersInputDTO(limit=10))
+
+        assert [r.user_id for r in result.referrers] == [3, 2]
+        leaderboard.page.assert_called_once_with(11, after=None, before=None)
+        user_repository.get_top_referrers.assert_not_awaited()
+
+    async def test_seeds_stale_leaderboard(self, user_repository: Mock) -> None:
+        seed = self._referrers(3, 2)
+        leaderboard = Mock(stale=True, version=4, capacity=100)
+        leaderboard.page.side_effect = [None, seed]
+        user_repository.get_top_referrers = AsyncMock(return_value=seed)
+        interactor = GetTopReferrersInteractor(
+            user_repository=user_repository, leaderboard=leaderboard
+        )
+
+        result = await interactor(TopReferrersInputDTO(limit=10))
+
+        assert [r.user_id for r in result.referrers] == [3, 2]
+        user_repository.get_top_referrers.assert_awaited_once_with(limit=100)
+        leaderboard.reset.assert_called_once_with(seed, 4)
+
+    async def test_falls_back_to_repository_past_leaderboard(
+        self, user_repository: Mock
+    ) -> None:
+        leaderboard = Mock(stale=False)
+        leaderboard.page.return_value = None
+        user_repository.get_top_referrers = AsyncMock(return_value=[])
+        interactor = GetTopReferrersInteractor(
+            user_repository=user_repository, leaderboard=leaderboard
+        )
+
+        await interactor(TopReferrersInputDTO(limit=10, cursor=(1, 5)))
+
+        user_repository.get_top_referrers.assert_awaited_once_with(
+            limit=11, after=TopReferrerCursor(1, 5), before=None
+        )
+        leaderboard.reset.assert_not_called()
+
+    async def test_backwards_to_first_page(
+        self, interactor: GetTopReferrersInteractor, user_repository: Mock
+    ) -> None:
+        user_repository.get_top_referrers = AsyncMock(
+            return_value=self._referrers(12, 11)
+        )
+
+        result = await interactor(
+            TopReferrersInputDTO(limit=2, cursor=(5, 10), backwards=True)
+        )
+
+        assert [r.user_id for r in result.referrers] == [12, 11]
+        assert result.has_prev is False
+
+
+class TestPeriodStart:
+    now = datetime(2026, 3, 10, 15, 42, 7, tzinfo=UTC)
+
+    def test_day_spans_24_hourly_buckets(self) -> None:
+        assert period_start("day", self.now) == (
+            datetime(2026, 3, 9, 16, tzinfo=UTC),
+            "hour",
+        )
+
+    @pytest.mark.parametrize(
+        ("period", "since"),
+        [
+            ("week", datetime(2026, 3, 4, tzinfo=UTC)),
+            ("month", datetime(2026, 2, 9, tzinfo=UTC)),
+        ],
+    )
+    def test_longer_periods_use_daily_buckets(
+        self, period: str, since: datetime
+    ) -> None:
+        assert period_start(period, self.now) == (since, "day")
+
+
+class TestGetPeriodStatsInteractor:
+    async def test_reads_rollups_from_period_start(self) -> None:
+        repository = Mock()
+        repository.get_period_stats = AsyncMock(
+            return_value=ReferralPeriodStats(
+                referrals=12,
+                top_referrers=[
+                    TopReferrer(
+                        user_id=1, username="ann", first_name="Ann", referral_count=7
+                    )
+                ],
+            )
+        )
+        interactor = GetPeriodStatsInteractor(
+            referral_event_repository=repository, limit=3
+        )
+
+        result = await interactor("week")
 
-        assert len(result) == 2
-        assert isinstance(result[0], TopReferrerDTO)
-        assert result[0].count == 10
-        assert result[1].username is None
+        since, granularity, *_ = repository.get_period_stats.await_args.args
+        assert granularity == "day"
+        assert since == result.since
+        assert repository.get_period_stats.await_args.kwargs == {"limit": 3}
+        assert result.period == "week"
+        assert result.referrals == 12
+        assert result.top_referrers == [
+            TopReferrerDTO(user_id=1, username="ann", first_name="Ann", count=7)
+        ]
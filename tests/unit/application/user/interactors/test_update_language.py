@@ -1,4 +1,5 @@
-from unittest.mock import AsyncMock
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
@@ -6,7 +7,8 @@ from src.application.user.interactors.update_language import (
     UpdateLanguageDTO,
     UpdateLanguageInteractor,
 )
-from src.domain.user.vo import LanguageCode, UserId
+from src.domain.user import User
+from src.domain.user.vo import FirstName, LanguageCode, ReferralCount, UserId
 
 
 class TestUpdateLanguageInteractor:
@@ -18,6 +20,22 @@ class TestUpdateLanguageInteractor:
     def mock_transaction_manager(self) -> AsyncMock:
         return AsyncMock()
 
+    @pytest.fixture
+    def sample_user(self) -> User:
+        now = datetime.now(UTC)
+        return User(
+            id=UserId(123456),
+            first_name=FirstName("John"),
+            last_name=None,
+            username=None,
+            bio=None,
+            created_at=now,
+            updated_at=now,
+            last_login_at=now,
+            referral_count=ReferralCount(2),
+            language_code=LanguageCode("ru"),
+        )
+
     @pytest.fixture
     def interactor(
         self, mock_user_repository: AsyncMock, mock_transaction_manager: AsyncMock
@@ -58,15 +76,54 @@ class TestUpdateLanguageInteractor:
 
         mock_transaction_manager.commit.assert_called_once()
 
-    async def test_update_language_returns_none(
+    async def test_update_language_returns_updated_user(
         self,
         interactor: UpdateLanguageInteractor,
+        mock_user_repository: AsyncMock,
+        sample_user: User,
     ) -> None:
-        user_id = UserId(123456)
-        language_code = LanguageCode("en")
+        mock_user_repository.update_language.return_value = sample_user
 
         result = await interactor(
-            UpdateLanguageDTO(user_id=user_id, language_code=language_code)
+            UpdateLanguageDTO(user_id=UserId(123456), language_code=LanguageCode("ru"))
+        )
+
+        assert result is not None
+        assert result.id == 123456
+        assert result.language_code == "ru"
+        assert result.referral_count == 2
+
+    async def test_update_language_unknown_user_returns_none(
+        self,
+        interactor: UpdateLanguageInteractor,
+        mock_user_repository: AsyncMock,
+    ) -> None:
+        mock_user_repository.update_language.return_value = None
+
+        result = await interactor(
+            UpdateLanguageDTO(user_id=UserId(123456), language_code=LanguageCode("en"))
         )
 
         assert result is None
+
+    async def test_update_language_caches_updated_user(
+        self,
+        mock_user_repository: AsyncMock,
+        mock_transaction_manager: AsyncMock,
+        sample_user: User,
+    ) -> None:
+        mock_user_repository.update_language.return_value = sample_user
+        cache = Mock()
+        interactor = UpdateLanguageInteractor(
+            user_repository=mock_user_repository,
+            transaction_manager=mock_transaction_manager,
+            user_cache=cache,
+        )
+
+        await interactor(
+            UpdateLanguageDTO(user_id=UserId(123456), language_code=LanguageCode("ru"))
+        )
+
+        cached = cache.set.call_args.args[0]
+        assert cached.language_code == "ru"
+        assert cached.is_new is False
@@ -1,8 +1,11 @@
+import asyncio
+from dataclasses import replace
 from datetime import UTC, datetime
 from unittest.mock import AsyncMock, Mock
 
 import pytest
 
+from src.application.common.single_flight import SingleFlight
 from src.application.user.create import (
     CreateUserInteractor,
 )
@@ -247,6 +250,184 @@ class TestCreateUserInteractor:
         assert result.is_new is False
 
 
+class TestCreateUserInteractorCache:
+    @pytest.fixture
+    def mock_user_service(self):
+        return Mock(spec=UserService)
+
+    @pytest.fixture
+    def mock_transaction_manager(self):
+        manager = Mock()
+        manager.commit = AsyncMock()
+        return manager
+
+    @pytest.fixture
+    def mock_user_cache(self):
+        cache = Mock()
+        cache.get = Mock(return_value=None)
+        return cache
+
+    @pytest.fixture
+    def mock_activity_buffer(self):
+        buffer = Mock()
+        buffer.record_seen = Mock(return_value=True)
+        return buffer
+
+    @pytest.fixture
+    def interactor(
+        self,
+        mock_user_service,
+        mock_transaction_manager,
+        mock_user_cache,
+        mock_activity_buffer,
+    ) -> CreateUserInteractor:
+        return CreateUserInteractor(
+            user_service=mock_user_service,
+            transaction_manager=mock_transaction_manager,
+            user_cache=mock_user_cache,
+            activity_buffer=mock_activity_buffer,
+        )
+
+    @pytest.fixture
+    def input_dto(self) -> CreateUserInputDTO:
+        return CreateUserInputDTO(
+            id=456, username="testuser", first_name="John", last_name="Doe"
+        )
+
+    @pytest.fixture
+    def cached_dto(self) -> CreateUserOutputDTO:
+        return CreateUserOutputDTO(
+            id=456,
+            username="testuser",
+            first_name="John",
+            last_name="Doe",
+            language_code="ru",
+        )
+
+    @pytest.fixture
+    def sample_new_user(self) -> User:
+        now = datetime.now(UTC)
+        return User(
+            id=UserId(456),
+            username=Username("testuser"),
+            first_name=FirstName("John"),
+            last_name=LastName("Doe"),
+            bio=None,
+            created_at=now,
+            updated_at=now,
+            last_login_at=now,
+        )
+
+    async def test_cached_user_is_served_without_db(
+        self,
+        *,
+        interactor,
+        mock_user_service,
+        mock_transaction_manager,
+        mock_user_cache,
+        mock_activity_buffer,
+        input_dto,
+        cached_dto,
+    ):
+        mock_user_cache.get.return_value = cached_dto
+        mock_user_service.upsert_user = AsyncMock()
+
+        result = await interactor(input_dto)
+
+        assert result is cached_dto
+        mock_activity_buffer.record_seen.assert_called_once()
+        mock_user_service.upsert_user.assert_not_called()
+        mock_transaction_manager.commit.assert_not_called()
+
+    async def test_cache_hit_without_write_behind(
+        self,
+        mock_user_service,
+        mock_transaction_manager,
+        mock_user_cache,
+        input_dto,
+        cached_dto,
+    ):
+        interactor = CreateUserInteractor(
+            user_service=mock_user_service,
+            transaction_manager=mock_transaction_manager,
+            user_cache=mock_user_cache,
+        )
+        mock_user_cache.get.return_value = cached_dto
+        mock_user_service.upsert_user = AsyncMock()
+
+        result = await interactor(input_dto)
+
+        assert result is cached_dto
+        mock_user_service.upsert_user.assert_not_called()
+
+    async def test_profile_change_is_written_through(
+        self,
+        *,
+        interactor,
+        mock_user_service,
+        mock_user_cache,
+        mock_activity_buffer,
+        input_dto,
+        cached_dto,
+    ):
+        mock_user_cache.get.return_value = replace(cached_dto, first_name="Johnny")
+        now = datetime.now(UTC)
+        mock_user_service.upsert_user = AsyncMock(
+            return_value=User(
+                id=UserId(456),
+                username=Username("testuser"),
+                first_name=FirstName("John"),
+                last_name=LastName("Doe"),
+                bio=None,
+                created_at=datetime(2024, 1, 1, tzinfo=UTC),
+                updated_at=now,
+                last_login_at=now,
+            )
+        )
+
+        result = await interactor(input_dto)
+
+        assert result.first_name == "John"
+        mock_user_service.upsert_user.assert_awaited_once()
+        mock_activity_buffer.record_seen.assert_not_called()
+        mock_user_cache.set.assert_called_once()
+
+    async def test_full_buffer_falls_back_to_write_through(
+        self,
+        *,
+        interactor,
+        mock_user_service,
+        mock_user_cache,
+        mock_activity_buffer,
+        input_dto,
+        cached_dto,
+        sample_new_user,
+    ):
+        mock_user_cache.get.return_value = cached_dto
+        mock_activity_buffer.record_seen.return_value = False
+        mock_user_service.upsert_user = AsyncMock(return_value=sample_new_user)
+
+        await interactor(input_dto)
+
+        mock_user_service.upsert_user.assert_awaited_once()
+
+    async def test_new_user_is_reported_once(
+        self,
+        interactor,
+        mock_user_service,
+        mock_user_cache,
+        input_dto,
+        sample_new_user,
+    ):
+        mock_user_service.upsert_user = AsyncMock(return_value=sample_new_user)
+
+        result = await interactor(input_dto)
+
+        assert result.is_new is True
+        cached = mock_user_cache.set.call_args.args[0]
+        assert cached.is_new is False
+
+
 class TestCreateUserInputDTO:
     def test_input_dto_creation(self):
         dto = CreateUserInputDTO(
@@ -301,3 +482,43 @@ class TestCreateUserOutputDTO:
         assert dto.username is None
         assert dto.first_name == "Jane"
         assert dto.last_name is None
+
+
+class TestCreateUserInteractorSingleFlight:
+    async def test_concurrent_duplicates_share_one_upsert(self):
+        now = datetime.now(UTC)
+        user = User(
+            id=UserId(456),
+            username=None,
+            first_name=FirstName("John"),
+            last_name=None,
+            bio=None,
+            created_at=now,
+            updated_at=now,
+            last_login_at=now,
+        )
+        user_service = Mock(spec=UserService)
+
+        async def upsert_user(_data: object) -> User:
+            await asyncio.sleep(0.01)
+            return user
+
+        user_service.upsert_user = AsyncMock(side_effect=upsert_user)
+        flight = SingleFlight()
+
+        def make_interactor() -> CreateUserInteractor:
+            transaction_manager = Mock()
+            transaction_manager.commit = AsyncMock()
+            return CreateUserInteractor(
+                user_service=user_service,
+                transaction_manager=transaction_manager,
+                single_flight=flight,
+            )
+
+        data = CreateUserInputDTO(
+            id=456, username=None, first_name="John", last_name=None
+        )
+        results = await asyncio.gather(make_interactor()(data), make_interactor()(data))
+
+        user_service.upsert_user.assert_awaited_once()
+        assert sorted(r.is_new for r in results) == [False, True]
@@ -0,0 +1,74 @@
+from datetime import timedelta
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.application.user.service import UpsertUserData, UserService
+from src.domain.user import User
+from src.domain.user.vo import FirstName, LastName, UserId, Username
+
+
+class TestUserServiceUpsert:
+    @pytest.fixture
+    def mock_user_repository(self):
+        repository = Mock()
+        repository.upsert_user = AsyncMock(side_effect=lambda user, **_: user)
+        repository.get_user = AsyncMock()
+        repository.create_user = AsyncMock()
+        repository.update_user = AsyncMock()
+        return repository
+
+    @pytest.fixture
+    def service(self, mock_user_repository) -> UserService:
+        return UserService(mock_user_repository)
+
+    async def test_upsert_is_a_single_repository_call(
+        self, service, mock_user_repository
+    ):
+        await service.upsert_user(
+            UpsertUserData(
+                id=456, username="testuser", first_name="John", last_name="Doe"
+            )
+        )
+
+        mock_user_repository.upsert_user.assert_awaited_once()
+        mock_user_repository.get_user.assert_not_called()
+        mock_user_repository.create_user.assert_not_called()
+        mock_user_repository.update_user.assert_not_called()
+
+    async def test_upsert_builds_user_from_data(self, service, mock_user_repository):
+        result = await service.upsert_user(
+            UpsertUserData(
+                id=456, username="testuser", first_name="John", last_name="Doe"
+            )
+        )
+
+        user: User = mock_user_repository.upsert_user.await_args.args[0]
+        assert user.id == UserId(456)
+        assert user.username == Username("testuser")
+        assert user.first_name == FirstName("John")
+        assert user.last_name == LastName("Doe")
+        assert user.bio is None
+        assert user.created_at == user.last_login_at
+        assert result is user
+
+    async def test_upsert_without_optional_fields(self, service, mock_user_repository):
+        await service.upsert_user(
+            UpsertUserData(id=789, username=None, first_name="Jane", last_name=None)
+        )
+
+        user: User = mock_user_repository.upsert_user.await_args.args[0]
+        assert user.username is None
+        assert user.last_name is None
+
+    async def test_upsert_passes_last_seen_granularity(self, mock_user_repository):
+        service = UserService(
+            mock_user_repository, last_seen_granularity=timedelta(seconds=60)
+        )
+
+        await service.upsert_user(
+            UpsertUserData(id=789, username=None, first_name="Jane", last_name=None)
+        )
+
+        kwargs = mock_user_repository.upsert_user.await_args.kwargs
+        assert kwargs["last_seen_granularity"] == timedelta(seconds=60)
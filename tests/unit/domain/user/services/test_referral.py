@@ -1,6 +1,10 @@
 import pytest
 
-from src.domain.user.services.referral import decode_referral, encode_referral
+from src.domain.user.services.referral import (
+    ReferralCodec,
+    decode_referral,
+    encode_referral,
+)
 
 
 class TestReferralEncoding:
@@ -48,3 +52,34 @@ class TestReferralEncoding:
         code = encode_referral(user_id, secret)
         decoded = decode_referral(code, secret)
         assert decoded == user_id
+
+
+class TestReferralCodec:
+    @pytest.fixture
+    def codec(self) -> ReferralCodec:
+        return ReferralCodec("test-secret")
+
+    def test_matches_module_functions(self, codec: ReferralCodec) -> None:
+        code = codec.encode(123456789)
+
+        assert code == encode_referral(123456789, "test-secret")
+        assert codec.decode(code) == 123456789
+
+    def test_encode_many_matches_encode(self, codec: ReferralCodec) -> None:
+        user_ids = [0, 1, 100, 999999999, 2**64 - 1]
+
+        codes = codec.encode_many(user_ids)
+
+        assert codes == [codec.encode(user_id) for user_id in user_ids]
+        assert codec.decode_many(codes) == user_ids
+
+    def test_decode_many_marks_invalid_codes(self, codec: ReferralCodec) -> None:
+        valid = codec.encode(42)
+
+        result = codec.decode_many([valid, "invalid!", "", "AAAAAAAAAA="])
+
+        assert result == [42, None, None, None]
+
+    def test_empty_batches(self, codec: ReferralCodec) -> None:
+        assert codec.encode_many([]) == []
+        assert codec.decode_many([]) == []
@@ -1,6 +1,16 @@
+import copy
+
 import pytest
 
-from src.domain.user.vo import Bio, FirstName, LastName, ReferralCount, UserId, Username
+from src.domain.user.vo import (
+    Bio,
+    FirstName,
+    LanguageCode,
+    LastName,
+    ReferralCount,
+    UserId,
+    Username,
+)
 
 
 class TestUserId:
@@ -266,3 +276,70 @@ class TestValueObjectsEquality:
         last_name = LastName("test")
 
         assert first_name != last_name
+
+
+class TestTrustedConstruction:
+    @pytest.mark.parametrize(
+        ("vo_class", "value"),
+        [(UserId, 123), (FirstName, "John"), (Username, "johndoe"), (Bio, "")],
+    )
+    def test_equals_validated_instance(self, vo_class, value):
+        trusted = vo_class.trusted(value)
+
+        assert type(trusted) is vo_class
+        assert trusted == vo_class(value)
+        assert hash(trusted) == hash(vo_class(value))
+
+    def test_skips_validation(self):
+        # Only safe for values validated before they were stored.
+        assert UserId.trusted(0).value == 0
+        assert Username.trusted("abc").value == "abc"
+
+    def test_referral_count(self):
+        assert ReferralCount.trusted(5) == ReferralCount(5)
+
+
+class TestInterning:
+    @pytest.fixture(autouse=True)
+    def _seed_languages(self):
+        LanguageCode.seed("en", "ru")
+
+    def test_language_code_is_shared(self):
+        assert LanguageCode("en") is LanguageCode("en")
+        assert LanguageCode.trusted("ru") is LanguageCode("ru")
+
+    def test_unseeded_language_code_is_not_shared(self):
+        assert LanguageCode("xx") is not LanguageCode("xx")
+        assert "xx" not in LanguageCode._interned
+
+    def test_language_code_still_validates(self):
+        with pytest.raises(ValueError):
+            LanguageCode("e")
+
+    def test_small_referral_counts_are_shared(self):
+        assert ReferralCount(3) is ReferralCount(3)
+        assert ReferralCount.trusted(3) is ReferralCount(3)
+
+    def test_equal_value_of_another_type_is_validated(self):
+        ReferralCount(1)
+
+        with pytest.raises(TypeError, match="must be an int"):
+            ReferralCount(1.0)
+        with pytest.raises(TypeError, match="must be an int"):
+            ReferralCount([1])
+
+    def test_bool_does_not_resolve_to_shared_int(self):
+        shared = ReferralCount(1)
+
+        assert ReferralCount(True).value is True
+        assert ReferralCount(1) is shared
+
+    def test_large_referral_counts_are_not_shared(self):
+        assert ReferralCount(10_000) is not ReferralCount(10_000)
+        assert ReferralCount(10_000) == ReferralCount(10_000)
+
+    def test_copies_resolve_to_shared_instance(self):
+        code = LanguageCode("en")
+
+        assert copy.copy(code) is code
+        assert copy.deepcopy(code) is code
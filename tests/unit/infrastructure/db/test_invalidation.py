@@ -0,0 +1,172 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import asyncpg
+import pytest
+
+from src.infrastructure.config import PostgresConfig
+from src.infrastructure.db.invalidation import (
+    MAX_PAYLOAD_BYTES,
+    UserInvalidationListener,
+    UserInvalidationPublisher,
+    decode_payload,
+    encode_payloads,
+    mark_user_changed,
+)
+from src.infrastructure.db.transaction import TransactionManagerImpl
+
+
+@pytest.fixture
+def session() -> MagicMock:
+    session = MagicMock()
+    session.info = {}
+    session.execute = AsyncMock()
+    session.commit = AsyncMock()
+    session.rollback = AsyncMock()
+    return session
+
+
+class TestPayloads:
+    def test_round_trip(self):
+        [payload] = encode_payloads("abc", [3, 1, 3, 2])
+
+        assert decode_payload(payload) == ("abc", [1, 2, 3])
+
+    def test_large_batches_are_split_under_limit(self):
+        user_ids = range(10**12, 10**12 + 2000)
+
+        payloads = encode_payloads("abc", user_ids)
+
+        assert len(payloads) > 1
+        assert all(len(p.encode()) <= MAX_PAYLOAD_BYTES for p in payloads)
+        decoded = [i for p in payloads for i in decode_payload(p)[1]]
+        assert decoded == list(user_ids)
+
+
+class TestTransactionManagerPublishing:
+    async def test_commit_publishes_changed_users_once(self, session):
+        publisher = UserInvalidationPublisher("user_invalidation")
+        manager = TransactionManagerImpl(session, publisher)
+        mark_user_changed(session, 1)
+        mark_user_changed(session, 1)
+        mark_user_changed(session, 2)
+
+        await manager.commit()
+
+        session.execute.assert_awaited_once()
+        session.commit.assert_awaited_once()
+        assert session.info == {}
+
+    async def test_commit_without_changes_sends_nothing(self, session):
+        manager = TransactionManagerImpl(
+            session, UserInvalidationPublisher("user_invalidation")
+        )
+
+        await manager.commit()
+
+        session.execute.assert_not_called()
+
+    async def test_rollback_drops_changes(self, session):
+        manager = TransactionManagerImpl(
+            session, UserInvalidationPublisher("user_invalidation")
+        )
+        mark_user_changed(session, 1)
+
+        await manager.rollback()
+        await manager.commit()
+
+        session.execute.assert_not_called()
+
+
+class TestUserInvalidationListener:
+    @pytest.fixture
+    def cache(self) -> Mock:
+        return Mock()
+
+    @pytest.fixture
+    def leaderboard(self) -> Mock:
+        return Mock()
+
+    @pytest.fixture
+    def listener(self, cache, leaderboard) -> UserInvalidationListener:
+        postgres = PostgresConfig(
+            host="localhost", port=5432, user="u", password="p", db="d"
+        )
+        return UserInvalidationListener(
+            postgres, cache, "user_invalidation", "me", leaderboard
+        )
+
+    def test_invalidates_users_changed_elsewhere(self, listener, cache):
+        [payload] = encode_payloads("other", [1, 2])
+
+        listener.handle(payload)
+
+        assert [c.args[0] for c in cache.invalidate.call_args_list] == [1, 2]
+
+    def test_changes_elsewhere_invalidate_leaderboard(self, listener, leaderboard):
+        [own] = encode_payloads("me", [1])
+        listener.handle(own)
+        leaderboard.invalidate.assert_not_called()
+
+        [payload] = encode_payloads("other", [1])
+        listener.handle(payload)
+        leaderboard.invalidate.assert_called_once()
+
+    def test_skips_own_messages(self, listener, cache):
+        [payload] = encode_payloads("me", [1])
+
+        listener.handle(payload)
+
+        cache.invalidate.assert_not_called()
+
+    def test_malformed_payload_is_ignored(self, listener, cache):
+        listener._on_notification(Mock(), 1, "user_invalidation", "other|x")
+
+        cache.invalidate.assert_not_called()
+
+    async def test_recovers_from_non_postgres_errors(self, listener, cache):
+        listener.reconnect_delay = 0
+        connected = asyncio.Event()
+        listens = 0
+
+        async def listen() -> None:
+            nonlocal listens
+            listens += 1
+            if listens == 1:
+                raise asyncpg.exceptions.ConnectionDoesNotExistError("dropped")
+            if listens == 2:
+                raise RuntimeError("unexpected")
+            connected.set()
+            await asyncio.Event().wait()
+
+        listener._listen = listen
+        listener.start()
+        await asyncio.wait_for(connected.wait(), 1)
+        await listener.stop()
+
+        assert listens == 3
+
+    async def test_failing_handler_reconnects_and_clears_cache(self, listener, cache):
+        listener.reconnect_delay = 0
+        cache.invalidate.side_effect = RuntimeError("cache is broken")
+        callbacks: asyncio.Queue = asyncio.Queue()
+
+        async def connect(**_kwargs) -> Mock:
+            connection = Mock(close=AsyncMock())
+
+            async def add_listener(_channel, callback) -> None:
+                callbacks.put_nowait(callback)
+
+            connection.add_listener = add_listener
+            return connection
+
+        [payload] = encode_payloads("other", [1])
+        with patch.object(asyncpg, "connect", side_effect=connect):
+            listener.start()
+            callback = await asyncio.wait_for(callbacks.get(), 1)
+            callback(Mock(), 1, "user_invalidation", payload)
+            # Listening again on a new connection.
+            await asyncio.wait_for(callbacks.get(), 1)
+            await listener.stop()
+
+        assert cache.clear.call_count == 2
@@ -0,0 +1,84 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.infrastructure.config import UserLoaderConfig
+from src.infrastructure.db.loader import MAX_USER_ID, UserLoader
+
+
+def make_loader(**kwargs: float) -> UserLoader:
+    loader = UserLoader(MagicMock(), UserLoaderConfig(**kwargs))
+    loader._fetch = AsyncMock(
+        side_effect=lambda ids: {i: f"user{i}" for i in ids if i < 100}
+    )
+    return loader
+
+
+class TestUserLoader:
+    async def test_concurrent_loads_share_one_query(self):
+        loader = make_loader(window_ms=0)
+
+        users = await asyncio.gather(*(loader.load(i) for i in (1, 2, 3)))
+
+        loader._fetch.assert_awaited_once_with([1, 2, 3])
+        assert users == ["user1", "user2", "user3"]
+
+    async def test_duplicate_ids_are_fetched_once(self):
+        loader = make_loader()
+
+        first, second = await asyncio.gather(loader.load(1), loader.load(1))
+
+        loader._fetch.assert_awaited_once_with([1])
+        assert first is second
+
+    async def test_missing_user_resolves_to_none(self):
+        loader = make_loader()
+
+        assert await loader.load(100) is None
+
+    async def test_out_of_range_id_does_not_fail_the_batch(self):
+        loader = make_loader(window_ms=0)
+
+        users = await asyncio.gather(loader.load(1), loader.load(MAX_USER_ID + 1))
+
+        loader._fetch.assert_awaited_once_with([1])
+        assert users == ["user1", None]
+
+    async def test_full_batch_is_sent_immediately(self):
+        loader = make_loader(window_ms=60_000, max_batch_size=2)
+
+        await asyncio.wait_for(
+            asyncio.gather(loader.load(1), loader.load(2)), timeout=1
+        )
+
+        loader._fetch.assert_awaited_once_with([1, 2])
+
+    async def test_failure_is_raised_to_every_caller(self):
+        loader = make_loader()
+        loader._fetch.side_effect = RuntimeError("db is down")
+
+        results = await asyncio.gather(
+            loader.load(1), loader.load(2), return_exceptions=True
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    async def test_batch_sizes_are_bucketed(self):
+        loader = make_loader(window_ms=0)
+
+        await asyncio.gather(*(loader.load(i) for i in range(3)))
+        await loader.load(1)
+
+        assert loader.stats.loads == 4
+        assert loader.stats.batches == 2
+        assert loader.stats.largest_batch == 3
+        assert loader.stats.batch_sizes == {4: 1, 1: 1}
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{"window_ms": -1}, {"max_batch_size": 0}], ids=["window", "batch"]
+)
+def test_loader_config_rejects_invalid(kwargs):
+    with pytest.raises(ValueError, match=r"negative|positive"):
+        UserLoaderConfig(**kwargs)
@@ -0,0 +1,50 @@
+import pytest
+
+from src.infrastructure.db.models.counter import (
+    REFERRED_USERS_COUNTER,
+    TOTAL_USERS_COUNTER,
+)
+from src.infrastructure.db.repos.user import (
+    counters_to_stats,
+    estimate_referral_stats,
+)
+
+
+class TestEstimateReferralStats:
+    def test_builds_estimate_from_planner_statistics(self):
+        stats = estimate_referral_stats((10_000.0, 0.75))
+
+        assert stats is not None
+        assert stats.is_estimate is True
+        assert stats.total_users == 10_000
+        assert stats.referred_count == 2_500
+        assert stats.organic_count == 7_500
+
+    @pytest.mark.parametrize(
+        "row",
+        [
+            None,
+            # reltuples is -1 until the table is vacuumed or analyzed.
+            (-1.0, 0.5),
+            # No pg_stats row for referred_by yet.
+            (100.0, None),
+        ],
+    )
+    def test_returns_none_without_statistics(self, row):
+        assert estimate_referral_stats(row) is None
+
+
+class TestCountersToStats:
+    def test_builds_exact_stats(self):
+        stats = counters_to_stats({TOTAL_USERS_COUNTER: 10, REFERRED_USERS_COUNTER: 4})
+
+        assert stats.is_estimate is False
+        assert stats.total_users == 10
+        assert stats.referred_count == 4
+        assert stats.organic_count == 6
+
+    def test_missing_counters_are_zero(self):
+        stats = counters_to_stats({})
+
+        assert stats.total_users == 0
+        assert stats.organic_count == 0
@@ -0,0 +1,41 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.infrastructure.db.repos.base import BaseSQLAlchemyRepo
+from src.infrastructure.db.transaction import TransactionManagerImpl
+
+
+@pytest.fixture
+def session() -> MagicMock:
+    session = MagicMock()
+    session.info = {}
+    session.reset = AsyncMock()
+    session.commit = AsyncMock()
+    session.rollback = AsyncMock()
+    return session
+
+
+class TestReleaseIfIdle:
+    async def test_read_only_transaction_is_released(self, session):
+        await BaseSQLAlchemyRepo(session)._release_if_idle()
+
+        session.reset.assert_awaited_once()
+
+    async def test_write_transaction_keeps_connection(self, session):
+        repo = BaseSQLAlchemyRepo(session)
+        repo._mark_write()
+
+        await repo._release_if_idle()
+
+        session.reset.assert_not_called()
+
+    @pytest.mark.parametrize("method", ["commit", "rollback"])
+    async def test_transaction_end_clears_pending_writes(self, session, method):
+        repo = BaseSQLAlchemyRepo(session)
+        repo._mark_write()
+
+        await getattr(TransactionManagerImpl(session), method)()
+        await repo._release_if_idle()
+
+        session.reset.assert_awaited_once()
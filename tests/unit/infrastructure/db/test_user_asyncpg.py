@@ -0,0 +1,36 @@
+from datetime import UTC, datetime
+
+from src.domain.user.vo import LanguageCode, ReferralCount, UserId, Username
+from src.infrastructure.db.repos.user_asyncpg import record_to_user
+
+
+class TestRecordToUser:
+    def test_maps_all_columns(self):
+        now = datetime.now(UTC)
+
+        user = record_to_user(
+            (1, "John", "Doe", "johndoe", "bio", now, now, now, 2, 3, "ru")
+        )
+
+        assert user.id == UserId(1)
+        assert user.first_name.value == "John"
+        assert user.last_name.value == "Doe"
+        assert user.username == Username("johndoe")
+        assert user.bio.value == "bio"
+        assert user.referred_by == UserId(2)
+        assert user.referral_count == ReferralCount(3)
+        assert user.language_code == LanguageCode("ru")
+        assert user.is_new
+
+    def test_maps_nullable_columns_to_none(self):
+        now = datetime.now(UTC)
+
+        user = record_to_user(
+            (1, "John", None, None, None, now, now, now, None, 0, None)
+        )
+
+        assert user.last_name is None
+        assert user.username is None
+        assert user.bio is None
+        assert user.referred_by is None
+        assert user.language_code is None
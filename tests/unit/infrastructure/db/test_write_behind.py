@@ -0,0 +1,111 @@
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.infrastructure.config import WriteBehindConfig
+from src.infrastructure.db.write_behind import LastSeenWriteBehind
+
+
+@pytest.fixture
+def session() -> MagicMock:
+    session = MagicMock()
+    session.commit = AsyncMock()
+    return session
+
+
+@pytest.fixture
+def session_maker(session: MagicMock) -> MagicMock:
+    maker = MagicMock()
+    maker.return_value.__aenter__ = AsyncMock(return_value=session)
+    maker.return_value.__aexit__ = AsyncMock(return_value=None)
+    return maker
+
+
+@pytest.fixture
+def repository() -> MagicMock:
+    repository = MagicMock()
+    repository.update_last_seen = AsyncMock()
+    with patch(
+        "src.infrastructure.db.write_behind.UserRepositoryImpl",
+        return_value=repository,
+    ):
+        yield repository
+
+
+def make_buffer(session_maker: MagicMock, **kwargs: int) -> LastSeenWriteBehind:
+    config = WriteBehindConfig(
+        flush_interval_ms=kwargs.pop("flush_interval_ms", 60_000),
+        flush_batch_size=kwargs.pop("flush_batch_size", 2),
+        max_pending=kwargs.pop("max_pending", 3),
+    )
+    return LastSeenWriteBehind(session_maker, config)
+
+
+class TestLastSeenWriteBehind:
+    async def test_flush_writes_pending_as_one_batch(
+        self, session_maker, session, repository
+    ):
+        buffer = make_buffer(session_maker)
+        seen_at = datetime.now(UTC)
+        buffer.record_seen(1, seen_at)
+        buffer.record_seen(2, seen_at)
+
+        await buffer.flush()
+
+        repository.update_last_seen.assert_awaited_once_with({1: seen_at, 2: seen_at})
+        session.commit.assert_awaited_once()
+        assert buffer.stats.pending == 0
+        assert buffer.stats.flushed == 2
+
+    async def test_repeated_events_are_coalesced(self, session_maker, repository):
+        buffer = make_buffer(session_maker)
+        first = datetime(2024, 1, 1, tzinfo=UTC)
+        second = datetime(2024, 1, 2, tzinfo=UTC)
+        buffer.record_seen(1, first)
+        buffer.record_seen(1, second)
+
+        await buffer.flush()
+
+        repository.update_last_seen.assert_awaited_once_with({1: second})
+
+    async def test_full_buffer_rejects_new_users(self, session_maker, repository):
+        buffer = make_buffer(session_maker, max_pending=2)
+        now = datetime.now(UTC)
+
+        assert buffer.record_seen(1, now) is True
+        assert buffer.record_seen(2, now) is True
+        assert buffer.record_seen(3, now) is False
+        # Users already pending can still be refreshed.
+        assert buffer.record_seen(1, now) is True
+        assert buffer.stats.rejected == 1
+
+    async def test_failed_flush_requeues_batch(self, session_maker, repository):
+        buffer = make_buffer(session_maker)
+        repository.update_last_seen.side_effect = RuntimeError("db is down")
+        buffer.record_seen(1, datetime.now(UTC))
+
+        await buffer.flush()
+
+        assert buffer.stats.pending == 1
+        assert buffer.stats.flush_failures == 1
+
+    async def test_stop_flushes_pending(self, session_maker, repository):
+        buffer = make_buffer(session_maker)
+        buffer.start()
+        buffer.record_seen(1, datetime.now(UTC))
+
+        await buffer.stop()
+
+        repository.update_last_seen.assert_awaited_once()
+        assert buffer.stats.pending == 0
+
+    async def test_lag_reflects_oldest_pending_event(self, session_maker, repository):
+        buffer = make_buffer(session_maker)
+        assert buffer.stats.lag_seconds == 0.0
+
+        buffer.record_seen(1, datetime.now(UTC))
+
+        assert buffer.stats.lag_seconds >= 0.0
+        await buffer.flush()
+        assert buffer.stats.lag_seconds == 0.0
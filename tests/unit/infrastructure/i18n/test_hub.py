@@ -1,5 +1,6 @@
 from pathlib import Path
 
+from src.domain.user.vo import LanguageCode
 from src.infrastructure.i18n.hub import (
     DEFAULT_LANGUAGE,
     SUPPORTED_LANGUAGES,
@@ -24,6 +25,10 @@ class TestTranslatorHub:
         assert "en" in SUPPORTED_LANGUAGES
         assert "ru" in SUPPORTED_LANGUAGES
 
+    def test_supported_languages_are_interned(self) -> None:
+        for lang in SUPPORTED_LANGUAGES:
+            assert LanguageCode(lang) is LanguageCode(lang)
+
     def test_translator_returns_translated_string(self) -> None:
         locales_dir = Path(__file__).parent.parent.parent.parent.parent / "locales"
         hub = create_translator_hub(locales_dir)
@@ -0,0 +1,68 @@
+from unittest.mock import patch
+
+from src.application.user.dtos import CreateUserOutputDTO
+from src.infrastructure.cache import InMemoryUserCache
+from src.infrastructure.config import UserCacheConfig
+
+
+def make_user(user_id: int) -> CreateUserOutputDTO:
+    return CreateUserOutputDTO(
+        id=user_id, username=None, first_name="John", last_name=None
+    )
+
+
+class TestInMemoryUserCache:
+    def test_get_returns_cached_user(self):
+        cache = InMemoryUserCache(UserCacheConfig())
+        user = make_user(1)
+        cache.set(user)
+
+        assert cache.get(1) is user
+        assert cache.stats.hits == 1
+
+    def test_miss_is_counted(self):
+        cache = InMemoryUserCache(UserCacheConfig())
+
+        assert cache.get(1) is None
+        assert cache.stats.misses == 1
+
+    def test_expired_entry_is_dropped(self):
+        cache = InMemoryUserCache(UserCacheConfig(ttl_seconds=10))
+        with patch("src.infrastructure.cache.time.monotonic", return_value=100.0):
+            cache.set(make_user(1))
+
+        with patch("src.infrastructure.cache.time.monotonic", return_value=111.0):
+            assert cache.get(1) is None
+
+        assert cache.stats.expirations == 1
+        assert cache.stats.size == 0
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = InMemoryUserCache(UserCacheConfig(max_size=2))
+        cache.set(make_user(1))
+        cache.set(make_user(2))
+        cache.get(1)  # 1 becomes most recently used
+        cache.set(make_user(3))
+
+        assert cache.get(1) is not None
+        assert cache.get(2) is None
+        assert cache.get(3) is not None
+        assert cache.stats.evictions == 1
+
+    def test_invalidate_removes_entry(self):
+        cache = InMemoryUserCache(UserCacheConfig())
+        cache.set(make_user(1))
+
+        cache.invalidate(1)
+        cache.invalidate(2)  # unknown ids are ignored
+
+        assert cache.get(1) is None
+
+    def test_clear_removes_all_entries(self):
+        cache = InMemoryUserCache(UserCacheConfig())
+        cache.set(make_user(1))
+        cache.set(make_user(2))
+
+        cache.clear()
+
+        assert cache.stats.size == 0
@@ -9,10 +9,15 @@ from pydantic import ValidationError
 from src.infrastructure.config import (
     AuthConfig,
     Config,
+    LeaderboardConfig,
     PostgresConfig,
+    ReferralRollupsConfig,
     SentryConfig,
     TelegramConfig,
+    UserCacheConfig,
+    UsersConfig,
     WebhookConfig,
+    WriteBehindConfig,
     load_config,
 )
 
@@ -41,6 +46,24 @@ class TestPostgresConfig:
 
         assert config.echo is False
 
+    def test_user_repository_defaults_to_orm(self):
+        config = PostgresConfig(
+            host="localhost", port=5432, user="user", password="pass", db="db"
+        )
+
+        assert config.user_repository == "orm"
+
+    def test_user_repository_rejects_unknown(self):
+        with pytest.raises(ValidationError):
+            PostgresConfig(
+                host="localhost",
+                port=5432,
+                user="user",
+                password="pass",
+                db="db",
+                user_repository="psycopg",
+            )
+
     def test_echo_explicit_value(self):
         config = PostgresConfig(
             host="localhost",
@@ -468,6 +491,90 @@ class TestSentryConfig:
             SentryConfig()
 
 
+class TestUsersConfig:
+    def test_write_behind_disabled_by_default(self):
+        assert UsersConfig().write_behind is None
+
+    def test_last_seen_granularity_default(self):
+        assert UsersConfig().last_seen_granularity_seconds == 60
+
+    def test_last_seen_granularity_cannot_be_negative(self):
+        with pytest.raises(ValidationError):
+            UsersConfig(last_seen_granularity_seconds=-1)
+
+    def test_write_behind_defaults(self):
+        config = WriteBehindConfig()
+
+        assert config.flush_interval_ms == 1000
+        assert config.flush_batch_size == 500
+        assert config.max_pending == 10_000
+
+    @pytest.mark.parametrize(
+        "field", ["flush_interval_ms", "flush_batch_size", "max_pending"]
+    )
+    def test_write_behind_rejects_non_positive(self, field):
+        with pytest.raises(ValidationError):
+            WriteBehindConfig(**{field: 0})
+
+    def test_cache_disabled_by_default(self):
+        assert UsersConfig().cache is None
+
+    def test_stats_exact_by_default(self):
+        assert UsersConfig().estimate_stats is False
+
+    def test_leaderboard_disabled_by_default(self):
+        assert UsersConfig().leaderboard is None
+
+    @pytest.mark.parametrize("field", ["size", "refresh_seconds"])
+    def test_leaderboard_rejects_non_positive(self, field):
+        with pytest.raises(ValidationError):
+            LeaderboardConfig(**{field: 0})
+
+    def test_referral_rollups_enabled_by_default(self):
+        config = UsersConfig().referral_rollups
+
+        assert config is not None
+        assert config.refresh_interval_seconds == 60
+        assert config.batch_size == 10_000
+
+    def test_referral_counts_immediate_by_default(self):
+        assert UsersConfig().defer_referral_counts is False
+
+    @pytest.mark.parametrize("field", ["refresh_interval_seconds", "batch_size"])
+    def test_referral_rollups_rejects_non_positive(self, field):
+        with pytest.raises(ValidationError):
+            ReferralRollupsConfig(**{field: 0})
+
+    @pytest.mark.parametrize("field", ["max_size", "ttl_seconds"])
+    def test_cache_rejects_non_positive(self, field):
+        with pytest.raises(ValidationError):
+            UserCacheConfig(**{field: 0})
+
+    @pytest.mark.parametrize("channel", ["user_invalidation", "_c1"])
+    def test_invalidation_channel_accepts_identifiers(self, channel):
+        assert UserCacheConfig(invalidation_channel=channel).invalidation_channel
+
+    @pytest.mark.parametrize("channel", ["", "1abc", "user-cache", "Users"])
+    def test_invalidation_channel_rejects_invalid(self, channel):
+        with pytest.raises(ValidationError):
+            UserCacheConfig(invalidation_channel=channel)
+
+    def test_write_behind_requires_cache(self):
+        with pytest.raises(ValidationError):
+            UsersConfig(write_behind=WriteBehindConfig())
+
+    def test_deferred_referral_counts_require_rollups(self):
+        with pytest.raises(ValidationError, match="referral_rollups"):
+            UsersConfig(defer_referral_counts=True, referral_rollups=None)
+
+        config = UsersConfig(cache=UserCacheConfig(), write_behind=WriteBehindConfig())
+        assert config.write_behind is not None
+
+    def test_batch_size_must_fit_buffer(self):
+        with pytest.raises(ValidationError):
+            WriteBehindConfig(flush_batch_size=100, max_pending=10)
+
+
 class TestConfig:
     def test_valid_config(self):
         postgres_config = PostgresConfig(
@@ -0,0 +1,116 @@
+from unittest.mock import patch
+
+from src.domain.user.repository import TopReferrer, TopReferrerCursor
+from src.infrastructure.config import LeaderboardConfig
+from src.infrastructure.leaderboard import InMemoryReferralLeaderboard
+
+
+def make_referrer(user_id: int, count: int) -> TopReferrer:
+    return TopReferrer(
+        user_id=user_id, username=None, first_name="U", referral_count=count
+    )
+
+
+def seeded(size: int, *top: TopReferrer) -> InMemoryReferralLeaderboard:
+    leaderboard = InMemoryReferralLeaderboard(LeaderboardConfig(size=size))
+    leaderboard.reset(list(top), leaderboard.version)
+    return leaderboard
+
+
+def ids(page: list[TopReferrer] | None) -> list[int] | None:
+    return None if page is None else [r.user_id for r in page]
+
+
+class TestInMemoryReferralLeaderboard:
+    def test_unseeded_board_is_stale(self):
+        leaderboard = InMemoryReferralLeaderboard(LeaderboardConfig())
+
+        assert leaderboard.stale
+        assert leaderboard.page(10) is None
+
+    def test_pages_in_count_then_id_order(self):
+        leaderboard = seeded(
+            3, make_referrer(1, 5), make_referrer(2, 9), make_referrer(3, 5)
+        )
+
+        assert ids(leaderboard.page(2)) == [2, 3]
+        assert ids(leaderboard.page(1, after=TopReferrerCursor(5, 3))) == [1]
+        assert ids(leaderboard.page(2, before=TopReferrerCursor(5, 1))) == [2, 3]
+
+    def test_page_past_capacity_falls_back(self):
+        leaderboard = seeded(2, make_referrer(1, 9), make_referrer(2, 5))
+
+        assert ids(leaderboard.page(2)) == [1, 2]
+        assert leaderboard.page(3) is None
+        assert leaderboard.page(1, after=TopReferrerCursor(5, 2)) is None
+        assert leaderboard.page(1, before=TopReferrerCursor(1, 50)) is None
+
+    def test_complete_board_serves_any_page(self):
+        leaderboard = seeded(10, make_referrer(1, 9), make_referrer(2, 5))
+
+        assert ids(leaderboard.page(11)) == [1, 2]
+        assert leaderboard.page(5, after=TopReferrerCursor(5, 2)) == []
+        assert ids(leaderboard.page(5, before=TopReferrerCursor(1, 50))) == [1, 2]
+
+    def test_increment_reorders_entries(self):
+        leaderboard = seeded(2, make_referrer(1, 9), make_referrer(2, 5))
+
+        leaderboard.record(make_referrer(2, 10))
+
+        assert ids(leaderboard.page(2)) == [2, 1]
+
+    def test_outsider_passing_last_entry_replaces_it(self):
+        leaderboard = seeded(2, make_referrer(1, 9), make_referrer(2, 5))
+
+        leaderboard.record(make_referrer(3, 5))
+        assert ids(leaderboard.page(2)) == [1, 3]
+
+        leaderboard.record(make_referrer(4, 4))
+        assert ids(leaderboard.page(2)) == [1, 3]
+        assert leaderboard.page(3) is None
+
+    def test_complete_board_becomes_partial_when_full(self):
+        leaderboard = seeded(2, make_referrer(1, 9))
+
+        leaderboard.record(make_referrer(2, 1))
+        assert ids(leaderboard.page(5)) == [1, 2]
+
+        leaderboard.record(make_referrer(3, 1))
+        assert ids(leaderboard.page(2)) == [1, 3]
+        assert leaderboard.page(3) is None
+
+    def test_out_of_order_updates_never_lower_a_count(self):
+        leaderboard = seeded(2, make_referrer(1, 9), make_referrer(2, 5))
+
+        leaderboard.record(make_referrer(2, 7))
+        leaderboard.record(make_referrer(2, 6))
+
+        assert leaderboard.page(2)[1].referral_count == 7
+
+    def test_invalidate_discards_board(self):
+        leaderboard = seeded(2, make_referrer(1, 9))
+
+        leaderboard.invalidate()
+
+        assert leaderboard.stale
+        assert leaderboard.page(1) is None
+
+    def test_update_during_reseed_discards_the_seed(self):
+        leaderboard = InMemoryReferralLeaderboard(LeaderboardConfig(size=2))
+        version = leaderboard.version
+
+        leaderboard.record(make_referrer(1, 3))
+        leaderboard.reset([make_referrer(1, 2)], version)
+
+        assert leaderboard.stale
+
+    def test_expires_after_refresh_interval(self):
+        leaderboard = InMemoryReferralLeaderboard(
+            LeaderboardConfig(size=2, refresh_seconds=10)
+        )
+        with patch("src.infrastructure.leaderboard.time.monotonic", return_value=100.0):
+            leaderboard.reset([make_referrer(1, 9)], leaderboard.version)
+            assert not leaderboard.stale
+
+        with patch("src.infrastructure.leaderboard.time.monotonic", return_value=110.0):
+            assert leaderboard.stale